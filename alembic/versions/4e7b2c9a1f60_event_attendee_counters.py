@@ -0,0 +1,45 @@
+"""event attendee counters
+
+Revision ID: 4e7b2c9a1f60
+Revises: 8c1f4a2d9b3e
+Create Date: 2026-10-18 10:03:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7b2c9a1f60'
+down_revision: Union[str, None] = '8c1f4a2d9b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column('attendees_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('events', sa.Column('speakers_count', sa.Integer(), server_default='0', nullable=False))
+
+    # backfill from existing registrations
+    op.execute("""
+        UPDATE events AS e
+        SET attendees_count = c.attendees,
+            speakers_count = c.speakers
+        FROM (
+            SELECT event_id,
+                   count(*) FILTER (WHERE event_role = 'ATTENDEE') AS attendees,
+                   count(*) FILTER (WHERE event_role = 'SPEAKER') AS speakers
+            FROM event_attendees
+            GROUP BY event_id
+        ) AS c
+        WHERE e.id = c.event_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('events', 'speakers_count')
+    op.drop_column('events', 'attendees_count')
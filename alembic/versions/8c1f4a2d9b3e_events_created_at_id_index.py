@@ -0,0 +1,28 @@
+"""events created_at id index
+
+Revision ID: 8c1f4a2d9b3e
+Revises: 39e60a45e0fb
+Create Date: 2026-10-18 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f4a2d9b3e'
+down_revision: Union[str, None] = '39e60a45e0fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_events_created_at_id', 'events', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_created_at_id', table_name='events')
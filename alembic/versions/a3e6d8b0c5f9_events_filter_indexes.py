@@ -0,0 +1,39 @@
+"""events filter indexes
+
+Revision ID: a3e6d8b0c5f9
+Revises: f7c3b1d9e2a4
+Create Date: 2026-10-18 16:37:45.902264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e6d8b0c5f9'
+down_revision: Union[str, None] = 'f7c3b1d9e2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_events_country_created_at_id', 'events', ['country', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_city_created_at_id', 'events', ['city', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_status_created_at_id', 'events', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_start_date_id', 'events', ['start_date', 'id'], unique=False)
+    op.create_index(
+        'ix_events_incoming_start_date_id', 'events', ['start_date', 'id'], unique=False,
+        postgresql_where=sa.text("status = 'INCOMING'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_incoming_start_date_id', table_name='events', postgresql_where=sa.text("status = 'INCOMING'"))
+    op.drop_index('ix_events_start_date_id', table_name='events')
+    op.drop_index('ix_events_status_created_at_id', table_name='events')
+    op.drop_index('ix_events_city_created_at_id', table_name='events')
+    op.drop_index('ix_events_country_created_at_id', table_name='events')
@@ -0,0 +1,62 @@
+"""event attendees indexes
+
+Revision ID: b5d0e8f3a7c2
+Revises: 4e7b2c9a1f60
+Create Date: 2026-10-18 11:26:50.031477
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d0e8f3a7c2'
+down_revision: Union[str, None] = '4e7b2c9a1f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # drop duplicate registrations left by the old racy SELECT-then-INSERT,
+    # keeping the strongest role (ORGANIZER > SPEAKER > ATTENDEE)
+    op.execute("""
+        DELETE FROM event_attendees
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id,
+                       row_number() OVER (PARTITION BY event_id, user_id ORDER BY event_role, id) AS rn
+                FROM event_attendees
+            ) AS ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+
+    # counters may have included the duplicates
+    op.execute("""
+        UPDATE events AS e
+        SET attendees_count = c.attendees,
+            speakers_count = c.speakers
+        FROM (
+            SELECT ev.id AS event_id,
+                   count(a.id) FILTER (WHERE a.event_role = 'ATTENDEE') AS attendees,
+                   count(a.id) FILTER (WHERE a.event_role = 'SPEAKER') AS speakers
+            FROM events AS ev
+            LEFT JOIN event_attendees AS a ON a.event_id = ev.id
+            GROUP BY ev.id
+        ) AS c
+        WHERE e.id = c.event_id
+    """)
+
+    op.create_unique_constraint('uq_event_attendees_event_id_user_id', 'event_attendees', ['event_id', 'user_id'])
+    op.create_index('ix_event_attendees_event_id_event_role', 'event_attendees', ['event_id', 'event_role'], unique=False)
+    op.create_index('ix_event_attendees_user_id_event_role', 'event_attendees', ['user_id', 'event_role'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_event_attendees_user_id_event_role', table_name='event_attendees')
+    op.drop_index('ix_event_attendees_event_id_event_role', table_name='event_attendees')
+    op.drop_constraint('uq_event_attendees_event_id_user_id', 'event_attendees', type_='unique')
@@ -0,0 +1,44 @@
+"""events search vector
+
+Revision ID: f7c3b1d9e2a4
+Revises: d2a9c4e6b8f1
+Create Date: 2026-10-18 15:08:22.419305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3b1d9e2a4'
+down_revision: Union[str, None] = 'd2a9c4e6b8f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('spanish'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('spanish'::regconfig, subtitle), 'B') || "
+    "setweight(to_tsvector('spanish'::regconfig, city), 'B') || "
+    "setweight(to_tsvector('spanish'::regconfig, description), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('events', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_events_search_vector', 'events', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_search_vector', table_name='events', postgresql_using='gin')
+    op.drop_column('events', 'search_vector')
@@ -0,0 +1,52 @@
+"""
+Export time and memory of events_service.export_attendees.
+
+Seeds one event per size in `--sizes`, drains the CSV and NDJSON streams
+in process and prints rows/s, output size and peak Python allocation.
+Peak allocation should stay flat as the event grows.
+
+    poetry run python -m benchmarks.attendee_export --sizes 10000 100000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from src.app.modules.events import events_service
+
+from .common import cleanup
+from .listing_projection import seed
+
+
+async def measure(event_id, n: int, fmt: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    size = 0
+    async for chunk in events_service.export_attendees(event_id, fmt):
+        size += len(chunk)
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{n:>8} rows  {fmt:<6} {elapsed:6.2f}s  {n / elapsed:9.0f} rows/s  "
+          f"{size / 1024 / 1024:7.2f} MiB out  peak alloc={peak / 1024 / 1024:6.2f} MiB")
+
+
+async def run(sizes):
+    for n in sizes:
+        user_ids, event_ids = await seed(n, 1)
+        try:
+            for fmt in ("csv", "ndjson"):
+                await measure(event_ids[0], n, fmt)
+        finally:
+            await cleanup(event_ids, user_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sizes))
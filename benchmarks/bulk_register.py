@@ -0,0 +1,64 @@
+"""
+Throughput of event_actions_service.bulk_register.
+
+Seeds `--rows` users and an empty event (capacity `--capacity`, defaults to
+the row count), bulk-registers all of them in one call (a tenth as speakers)
+and prints rows/s and the status breakdown. Removes the seeded rows after.
+
+    poetry run python -m benchmarks.bulk_register --rows 50000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+from types import SimpleNamespace
+
+from src.app.db.db import AsyncSessionLocal
+
+from src.app.modules.users.user_role_enum import RoleEnum
+from src.app.modules.event_actions import event_actions_service
+from src.app.modules.event_actions.event_actions_dto import BulkRegisterItemDto
+
+from .common import insert_users, insert_event, cleanup
+
+
+async def seed(n: int, capacity: int):
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"bulk-{run_id}-{i}@example.com" for i in range(n)]
+
+    async with AsyncSessionLocal() as db:
+        user_ids = await insert_users(db, emails, first_name="Bulk")
+        event_id = await insert_event(db, f"Bulk {run_id}", capacity)
+        await db.commit()
+
+    return event_id, list(zip(user_ids, emails))
+
+
+async def run(n: int, capacity: int):
+    event_id, users = await seed(n, capacity)
+    admin = SimpleNamespace(id=uuid.uuid4(), role=RoleEnum.ADMIN)
+    items = [
+        BulkRegisterItemDto(email=email, role="SPEAKER" if i % 10 == 0 else "ATTENDEE")
+        for i, (_, email) in enumerate(users)
+    ]
+
+    try:
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            res = await event_actions_service.bulk_register(event_id, items, admin, db)
+            elapsed = time.perf_counter() - start
+
+        print(f"rows:      {n} in {elapsed:.2f}s ({n / elapsed:.0f} rows/s)")
+        print(f"statuses:  {dict(Counter(r.status for r in res.results))}")
+    finally:
+        await cleanup([event_id], [uid for uid, _ in users])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--capacity", type=int, default=None)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.capacity or args.rows))
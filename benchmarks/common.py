@@ -0,0 +1,180 @@
+"""
+Helpers shared by the benchmark scripts: latency percentiles, a concurrent
+load driver, JSON result files, a walker over EXPLAIN plans, and throwaway
+users/events for scripts that seed their own rows (for a large standing dataset use `src.app.db.init_db`).
+"""
+import asyncio
+import json
+import subprocess
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from sqlalchemy import delete, insert
+
+from src.app.db.db import AsyncSessionLocal
+
+from src.app.modules.users.users_model import User
+from src.app.modules.events.events_model import Event
+
+CHUNK = 5000
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def latency_summary(latencies: Sequence[float]) -> dict:
+    """
+    p50/p95/p99/max/mean in milliseconds.
+    """
+    if not latencies:
+        return {}
+    return {
+        "p50": round(percentile(latencies, 50) * 1000, 3),
+        "p95": round(percentile(latencies, 95) * 1000, 3),
+        "p99": round(percentile(latencies, 99) * 1000, 3),
+        "max": round(max(latencies) * 1000, 3),
+        "mean": round(sum(latencies) / len(latencies) * 1000, 3),
+    }
+
+
+def format_latencies(latencies: Sequence[float]) -> str:
+    summary = latency_summary(latencies)
+    return f"p50={summary['p50']:8.1f} ms  p95={summary['p95']:8.1f} ms  p99={summary['p99']:8.1f} ms"
+
+
+async def run_load(
+    request: Callable[[int], Awaitable[int]],
+    concurrency: int,
+    total: Optional[int] = None,
+    duration: Optional[float] = None,
+) -> dict:
+    """
+    Calls `request(i)` (returning an HTTP status) from `concurrency` workers until `total`
+    calls were made or `duration` seconds passed. Returns throughput, statuses and latencies.
+    """
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    issued = 0
+    deadline = time.monotonic() + duration if duration else None
+
+    async def worker():
+        nonlocal issued
+        while (total is None or issued < total) and (deadline is None or time.monotonic() < deadline):
+            i = issued
+            issued += 1
+            start = time.perf_counter()
+            try:
+                status = await request(i)
+            except Exception as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            statuses[str(status)] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "statuses": dict(statuses),
+        "latency_ms": latency_summary(latencies),
+    }
+
+
+def print_result(name: str, result: dict) -> None:
+    latency = result["latency_ms"] or {"p50": 0, "p95": 0, "p99": 0}
+    print(f"{name:<10} {result['requests']:>7} req  {result['throughput_rps']:9.1f} req/s  "
+          f"p50={latency['p50']:8.1f} ms  p95={latency['p95']:8.1f} ms  p99={latency['p99']:8.1f} ms  "
+          f"statuses={result['statuses']}")
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_result(scenario: str, params: dict, result: dict, results_dir: Path = RESULTS_DIR) -> Path:
+    """
+    Writes one run to `results_dir/<scenario>-<UTC timestamp>.json`.
+    """
+    results_dir.mkdir(parents=True, exist_ok=True)
+    started = datetime.now(timezone.utc)
+    path = results_dir / f"{scenario}-{started:%Y%m%dT%H%M%SZ}.json"
+    path.write_text(json.dumps({
+        "scenario": scenario,
+        "recorded_at": started.isoformat(),
+        "git_revision": git_revision(),
+        "params": params,
+        **result,
+    }, indent=2))
+    return path
+
+
+def load_results(scenario: Optional[str] = None, results_dir: Path = RESULTS_DIR) -> List[dict]:
+    pattern = f"{scenario}-*.json" if scenario else "*.json"
+    return [json.loads(path.read_text()) for path in sorted(results_dir.glob(pattern))]
+
+
+def walk(plan: dict):
+    """
+    Yields every node of an EXPLAIN (FORMAT JSON) plan, parents before children.
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+async def insert_users(db, emails: Sequence[str], password: str = "-", first_name: str = "Bench") -> List[uuid.UUID]:
+    user_ids = [uuid.uuid4() for _ in emails]
+    for i in range(0, len(emails), CHUNK):
+        await db.execute(insert(User), [
+            {"id": uid, "email": email, "password": password, "first_name": first_name, "last_name": str(i + j)}
+            for j, (uid, email) in enumerate(zip(user_ids[i:i + CHUNK], emails[i:i + CHUNK]))
+        ])
+    return user_ids
+
+
+async def insert_event(db, title: str, capacity: int, **values) -> uuid.UUID:
+    now = datetime.now(timezone.utc)
+    event_id = values.pop("id", None) or uuid.uuid4()
+    await db.execute(insert(Event).values(
+        id=event_id,
+        title=title,
+        subtitle=values.pop("subtitle", "benchmark"),
+        description=values.pop("description", "benchmark"),
+        image="",
+        country="-",
+        city="-",
+        address="-",
+        start_date=now + timedelta(days=7),
+        end_date=now + timedelta(days=8),
+        attendees_capacity=capacity,
+        **values,
+    ))
+    return event_id
+
+
+async def cleanup(event_ids: Sequence[uuid.UUID] = (), user_ids: Sequence[uuid.UUID] = ()) -> None:
+    """
+    Deletes seeded events and users; registrations and waitlist entries go with them (ON DELETE CASCADE).
+    """
+    async with AsyncSessionLocal() as db:
+        if event_ids:
+            await db.execute(delete(Event).where(Event.id.in_(list(event_ids))))
+        user_ids = list(user_ids)
+        for i in range(0, len(user_ids), CHUNK):
+            await db.execute(delete(User).where(User.id.in_(user_ids[i:i + CHUNK])))
+        await db.commit()
@@ -0,0 +1,108 @@
+"""
+Request throughput with the old engine configuration vs the current defaults.
+
+Starts the API twice under uvicorn, only the engine environment differing:
+
+    old  DB_ECHO=true, pool 5 + 10 overflow, no pre-ping/recycle, 100 prepared statements
+    new  the Settings defaults (no echo, pool 10 + 10, pre-ping, recycle, 500 statements)
+
+and hits GET `--path` with `--concurrency` clients for `--duration` seconds each,
+printing requests/s and p50/p95/p99. The events cache is disabled for both runs
+so every request reaches the database.
+
+    poetry run python -m benchmarks.engine_config --concurrency 50 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from .common import format_latencies
+
+CONFIGS = {
+    "old": {
+        "DB_ECHO": "true",
+        "DB_POOL_SIZE": "5",
+        "DB_MAX_OVERFLOW": "10",
+        "DB_POOL_PRE_PING": "false",
+        "DB_POOL_RECYCLE_SECONDS": "-1",
+        "DB_PREPARED_STATEMENT_CACHE_SIZE": "100",
+        "DB_SLOW_QUERY_MS": "0",
+    },
+    "new": {},
+}
+
+
+async def wait_until_up(client: httpx.AsyncClient, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await client.get("/")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError("API did not start")
+
+
+async def load(base_url: str, path: str, concurrency: int, duration: float):
+    latencies = []
+    errors = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        await wait_until_up(client)
+        await client.get(path)  # warm up the pool and statement cache
+
+        deadline = time.monotonic() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return latencies, errors, elapsed
+
+
+def run_config(name: str, args) -> None:
+    env = {**os.environ, "EVENTS_CACHE_TTL_SECONDS": "0", **CONFIGS[name]}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,  # the old config echoes every statement here
+    )
+    try:
+        latencies, errors, elapsed = asyncio.run(
+            load(f"http://127.0.0.1:{args.port}", args.path, args.concurrency, args.duration)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{name:<4} {len(latencies) / elapsed:8.1f} req/s  errors={errors:<4} {format_latencies(latencies)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="/events/list?limit=20")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    for name in CONFIGS:
+        run_config(name, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Time to serve a `--events` row /events/list payload through FastAPI, in process
+(no database, no network):
+
+    before    validated EventBaseResponse per row, FastAPI's response_model
+              validate-and-encode pass, stdlib json (the previous list path)
+    after     event_base_dict rows returned as FastJSONResponse (orjson)
+    pydantic  the same dicts rendered by pydantic-core's to_json instead
+    cached    a hit of events_cache: the body was rendered once and is sent as is
+
+All paths must produce the same JSON; the script checks it before timing.
+
+    poetry run python -m benchmarks.json_response --events 5000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from src.app.core.cache import TTLCache
+from src.app.core.responses import FastJSONResponse
+from src.app.modules.common.pagination import page_metadata
+from src.app.modules.events import events_cache
+from src.app.modules.events.events_projection import EVENT_LIST_COLUMNS, event_base_dict
+from src.app.modules.events.events_responses import EventBaseResponse, ListEvenstResponse
+from src.app.modules.events.event_status_enum import EventStatusEnum
+
+PATHS = ("before", "after", "pydantic", "cached")
+Row = namedtuple("Row", [c.key for c in EVENT_LIST_COLUMNS])
+
+
+def fake_rows(n: int):
+    now = datetime.now(timezone.utc)
+    return [
+        Row(
+            id=uuid.uuid4(), title=f"Event {i}", subtitle="Meetup de python", image="https://picsum.photos/id/1/200",
+            country="Perú", city="Lima", address=f"Av. Siempre Viva {i}", start_date=now + timedelta(days=i % 365),
+            end_date=now + timedelta(days=i % 365, hours=3), website=None, attendees_capacity=100,
+            attendees_count=i % 100, speakers_count=2, status=EventStatusEnum.INCOMING, created_at=now - timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+def validated_response(row) -> EventBaseResponse:
+    return EventBaseResponse(
+        id=row.id, title=row.title, subtitle=row.subtitle, image=row.image, country=row.country, city=row.city,
+        address=row.address, start_date=row.start_date, end_date=row.end_date, website=row.website,
+        attendees_capacity=row.attendees_capacity, attendees=row.attendees_count, speakers=row.speakers_count,
+        created_at=row.created_at, status=row.status,
+    )
+
+
+def build_app(rows) -> FastAPI:
+    app = FastAPI()
+    cache = TTLCache(maxsize=1, ttl=3600)
+
+    def page() -> dict:
+        # what the list services return
+        return {
+            "events": [event_base_dict(r) for r in rows],
+            "metadata": page_metadata(None).model_dump(),
+        }
+
+    @app.get("/before", response_model=ListEvenstResponse, response_class=JSONResponse)
+    async def before():
+        return ListEvenstResponse(
+            events=[validated_response(r) for r in rows], metadata=page_metadata(None)
+        )
+
+    @app.get("/after", response_model=ListEvenstResponse)
+    async def after():
+        return FastJSONResponse(page())
+
+    @app.get("/pydantic", response_model=ListEvenstResponse)
+    async def pydantic():
+        return Response(to_json(page()), media_type="application/json")
+
+    @app.get("/cached", response_model=ListEvenstResponse)
+    async def cached(request: Request):
+        async def loader():
+            return page()
+
+        return events_cache.conditional_response(request, await events_cache.cached(cache, "page", loader))
+
+    return app
+
+
+async def run(n_events: int, repeat: int):
+    rows = fake_rows(n_events)
+    transport = httpx.ASGITransport(app=build_app(rows))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = {path: (await client.get(f"/{path}")).content for path in PATHS}
+        for path in PATHS[1:]:
+            if json.loads(bodies[path]) != json.loads(bodies["before"]):
+                raise SystemExit(f"{path} renders different JSON")
+
+        print(f"{n_events} events, {len(bodies['after']) / 1024:.0f} KiB")
+
+        for path in PATHS:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                response = await client.get(f"/{path}")
+                timings.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+            print(f"{path:<9} median={statistics.median(timings) * 1000:8.1f} ms   min={min(timings) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.events, args.repeat))
@@ -0,0 +1,115 @@
+"""
+Memory/latency of the /user-events/attending read path: hydrated ORM events
+with joinedload(Event.attendees) (previous implementation) versus the column
+projection in events_projection.
+
+Seeds one event with `--attendees` registrations plus a few smaller events
+that the benchmark user attends, runs both paths `--repeat` times against a
+local Postgres, prints the results and removes the seeded rows.
+
+    poetry run python -m benchmarks.listing_projection --attendees 50000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import joinedload
+
+from src.app.db.db import AsyncSessionLocal
+
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.event_attendees import event_attendees_service
+
+from .common import CHUNK, insert_users, insert_event, cleanup
+
+
+async def seed(n_attendees: int, n_events: int):
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"projection-{run_id}-{i}@example.com" for i in range(n_attendees)]
+
+    async with AsyncSessionLocal() as db:
+        user_ids = await insert_users(db, emails, first_name="Projection")
+        event_ids = [
+            await insert_event(
+                db, f"Projection {run_id} #{k}", n_attendees,
+                description="x" * 2000, attendees_count=n_attendees if k == 0 else 1,
+            )
+            for k in range(n_events)
+        ]
+
+        # the first event is the big one, the benchmark user (user_ids[0]) attends all of them
+        rows = [
+            {"id": uuid.uuid4(), "event_id": event_ids[0], "user_id": uid, "event_role": EventRoleEnum.ATTENDEE}
+            for uid in user_ids
+        ] + [
+            {"id": uuid.uuid4(), "event_id": eid, "user_id": user_ids[0], "event_role": EventRoleEnum.ATTENDEE}
+            for eid in event_ids[1:]
+        ]
+        for i in range(0, len(rows), CHUNK):
+            await db.execute(insert(EventAttendee), rows[i:i + CHUNK])
+
+        await db.commit()
+
+    return user_ids, event_ids
+
+
+async def hydrated_path(db, user_id):
+    result = await db.execute(
+        select(Event)
+        .join(EventAttendee)
+        .options(joinedload(Event.attendees))
+        .where(
+            EventAttendee.user_id == user_id,
+            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
+        )
+        .order_by(Event.created_at)
+        .limit(21)
+    )
+    return result.unique().scalars().all()
+
+
+async def projection_path(db, user_id):
+    return await event_attendees_service.list_attending_events(db, user_id)
+
+
+async def measure(name, fn, user_id, repeat):
+    timings = []
+    peak = 0
+
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            tracemalloc.start()
+            start = time.perf_counter()
+            await fn(db, user_id)
+            timings.append(time.perf_counter() - start)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    timings.sort()
+    print(f"{name:<12} median={timings[len(timings) // 2] * 1000:8.1f} ms   "
+          f"max={timings[-1] * 1000:8.1f} ms   peak alloc={peak / 1024 / 1024:7.2f} MiB")
+
+
+async def run(n_attendees: int, n_events: int, repeat: int):
+    user_ids, event_ids = await seed(n_attendees, n_events)
+
+    try:
+        await measure("hydrated", hydrated_path, user_ids[0], repeat)
+        await measure("projection", projection_path, user_ids[0], repeat)
+    finally:
+        await cleanup(event_ids, user_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attendees", type=int, default=50_000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.attendees, args.events, args.repeat))
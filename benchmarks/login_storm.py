@@ -0,0 +1,97 @@
+"""
+Latency of an unrelated endpoint while a login storm is in flight.
+
+Seeds one user, then fires `--logins` concurrent POST /auth/login requests
+at a running API while probing GET `--probe` every `--interval` seconds.
+Prints login outcomes and the probe's p50/p95/p99, which should stay close
+to its idle latency now that bcrypt runs off the event loop.
+
+    poetry run uvicorn src.app.main:app
+    poetry run python -m benchmarks.login_storm --logins 200
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+
+import httpx
+from sqlalchemy import delete, insert
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.core.security import hash_password
+from src.app.modules.users.users_model import User
+
+from .common import format_latencies
+
+PASSWORD = "storm-password"
+
+
+async def probe_latencies(client, path, interval, stop: asyncio.Event):
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(path)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+def report(name, latencies):
+    print(f"{name:<14} n={len(latencies):<5} {format_latencies(latencies)}")
+
+
+async def run(base_url: str, n_logins: int, probe: str, interval: float):
+    user_id = uuid.uuid4()
+    email = f"storm-{user_id.hex[:8]}@example.com"
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User).values(
+            id=user_id, email=email, password=hash_password(PASSWORD), first_name="Storm", last_name="User"
+        ))
+        await db.commit()
+
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=httpx.Limits(max_connections=n_logins + 10)) as client:
+            stop = asyncio.Event()
+            idle = await probe_latencies_for(client, probe, interval, seconds=2)
+
+            statuses = Counter()
+
+            async def login():
+                res = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+                statuses[res.status_code] += 1
+
+            prober = asyncio.create_task(probe_latencies(client, probe, interval, stop))
+            start = time.perf_counter()
+            await asyncio.gather(*(login() for _ in range(n_logins)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            busy = await prober
+
+        print(f"logins:        {n_logins} in {elapsed:.2f}s, statuses {dict(statuses)}")
+        report("probe idle", idle)
+        report("probe storm", busy)
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+
+
+async def probe_latencies_for(client, path, interval, seconds):
+    stop = asyncio.Event()
+    task = asyncio.create_task(probe_latencies(client, path, interval, stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    return await task
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probe", default="/")
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.base_url, args.logins, args.probe, args.interval))
@@ -0,0 +1,69 @@
+"""
+Per-request cost of the metrics middleware (core/metrics.MetricsMiddleware).
+
+Calls a trivial ASGI app directly, without a server or HTTP client, `--requests`
+times bare and wrapped in the middleware, and prints the added time per
+request. Also times one /metrics render with `--routes` route templates
+recorded. No database needed.
+
+    poetry run python -m benchmarks.metrics_overhead --requests 200000
+"""
+import argparse
+import asyncio
+import time
+
+from src.app.core import metrics
+
+
+class FakeRoute:
+    def __init__(self, path):
+        self.path = path
+
+
+def trivial_app(route):
+    async def app(scope, receive, send):
+        scope["route"] = route  # what FastAPI's router leaves behind
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+    return app
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def time_calls(app, n: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/events/retrieve/1", "headers": []}
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / n
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--routes", type=int, default=40)
+    args = parser.parse_args()
+
+    app = trivial_app(FakeRoute("/events/retrieve/{event_id}"))
+    bare = await time_calls(app, args.requests)
+    wrapped = await time_calls(metrics.MetricsMiddleware(app), args.requests)
+    print(f"bare       {bare * 1e6:7.2f} us/request")
+    print(f"middleware {wrapped * 1e6:7.2f} us/request  (+{(wrapped - bare) * 1e6:.2f} us)")
+
+    for i in range(args.routes):
+        await metrics.MetricsMiddleware(trivial_app(FakeRoute(f"/route/{i}")))(
+            {"type": "http", "method": "GET", "path": f"/route/{i}", "headers": []}, receive, send
+        )
+    start = time.perf_counter()
+    body = metrics.registry.render()
+    print(f"render     {(time.perf_counter() - start) * 1000:7.2f} ms for {args.routes + 1} routes, {len(body)} bytes")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+Connection pool checkouts per request, from db.pool_stats.
+
+Calls the app in-process (httpx ASGI transport, no server) `--requests` times
+per path and prints, for each path, checkouts per request and the mean time a
+connection stayed checked out. A request that never touches the database
+(rejected by a guard, served from a cache) should show 0 checkouts.
+
+    poetry run python -m benchmarks.pool_checkouts
+    poetry run python -m benchmarks.pool_checkouts --token "$ACCESS_TOKEN" \\
+        --paths /events/list /events/retrieve/<event id> /user-events/attending
+"""
+import argparse
+import asyncio
+
+import httpx
+
+from src.app.main import app
+from src.app.db.db import pool_stats
+
+
+async def measure(client: httpx.AsyncClient, path: str, n: int, headers: dict):
+    stats = pool_stats["primary"]
+    checkouts, held = stats.checkouts, stats.held_seconds
+    statuses = set()
+
+    for _ in range(n):
+        response = await client.get(path, headers=headers)
+        statuses.add(response.status_code)
+
+    checkouts = stats.checkouts - checkouts
+    held = stats.held_seconds - held
+    per_checkout = held / checkouts * 1000 if checkouts else 0.0
+    print(f"{path:<45} status={sorted(statuses)}  checkouts/request={checkouts / n:5.2f}  "
+          f"held/checkout={per_checkout:6.2f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", nargs="+", default=["/events/list", "/events/retrieve/00000000-0000-0000-0000-000000000000"])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--token", help="bearer token for authenticated routes")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in args.paths:
+            await measure(client, path, args.requests, headers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
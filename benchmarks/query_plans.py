@@ -0,0 +1,431 @@
+"""
+Query-plan regression check for the service queries.
+
+Runs each case below (the events, event_attendees, auth and users services and
+the /event-actions handlers) against a database seeded with
+`src.app.db.init_db`, inside a transaction that is rolled back afterwards.
+Each statement a case sends is run under EXPLAIN (ANALYZE, BUFFERS) just before
+it is sent. This happens in a savepoint that is rolled back, so the plan sees the
+rows the statement itself will see.
+
+Plans are stored per case and keyed by the statement's fingerprint: its SQL with
+parameters, literals and IN lists normalized. A case fails when
+
+    - a plan scans `events` or `event_attendees` sequentially,
+    - the statements it sends differ from the baseline: one was added, one is
+      no longer sent, or one is sent a different number of times, or
+    - a statement touches more shared buffers than in the baseline, by more than
+      `--buffer-tolerance` (relative) and `--min-blocks` (absolute).
+
+Plans whose scans or indexes changed are reported without failing. `--update`
+stores the current plans as the baseline (benchmarks/query_plans.json, taken on
+the dataset of the first command below). A baseline only holds for the dataset it
+was taken on: re-take it when the seed parameters change. Exits with status 1 on
+any failure.
+
+    poetry run python -m src.app.db.init_db --users 100000 --events 20000 --attendees-per-event 50
+    poetry run python -m benchmarks.query_plans --update
+    poetry run python -m benchmarks.query_plans
+    poetry run python -m benchmarks.query_plans --only event_actions
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.app.core.security import create_access_token, create_refresh_token
+from src.app.db.db import AsyncSessionLocal, engine
+from src.app.db.init_db import SEED_PASSWORD
+
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_waitlist_model import EventWaitlistEntry
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.events_dto import CreateEventDto, EventFiltersDto
+from src.app.modules.events.event_status_enum import EventStatusEnum
+from src.app.modules.events import events_service
+from src.app.modules.event_attendees import event_attendees_service
+from src.app.modules.event_actions.event_actions_dto import BulkRegisterItemDto
+from src.app.modules.event_actions.event_actions_router import router as event_actions_router
+from src.app.modules.auth import auth_svc
+from src.app.modules.auth.auth_dto import LoginDto, RegisterDto, RefreshDto, LogoutDto
+from src.app.modules.users import users_service
+from src.app.modules.users.users_model import User
+from src.app.modules.users.users_cache import REQUEST_USER_COLUMNS, RequestUser
+
+from .common import walk
+
+WATCHED_TABLES = {"events", "event_attendees"}
+BASELINE = Path(__file__).parent / "query_plans.json"
+
+NOW = datetime.now(timezone.utc)
+
+# /events/list filter combinations, on values the seed generates (tests/test_event_filter_plans.py
+# pins the index each one uses)
+EVENT_FILTERS = {
+    "no filters": EventFiltersDto(),
+    "country": EventFiltersDto(country="Perú"),
+    "city": EventFiltersDto(city="Lima"),
+    "country + city": EventFiltersDto(country="Perú", city="Lima"),
+    "status": EventFiltersDto(status=EventStatusEnum.COMPLETED),
+    "upcoming": EventFiltersDto(upcoming=True),
+    "upcoming + city": EventFiltersDto(upcoming=True, city="Lima"),
+    "start range": EventFiltersDto(start_after=NOW, start_before=NOW + timedelta(days=30)),
+    "start range + country": EventFiltersDto(country="Perú", start_after=NOW, start_before=NOW + timedelta(days=30)),
+}
+
+
+@dataclass
+class Context:
+    """
+    Seeded rows the cases run against: the newest event, its organizer,
+    one of its attendees and a seeded user not registered to it.
+    """
+    event_id: UUID
+    organizer: RequestUser
+    attendee: RequestUser
+    outsider: RequestUser
+    password: str
+
+
+async def load_context(prefix: str, password: str) -> Context:
+    async with AsyncSessionLocal() as db:
+        event_id = await db.scalar(select(Event.id).order_by(Event.created_at.desc(), Event.id.desc()).limit(1))
+        if event_id is None:
+            raise SystemExit("no events, run src.app.db.init_db --users N --events N first")
+
+        roles = dict((await db.execute(
+            select(EventAttendee.event_role, EventAttendee.user_id).where(EventAttendee.event_id == event_id)
+        )).all())
+        registered = select(EventAttendee.user_id).where(EventAttendee.event_id == event_id)
+        outsider_id = await db.scalar(
+            select(User.id).where(User.email.like(f"{prefix}-%"), User.id.not_in(registered)).limit(1)
+        )
+
+        if EventRoleEnum.ATTENDEE not in roles or outsider_id is None:
+            raise SystemExit("the newest event needs attendees and a seeded user outside it")
+
+        user_ids = [roles[EventRoleEnum.ORGANIZER], roles[EventRoleEnum.ATTENDEE], outsider_id]
+        rows = (await db.execute(select(*REQUEST_USER_COLUMNS).where(User.id.in_(user_ids)))).all()
+        users = {row.id: RequestUser(**row._mapping) for row in rows}
+
+    return Context(event_id, *(users[user_id] for user_id in user_ids), password=password)
+
+
+# ---- cases: (name, run(db, ctx), setup(conn, ctx) or None) ----
+
+def action(method: str, path: str) -> Callable:
+    """
+    The /event-actions handler for `path`, called directly with its dependencies.
+    """
+    for route in event_actions_router.routes:
+        if route.path == f"/event-actions/{{event_id}}{path}" and method in route.methods:
+            return route.endpoint
+    raise LookupError(f"{method} /event-actions/{{event_id}}{path}")
+
+
+async def fill_event(conn: AsyncConnection, ctx: Context):
+    await conn.execute(update(Event).where(Event.id == ctx.event_id).values(attendees_count=Event.attendees_capacity))
+
+
+async def waitlist_outsider(conn: AsyncConnection, ctx: Context):
+    await fill_event(conn, ctx)
+    # only upcoming events promote from their waitlist
+    await conn.execute(update(Event).where(Event.id == ctx.event_id).values(status=EventStatusEnum.INCOMING))
+    await conn.execute(insert(EventWaitlistEntry).values(id=uuid.uuid4(), event_id=ctx.event_id, user_id=ctx.outsider.id))
+
+
+async def list_two_pages(db: AsyncSession, ctx: Context):
+    first = await events_service.list_events(db)
+    if first["metadata"]["next_cursor"]:
+        await events_service.list_events(db, cursor=first["metadata"]["next_cursor"])
+
+
+async def export_all(db: AsyncSession, ctx: Context):
+    factory = async_sessionmaker(bind=db.bind, join_transaction_mode="create_savepoint")
+    async for _ in events_service.export_attendees(ctx.event_id, "csv", session_factory=factory):
+        pass
+
+
+def new_event_dto() -> CreateEventDto:
+    return CreateEventDto(
+        title="Query plans", subtitle="-", description="-", country="Perú", city="Lima", address="-",
+        start_date="01/01/2030", end_date="01/02/2030", attendees_capacity=100,
+    )
+
+
+async def logout(db: AsyncSession, ctx: Context):
+    sub = {"sub": str(ctx.outsider.id)}
+    await auth_svc.logout(create_access_token(sub), LogoutDto(refresh_token=create_refresh_token(sub)), db)
+
+
+Case = Tuple[str, Callable[[AsyncSession, Context], Awaitable], Optional[Callable[[AsyncConnection, Context], Awaitable]]]
+
+CASES: List[Case] = [
+    *(
+        (f"events.list_events[{label}]", lambda db, c, f=filters: events_service.list_events(db, filters=f), None)
+        for label, filters in EVENT_FILTERS.items()
+    ),
+    ("events.list_events[next page]", list_two_pages, None),
+    # seeded events number their titles: one match, found through the GIN index (a vocabulary word
+    # is in nearly every description, and scanning the table is the right plan for it)
+    ("events.search_events", lambda db, c: events_service.search_events(db, "1234"), None),
+    ("events.retrieve_by_id", lambda db, c: events_service.retrieve_by_id(c.event_id, db), None),
+    ("events.list_event_attendees", lambda db, c: events_service.list_event_attendees(c.event_id, db), None),
+    ("events.ensure_can_manage", lambda db, c: events_service.ensure_can_manage(c.event_id, c.organizer, db), None),
+    ("events.export_attendees", export_all, None),
+    ("events.create_event", lambda db, c: events_service.create_event(new_event_dto(), None, c.organizer, db), None),
+    ("events.delete", lambda db, c: events_service.delete(c.event_id, c.organizer, db), None),
+
+    ("event_attendees.list_attending_events",
+     lambda db, c: event_attendees_service.list_attending_events(db, c.attendee.id), None),
+    ("event_attendees.list_attending_ids",
+     lambda db, c: event_attendees_service.list_attending_ids(db, [str(c.event_id)], c.attendee), None),
+    ("event_attendees.list_created_events",
+     lambda db, c: event_attendees_service.list_created_events(db, c.organizer.id), None),
+
+    ("auth.login_user", lambda db, c: auth_svc.login_user(LoginDto(email=c.outsider.email, password=c.password), db), None),
+    ("auth.create_user", lambda db, c: auth_svc.create_user(RegisterDto(
+        email=f"plans-{uuid.uuid4().hex[:8]}@example.com", password="-", first_name="Plans", last_name="Check",
+    ), db), None),
+    ("auth.refresh_session", lambda db, c: auth_svc.refresh_session(
+        RefreshDto(refresh_token=create_refresh_token({"sub": str(c.outsider.id)})), db,
+    ), None),
+    ("auth.logout", logout, None),
+
+    ("users.list_users", lambda db, c: users_service.list_users(db), None),
+    ("users.retrieve_by_id", lambda db, c: users_service.retrieve_by_id(db, str(c.outsider.id)), None),
+
+    ("event_actions.register",
+     lambda db, c: action("POST", "/register")(event_id=c.event_id, user=c.outsider, db=db), None),
+    ("event_actions.register_as_speaker",
+     lambda db, c: action("POST", "/register-as-speaker")(event_id=c.event_id, user=c.outsider, db=db), None),
+    ("event_actions.bulk_register", lambda db, c: action("POST", "/bulk-register")(
+        event_id=c.event_id,
+        dto=[
+            BulkRegisterItemDto(email=c.outsider.email),
+            BulkRegisterItemDto(email=c.attendee.email, role="SPEAKER"),
+            BulkRegisterItemDto(email="nobody@example.com"),
+        ],
+        user=c.organizer,
+        db=db,
+    ), None),
+    ("event_actions.unregister",
+     lambda db, c: action("DELETE", "/unregister")(event_id=c.event_id, user=c.attendee, db=db), None),
+    ("event_actions.unregister[waitlist promotion]",
+     lambda db, c: action("DELETE", "/unregister")(event_id=c.event_id, user=c.attendee, db=db), waitlist_outsider),
+    ("event_actions.join_waitlist",
+     lambda db, c: action("POST", "/waitlist")(event_id=c.event_id, user=c.outsider, db=db), fill_event),
+    ("event_actions.leave_waitlist",
+     lambda db, c: action("DELETE", "/waitlist")(event_id=c.event_id, user=c.outsider, db=db), waitlist_outsider),
+    ("event_actions.waitlist_position",
+     lambda db, c: action("GET", "/waitlist/position")(event_id=c.event_id, user=c.outsider, db=db), waitlist_outsider),
+    ("event_actions.complete",
+     lambda db, c: action("POST", "/complete")(event_id=c.event_id, user=c.organizer, db=db), None),
+]
+
+
+# ---- capture and explain ----
+
+def explainable(statement: str) -> bool:
+    # a plain INSERT ... VALUES has nothing to scan
+    sql = statement.lstrip().upper()
+    if sql.startswith("INSERT"):
+        return "SELECT" in sql
+    return sql.startswith(("SELECT", "WITH", "UPDATE", "DELETE"))
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Key of a statement in the baseline: the same for every run of the same query,
+    whatever its parameters, literals or IN list lengths.
+    """
+    sql = " ".join(statement.split())
+    sql = re.sub(r"\$\d+(::[\w\[\]]+)?", "?", sql)
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+\b", "?", sql)
+    sql = re.sub(r"\(\?(?:, \?)*\)", "(...)", sql)
+    return hashlib.sha1(sql.encode()).hexdigest()[:12]
+
+
+def explain(conn, statement: str, parameters) -> dict:
+    """
+    EXPLAIN (ANALYZE, BUFFERS) of a statement about to be sent on `conn`, in a savepoint rolled back before it is.
+    """
+    cursor = conn.connection.cursor()
+    cursor.execute("SAVEPOINT query_plan")
+    try:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+        result = cursor.fetchone()[0]
+    except conn.dialect.loaded_dbapi.Error as e:
+        return {"statement": " ".join(statement.split()), "error": str(e)}
+    finally:
+        cursor.execute("ROLLBACK TO SAVEPOINT query_plan")
+        cursor.close()
+
+    # the engine decodes json columns itself
+    explained = (json.loads(result) if isinstance(result, str) else result)[0]
+    plan = explained["Plan"]
+    nodes = list(walk(plan))
+
+    return {
+        "statement": " ".join(statement.split()),
+        "scans": sorted({
+            f"{n['Node Type']} on {n['Relation Name']}" + (f" using {n['Index Name']}" if "Index Name" in n else "")
+            for n in nodes if "Relation Name" in n
+        }),
+        "seq_scans": sorted({
+            n["Relation Name"] for n in nodes
+            if n["Node Type"] == "Seq Scan" and n.get("Relation Name") in WATCHED_TABLES
+        }),
+        # counts of a node include its children's
+        "shared_blocks": plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0),
+        "execution_ms": round(explained.get("Execution Time", 0.0), 3),
+    }
+
+
+async def run_case(run, setup, ctx: Context) -> Tuple[Dict[str, dict], Optional[str]]:
+    """
+    Runs one case in a rolled-back transaction, explaining each statement as it is sent.
+    Returns the plans by fingerprint (the first of repeated statements, with how many times
+    it was sent) and the error code of the HTTPException the case raised, if any.
+    """
+    plans = {}
+    outcome = None
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not explainable(statement):
+            return
+
+        key = fingerprint(statement)
+        if key in plans:
+            plans[key]["calls"] += 1
+        else:
+            plans[key] = {**explain(conn, statement, parameters[0] if executemany else parameters), "calls": 1}
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            if setup is not None:
+                await setup(conn, ctx)
+
+            # commits in the services only release a savepoint of the outer transaction
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            event.listen(conn.sync_connection, "before_cursor_execute", capture)
+            try:
+                await run(db, ctx)
+            except HTTPException as e:
+                outcome = e.detail.get("code") if isinstance(e.detail, dict) else str(e.detail)
+            finally:
+                event.remove(conn.sync_connection, "before_cursor_execute", capture)
+                await db.close()
+        finally:
+            await transaction.rollback()
+
+    return plans, outcome
+
+
+def check(plan: dict, previous: Optional[dict], args) -> Tuple[List[str], List[str]]:
+    """
+    Failures and notes of a plan against its baseline.
+    """
+    if "error" in plan:
+        return [f"EXPLAIN failed: {plan['error']}"], []
+
+    failures, notes = [], []
+
+    if plan["seq_scans"]:
+        failures.append(f"seq scan on {', '.join(plan['seq_scans'])}")
+
+    if previous is None:
+        return failures, notes
+
+    if previous.get("calls") != plan["calls"]:
+        failures.append(f"sent {plan['calls']} times, was {previous.get('calls')}")
+
+    before, after = previous.get("shared_blocks", 0), plan["shared_blocks"]
+    if after - before >= args.min_blocks and after > before * (1 + args.buffer_tolerance):
+        failures.append(f"shared buffers {before} -> {after}")
+
+    if previous.get("scans") != plan["scans"]:
+        notes.append(f"plan changed, was: {'; '.join(previous.get('scans', [])) or '-'}")
+
+    return failures, notes
+
+
+async def main(args) -> int:
+    ctx = await load_context(args.prefix, args.password)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    current = {}
+    failed = 0
+
+    for name, run, setup in CASES:
+        if args.only and not any(part in name for part in args.only):
+            continue
+
+        try:
+            plans, outcome = await run_case(run, setup, ctx)
+        except Exception as e:
+            print(f"FAIL {name}: {type(e).__name__}: {e}")
+            failed += 1
+            continue
+
+        current[name] = plans
+        if outcome:
+            print(f"     {name} raised {outcome}")
+
+        previous = None if args.update else baseline.get(name)
+        if previous is None and not args.update:
+            print(f"FAIL {name}: no baseline, run with --update")
+            failed += 1
+
+        for key, plan in plans.items():
+            failures, notes = check(plan, previous.get(key) if previous else None, args)
+            if previous is not None and key not in previous:
+                failures.insert(0, f"new statement: {plan['statement']}")
+            failed += bool(failures)
+
+            scans = "; ".join(plan.get("scans", [])) or "-"
+            print(f"{'FAIL' if failures else 'ok  '} {name + ' ' + key:<60} {plan.get('shared_blocks', 0):>7} blocks "
+                  f"{plan.get('execution_ms', 0):>9.2f} ms  {scans}")
+            for line in failures + notes:
+                print(f"       {line}")
+
+        for key in (previous or {}).keys() - plans.keys():
+            print(f"FAIL {name + ' ' + key:<60} no longer sent: {previous[key]['statement']}")
+            failed += 1
+
+    if args.update:
+        # cases left out with --only keep their previous baseline
+        args.baseline.write_text(
+            json.dumps({**baseline, **current}, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+        )
+        print(f"baseline written to {args.baseline}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update", action="store_true", help="store the current plans as the baseline")
+    parser.add_argument("--only", nargs="*", help="run the cases whose name contains any of these")
+    parser.add_argument("--buffer-tolerance", type=float, default=0.5, help="relative growth of shared buffers allowed")
+    parser.add_argument("--min-blocks", type=int, default=100, help="growth in blocks below which nothing fails")
+    parser.add_argument("--prefix", default="seed", help="seeded users are <prefix>-<n>@example.com")
+    parser.add_argument("--password", default=SEED_PASSWORD)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,97 @@
+"""
+Flash-registration load test.
+
+Seeds `--users` users and one event with `--capacity` seats directly in the
+database, fires one POST /event-actions/{event_id}/register per user all at
+once, and then checks that the event was not oversold.
+
+Run the API first, against a local Postgres, then:
+
+    poetry run uvicorn src.app.main:app --workers 4
+    poetry run python -m benchmarks.registration_burst --users 1000 --capacity 500
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+
+import httpx
+from sqlalchemy import func, insert, select
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.core.security import hash_password, create_access_token
+
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+
+from .common import insert_users, insert_event, cleanup, format_latencies
+
+
+async def seed(n_users: int, capacity: int):
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"burst-{run_id}-{i}@example.com" for i in range(n_users + 1)]
+
+    async with AsyncSessionLocal() as db:
+        user_ids = await insert_users(db, emails, password=hash_password("secret"), first_name="Burst")
+        event_id = await insert_event(db, f"Burst {run_id}", capacity, subtitle="load test", description="load test")
+        await db.execute(insert(EventAttendee).values(
+            id=uuid.uuid4(), event_id=event_id, user_id=user_ids[0], event_role=EventRoleEnum.ORGANIZER
+        ))
+        await db.commit()
+
+    return event_id, user_ids
+
+
+async def run(base_url: str, n_users: int, capacity: int):
+    event_id, user_ids = await seed(n_users, capacity)
+    tokens = [create_access_token({"sub": str(uid)}) for uid in user_ids[1:]]
+
+    latencies = []
+    statuses = Counter()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=httpx.Limits(max_connections=n_users)) as client:
+
+        async def register(token):
+            start = time.perf_counter()
+            res = await client.post(
+                f"/event-actions/{event_id}/register",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            latencies.append(time.perf_counter() - start)
+            statuses[res.status_code] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(register(t) for t in tokens))
+        elapsed = time.perf_counter() - start
+
+    async with AsyncSessionLocal() as db:
+        counter = await db.scalar(select(Event.attendees_count).where(Event.id == event_id))
+        rows = await db.scalar(
+            select(func.count()).where(
+                EventAttendee.event_id == event_id,
+                EventAttendee.event_role == EventRoleEnum.ATTENDEE,
+            )
+        )
+
+    await cleanup([event_id], user_ids)
+
+    expected = min(n_users, capacity)
+    print(f"requests:     {n_users} in {elapsed:.2f}s ({n_users / elapsed:.0f} req/s)")
+    print(f"statuses:     {dict(statuses)}")
+    print(f"latency:      {format_latencies(latencies)}")
+    print(f"seats:        counter={counter} rows={rows} expected={expected}")
+
+    if counter != expected or rows != expected:
+        raise SystemExit("oversold or undersold: counter and rows must both equal min(users, capacity)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--capacity", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.base_url, args.users, args.capacity))
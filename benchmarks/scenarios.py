@@ -0,0 +1,183 @@
+"""
+Load scenarios against a running API, on data seeded with `src.app.db.init_db`.
+
+    list      GET /events/list, walking `--depth` pages of cursors
+    retrieve  GET /events/retrieve/{id} over the `--events` newest events
+    login     POST /auth/login with the seeded users
+    register  POST /event-actions/{id}/register, distinct seeded users on a fresh event
+    compare   prints the stored runs of a scenario, oldest first
+
+Each run prints throughput and p50/p95/p99 and is stored as JSON in
+benchmarks/results/ (with the git revision) so runs can be compared over
+time. Start the API with rate limiting off, or login/register get 429s.
+
+    poetry run python -m src.app.db.init_db --users 100000 --events 20000 --attendees-per-event 50
+    RATE_LIMIT_ENABLED=false poetry run uvicorn src.app.main:app --workers 4
+    poetry run python -m benchmarks.scenarios list --concurrency 50 --duration 30
+    poetry run python -m benchmarks.scenarios retrieve --concurrency 50 --duration 30
+    poetry run python -m benchmarks.scenarios login --concurrency 20 --requests 500
+    poetry run python -m benchmarks.scenarios register --requests 2000 --capacity 1000
+    poetry run python -m benchmarks.scenarios compare retrieve
+"""
+import argparse
+import asyncio
+from collections import deque
+
+import httpx
+from sqlalchemy import select
+
+from src.app.core.security import create_access_token
+from src.app.db.db import AsyncSessionLocal
+from src.app.db.init_db import SEED_PASSWORD
+
+from src.app.modules.users.users_model import User
+from src.app.modules.events.events_model import Event
+
+from .common import run_load, print_result, save_result, load_results, insert_event, cleanup
+
+
+async def seeded_users(prefix: str, n: int):
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(select(User.id, User.email).where(User.email.like(f"{prefix}-%")).limit(n))
+        users = rows.all()
+
+    if not users:
+        raise SystemExit(f"no users matching {prefix}-*@example.com, run src.app.db.init_db --users N first")
+    return users
+
+
+async def newest_event_ids(n: int):
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(select(Event.id).order_by(Event.created_at.desc(), Event.id.desc()).limit(n))
+        return rows.scalars().all()
+
+
+def auth_headers(user_id) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+async def scenario_list(client: httpx.AsyncClient, args):
+    cursors = deque()
+
+    async def request(i):
+        params = {"limit": args.limit}
+        if i % args.depth and cursors:
+            params["cursor"] = cursors.popleft()
+
+        response = await client.get("/events/list", params=params)
+        if response.status_code == 200:
+            next_cursor = response.json()["metadata"].get("next_cursor")
+            if next_cursor:
+                cursors.append(next_cursor)
+        return response.status_code
+
+    return await run_load(request, args.concurrency, args.requests, args.duration)
+
+
+async def scenario_retrieve(client: httpx.AsyncClient, args):
+    event_ids = await newest_event_ids(args.events)
+    user_id, _ = (await seeded_users(args.prefix, 1))[0]
+    headers = auth_headers(user_id)
+
+    async def request(i):
+        response = await client.get(f"/events/retrieve/{event_ids[i % len(event_ids)]}", headers=headers)
+        return response.status_code
+
+    return await run_load(request, args.concurrency, args.requests, args.duration)
+
+
+async def scenario_login(client: httpx.AsyncClient, args):
+    users = await seeded_users(args.prefix, args.users)
+
+    async def request(i):
+        _, email = users[i % len(users)]
+        response = await client.post("/auth/login", json={"email": email, "password": args.password})
+        return response.status_code
+
+    return await run_load(request, args.concurrency, args.requests, args.duration)
+
+
+async def scenario_register(client: httpx.AsyncClient, args):
+    # every request registers a different user, so --requests can't exceed the seeded users
+    users = await seeded_users(args.prefix, args.requests)
+    headers = [auth_headers(user_id) for user_id, _ in users]
+
+    async with AsyncSessionLocal() as db:
+        event_id = await insert_event(db, "Registration burst", args.capacity)
+        await db.commit()
+
+    async def request(i):
+        response = await client.post(f"/event-actions/{event_id}/register", headers=headers[i])
+        return response.status_code
+
+    try:
+        return await run_load(request, args.concurrency, len(users))
+    finally:
+        await cleanup([event_id])
+
+
+SCENARIOS = {
+    "list": scenario_list,
+    "retrieve": scenario_retrieve,
+    "login": scenario_login,
+    "register": scenario_register,
+}
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        result = await SCENARIOS[args.scenario](client, args)
+
+    print_result(args.scenario, result)
+    if not args.no_save:
+        params = {k: v for k, v in vars(args).items() if k not in ("scenario", "no_save", "password")}
+        print(f"saved to {save_result(args.scenario, params, result)}")
+
+
+def compare(scenario: str):
+    runs = load_results(scenario)
+    if not runs:
+        raise SystemExit(f"no stored results for {scenario}")
+
+    print(f"{'recorded at':<27} {'rev':<9} {'requests':>8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for r in runs:
+        latency = r["latency_ms"]
+        print(f"{r['recorded_at'][:26]:<27} {r['git_revision'] or '-':<9} {r['requests']:>8} "
+              f"{r['throughput_rps']:>9.1f} {latency.get('p50', 0):>8.1f} {latency.get('p95', 0):>8.1f} "
+              f"{latency.get('p99', 0):>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", choices=[*SCENARIOS, "compare"])
+    parser.add_argument("compare_scenario", nargs="?", choices=list(SCENARIOS), help="for compare")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=None, help="stop after this many requests")
+    parser.add_argument("--duration", type=float, default=None, help="stop after this many seconds")
+    parser.add_argument("--prefix", default="seed", help="seeded users are <prefix>-<n>@example.com")
+    parser.add_argument("--password", default=SEED_PASSWORD)
+    parser.add_argument("--users", type=int, default=1000, help="login: distinct users to cycle through")
+    parser.add_argument("--events", type=int, default=1000, help="retrieve: newest events to cycle through")
+    parser.add_argument("--limit", type=int, default=20, help="list: page size")
+    parser.add_argument("--depth", type=int, default=5, help="list: pages walked before starting over")
+    parser.add_argument("--capacity", type=int, default=1000, help="register: seats of the fresh event")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    if args.scenario == "compare":
+        if not args.compare_scenario:
+            parser.error("compare needs a scenario, e.g. `compare retrieve`")
+        return compare(args.compare_scenario)
+
+    if args.scenario == "register":
+        args.requests = args.requests or 1000
+    elif args.requests is None and args.duration is None:
+        args.duration = 30
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
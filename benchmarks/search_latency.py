@@ -0,0 +1,84 @@
+"""
+Latency of GET /events/search's query (events_service.search_events).
+
+With `--seed N`, first inserts N synthetic events in one INSERT ... SELECT
+over generate_series (titles/descriptions drawn from a small vocabulary, so
+terms have realistic selectivity). Then runs every term in `--terms` through
+the search query `--repeat` times and prints p50/p95/p99 per term.
+
+    poetry run python -m benchmarks.search_latency --seed 1000000
+    poetry run python -m benchmarks.search_latency --terms python "data science" lima
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.db.init_db import WORDS, PLACES
+from src.app.modules.events import events_service
+
+from .common import percentile
+
+CITIES = [city for _, city in PLACES]
+
+SEED_SQL = text("""
+    INSERT INTO events (
+        id, title, subtitle, description, image, country, city, address,
+        start_date, end_date, attendees_capacity, status
+    )
+    SELECT
+        gen_random_uuid(),
+        initcap(w[1 + (i % 20)] || ' ' || w[1 + ((i / 20) % 20)]),
+        w[1 + ((i / 7) % 20)] || ' ' || w[1 + ((i / 3) % 20)],
+        repeat(w[1 + ((i / 11) % 20)] || ' ' || w[1 + ((i / 13) % 20)] || ' ', 20),
+        '',
+        'LatAm',
+        c[1 + (i % 8)],
+        'Av. Siempre Viva ' || i,
+        now() + (i % 365) * interval '1 day',
+        now() + (i % 365) * interval '1 day' + interval '3 hours',
+        100,
+        'INCOMING'
+    FROM generate_series(1, :n) AS i,
+         (SELECT CAST(:words AS text[]) AS w, CAST(:cities AS text[]) AS c) AS vocab
+""")
+
+
+async def seed(n: int):
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        await db.execute(SEED_SQL, {"n": n, "words": WORDS, "cities": CITIES})
+        await db.commit()
+        await db.execute(text("ANALYZE events"))
+        print(f"seeded {n} events in {time.perf_counter() - start:.1f}s")
+
+
+async def run(terms, repeat: int):
+    async with AsyncSessionLocal() as db:
+        for term in terms:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await events_service.search_events(db, term)
+                timings.append(time.perf_counter() - start)
+
+            print(f"{term!r:<24} p50={percentile(timings, 50) * 1000:7.2f} ms  "
+                  f"p95={percentile(timings, 95) * 1000:7.2f} ms  p99={percentile(timings, 99) * 1000:7.2f} ms")
+
+
+async def main(args):
+    if args.seed:
+        await seed(args.seed)
+    await run(args.terms, args.repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="insert this many synthetic events first")
+    parser.add_argument("--terms", nargs="+", default=["python", "data science", "hackathon lima", "\"rust\" -cloud"])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
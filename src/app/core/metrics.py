@@ -0,0 +1,260 @@
+"""
+Prometheus metrics, kept in process.
+
+Every worker process has its own registry, and its samples carry a `worker` label (its pid).
+With several workers, each must be scraped on its own, e.g. one uvicorn process per port,
+each listed as a target. Through a shared port, a scrape reaches whichever worker accepts it.
+Sum across `worker` in queries. Counters restart at zero when a worker is replaced, and
+rate() handles that.
+
+/metrics is served by MetricsMiddleware, before the rate limiter and the app. It is off
+unless METRICS_ENABLED. When METRICS_TOKEN is set it requires `Authorization: Bearer <token>`.
+"""
+import bisect
+import os
+import secrets
+import time
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.app.core.cache import TTLCache
+from src.app.core.config import settings
+
+
+# seconds; covers cached reads (~1 ms) up to bcrypt logins and bulk registrations
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Labels, *extra: str) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    pairs.extend(label for label in extra if label)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, Labels, str, float]]:
+        """
+        (suffix, label values, extra label, value) for each sample.
+        """
+        raise NotImplementedError
+
+    def render(self, worker: str = "") -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, extra, value in self.samples():
+            lines.append(
+                f"{self.name}{suffix}{_format_labels(self.labelnames, labels, extra, worker)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "", labels, "", value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        self._values[labels] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [count per bucket (not cumulative) + overflow, sum]
+        self._values: Dict[Labels, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self):
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield "_bucket", labels, f'le="{_format_value(bound)}"', cumulative
+            yield "_sum", labels, "", total
+            yield "_count", labels, "", cumulative
+
+
+class CallbackMetric(Metric):
+    """
+    Read at scrape time from `collect`, which returns {label values: value}.
+    For state that is already counted elsewhere (pool, caches), so the hot path pays nothing.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], kind: str,
+                 collect: Callable[[], Dict[Labels, float]]):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self):
+        for labels, value in self.collect().items():
+            yield "", labels, "", value
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        # read on each scrape: workers forked from a preloaded app don't share the parent's pid
+        worker = f'worker="{os.getpid()}"'
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render(worker))
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"),
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"),
+))
+http_requests_in_progress = registry.register(Gauge(
+    "http_requests_in_progress", "HTTP requests being served", ("method",),
+))
+
+# name -> cache, read at scrape time
+_caches: Dict[str, TTLCache] = {}
+
+
+def register_cache(name: str, cache: TTLCache) -> None:
+    _caches[name] = cache
+
+
+registry.register(CallbackMetric(
+    "cache_hits_total", "In-process cache hits", ("cache",), "counter",
+    lambda: {(name, ): cache.hits for name, cache in _caches.items()},
+))
+registry.register(CallbackMetric(
+    "cache_misses_total", "In-process cache misses", ("cache",), "counter",
+    lambda: {(name, ): cache.misses for name, cache in _caches.items()},
+))
+registry.register(CallbackMetric(
+    "cache_hit_ratio", "In-process cache hits / lookups since start", ("cache",), "gauge",
+    lambda: {(name, ): cache.hit_ratio for name, cache in _caches.items()},
+))
+registry.register(CallbackMetric(
+    "cache_entries", "In-process cache size", ("cache",), "gauge",
+    lambda: {(name, ): len(cache) for name, cache in _caches.items()},
+))
+
+
+METRICS_PATH = "/metrics"
+
+
+def _authorized(scope) -> bool:
+    if not settings.METRICS_TOKEN:
+        return True
+
+    expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+    for key, value in scope["headers"]:
+        if key == b"authorization":
+            return secrets.compare_digest(value, expected)
+    return False
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and in-flight requests, and serving /metrics.
+
+    Routes are labelled by their template (`/events/retrieve/{event_id}`), which FastAPI leaves in
+    scope["route"] once matched; unmatched paths share one label so raw URLs cannot blow up cardinality.
+    Scrapes are answered here, so they are neither rate limited nor counted.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if scope["path"] == METRICS_PATH and settings.METRICS_ENABLED:
+            return await self._scrape(scope, receive, send)
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_progress.dec(method)
+
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            http_requests.inc(method, template, str(status_code))
+            http_request_duration.observe(elapsed, method, template)
+
+    async def _scrape(self, scope, receive, send):
+        if not _authorized(scope):
+            response = JSONResponse(status_code=401, content={
+                "detail": {
+                    "message": "Invalid metrics token",
+                    "code": "401__METRICS__UNAUTHORIZED"
+                }
+            }, headers={"WWW-Authenticate": "Bearer"})
+        else:
+            response = PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+        await response(scope, receive, send)
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+from src.app.core.config import RateLimitRule, settings
+from src.app.core.security import decode_access_token
+
+
+MAX_EMAIL_BODY_BYTES = 16 * 1024
+
+
+# (key, rate in tokens/second, burst) of each bucket a request counts against
+Bucket = Tuple[str, float, int]
+
+
+def take_tokens(levels: Sequence[Tuple[float, float, float, int]], now: float) -> Tuple[List[float], float]:
+    """
+    Token bucket step over every bucket of a request, given as (tokens, updated_at, rate, burst):
+    each refills at `rate` tokens/second up to `burst`, and one token is spent from all of them
+    only if each has one. A denied request spends nothing, so a client throttled by one rule
+    does not keep draining its other buckets.
+    Returns the new token counts and the seconds to wait (0 when the request is allowed).
+    """
+    tokens = [min(burst, t + (now - updated_at) * rate) for t, updated_at, rate, burst in levels]
+    wait = max(((1 - t) / rate for t, (_, _, rate, _) in zip(tokens, levels) if t < 1), default=0.0)
+
+    if wait > 0:
+        return tokens, wait
+    return [t - 1 for t in tokens], 0.0
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, buckets: Sequence[Bucket]) -> float:
+        """
+        Spends a token from each of `buckets` if all have one; returns 0 if allowed,
+        else the seconds until they all do.
+        """
+        ...
+
+
+class MemoryBackend:
+    """
+    Buckets of this worker only, in an LRU bounded to `maxsize`.
+    An evicted bucket starts over full, which only ever errs on the side of letting a request through.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def hit(self, buckets: Sequence[Bucket]) -> float:
+        now = time.monotonic()
+        levels = [(*self._buckets.pop(key, (burst, now)), rate, burst) for key, rate, burst in buckets]
+
+        tokens, wait = take_tokens(levels, now)
+        for (key, _, _), left in zip(buckets, tokens):
+            self._buckets[key] = (left, now)
+
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+
+        return wait
+
+
+class SQLiteBackend:
+    """
+    Buckets in a local SQLite file, shared by every worker process on the host.
+    Each hit is one short write transaction; idle buckets are deleted every `CLEANUP_EVERY` hits.
+    """
+
+    CLEANUP_EVERY = 1000
+    IDLE_SECONDS = 60 * 60
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, timeout=1, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")  # buckets are disposable, no need to fsync
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def _hit(self, buckets: Sequence[Bucket]) -> float:
+        with self._lock:
+            now = time.time()  # wall clock, compared across processes
+            conn = self._conn
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                levels = []
+                for key, rate, burst in buckets:
+                    row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)).fetchone()
+                    levels.append((*(row or (burst, now)), rate, burst))
+
+                tokens, wait = take_tokens(levels, now)
+                conn.executemany(
+                    "INSERT INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                    [(key, left, now) for (key, _, _), left in zip(buckets, tokens)],
+                )
+
+                self._hits += 1
+                if self._hits % self.CLEANUP_EVERY == 0:
+                    conn.execute("DELETE FROM buckets WHERE updated_at < ?", (now - self.IDLE_SECONDS,))
+
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+            return wait
+
+    async def hit(self, buckets: Sequence[Bucket]) -> float:
+        return await asyncio.to_thread(self._hit, buckets)
+
+
+def create_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "sqlite":
+        return SQLiteBackend(settings.RATE_LIMIT_SQLITE_PATH)
+    return MemoryBackend(settings.RATE_LIMIT_MAX_BUCKETS)
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying the token-bucket rules of settings.RATE_LIMIT_RULES.
+
+    Runs before routing, so throttled requests never reach bcrypt or the database.
+    Rules are matched on method and path; every matching rule must have a token left,
+    and a request that is denied spends none.
+    """
+
+    def __init__(self, app, rules: Optional[List[RateLimitRule]] = None, backend: Optional[RateLimitBackend] = None):
+        self.app = app
+        self.rules = [
+            (rule, re.compile("/".join("[^/]+" if part == "*" else re.escape(part) for part in rule.path.split("/"))))
+            for rule in (settings.RATE_LIMIT_RULES if rules is None else rules)
+        ]
+        self.backend = backend or create_backend()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            return await self.app(scope, receive, send)
+
+        path = scope["path"].rstrip("/") or "/"
+        matched = [
+            rule for rule, pattern in self.rules
+            if rule.method == scope["method"] and pattern.fullmatch(path)
+        ]
+        if not matched:
+            return await self.app(scope, receive, send)
+
+        email = None
+        if any(rule.key == "email" for rule in matched):
+            email, receive = await _read_email(receive)
+
+        buckets = []
+        for rule in matched:
+            identity = self._identity(rule, scope, email)
+            if identity is not None:
+                buckets.append((f"{rule.method} {rule.path} {identity}", rule.per_minute / 60, rule.burst))
+
+        wait = await self.backend.hit(buckets) if buckets else 0.0
+        if wait > 0:
+            return await _too_many_requests(send, wait)
+
+        return await self.app(scope, receive, send)
+
+    def _identity(self, rule: RateLimitRule, scope, email: Optional[str]) -> Optional[str]:
+        if rule.key == "email":
+            return f"email:{email}" if email else None
+
+        if rule.key == "user":
+            user_id = _token_subject(scope)
+            if user_id:
+                return f"user:{user_id}"
+
+        return f"ip:{_client_ip(scope)}"
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _client_ip(scope) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = _header(scope, b"x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _token_subject(scope) -> Optional[str]:
+    authorization = _header(scope, b"authorization")
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+
+    # verified payloads are cached, so this is a dict lookup on repeat requests
+    payload = decode_access_token(authorization[7:])
+    return payload.get("sub") if payload else None
+
+
+async def _read_email(receive):
+    """
+    Buffers the request body to read its "email" field, and returns a receive that replays it to the app.
+    """
+    messages = []
+    body = b""
+
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        body += message.get("body", b"")
+        if not message.get("more_body") or len(body) > MAX_EMAIL_BODY_BYTES:
+            break
+
+    email = None
+    try:
+        data = json.loads(body)
+        if isinstance(data, dict) and isinstance(data.get("email"), str):
+            email = data["email"].strip().lower()
+    except ValueError:
+        pass
+
+    async def replay():
+        if messages:
+            return messages.pop(0)
+        return await receive()
+
+    return email, replay
+
+
+async def _too_many_requests(send, wait: float):
+    body = json.dumps({
+        "detail": {
+            "message": "Too many requests, try again later",
+            "code": "429__RATE_LIMITED"
+        }
+    }).encode()
+
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(math.ceil(wait)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
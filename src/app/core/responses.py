@@ -0,0 +1,40 @@
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def _orjson_default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, UUID):
+        # orjson only takes uuid.UUID itself, asyncpg returns its own subclass
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def render_json(content) -> bytes:
+    """
+    Serializes `content` in native code: pydantic models with their own serializer,
+    anything else (dicts of UUIDs, datetimes, enums...) with orjson.
+    Both write UTC datetimes with a "Z", so the output does not depend on which one ran.
+    """
+    if not isinstance(content, BaseModel):
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default response class of the app.
+
+    A handler can also return FastJSONResponse(content) itself, keeping `response_model=`
+    for the OpenAPI schema: the content is then rendered as is and FastAPI's
+    validate-and-encode pass is skipped, so it must be trusted and shaped like the
+    response model (e.g. dicts built from our own query rows).
+    """
+
+    def render(self, content) -> bytes:
+        return render_json(content)
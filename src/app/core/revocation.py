@@ -0,0 +1,83 @@
+import hashlib
+import math
+import time
+from typing import Dict, Optional
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. May report false positives, never false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # double hashing: k positions from the two halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """
+    In-process set of revoked token ids (jti), holding at most `capacity` of them.
+
+    The Bloom filter is the gate: a token that was never revoked (nearly every request)
+    is answered from a few bit tests. Filter hits are confirmed against the exact set.
+    Once the exact set is full of live ids, further ids go into the filter only. Until
+    the last of those expires, a filter hit counts as revoked, even when it is a false
+    positive (about `error_rate` of the tokens checked). Ids are kept until their token
+    would expire anyway.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._exact: Dict[str, float] = {}  # jti -> expiry (unix time)
+        self._overflow_until = 0.0  # expiry of the last id kept only in the filter
+
+    def add(self, jti: str, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+
+        if jti not in self._exact and len(self._exact) >= self.capacity:
+            self.prune()
+
+        if jti in self._exact or len(self._exact) < self.capacity:
+            self._exact[jti] = expires_at
+        else:
+            self._overflow_until = max(self._overflow_until, expires_at)
+        self._filter.add(jti)
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None or jti not in self._filter:
+            return False
+        return jti in self._exact or time.time() < self._overflow_until
+
+    def prune(self) -> None:
+        """
+        Drops expired ids, and rebuilds the filter (which cannot remove items on its own)
+        unless it still holds live ids that did not fit in the exact set.
+        """
+        now = time.time()
+        self._exact = {jti: exp for jti, exp in self._exact.items() if exp > now}
+
+        if self._overflow_until <= now:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
+            for jti in self._exact:
+                self._filter.add(jti)
+
+    def __len__(self) -> int:
+        return len(self._exact)
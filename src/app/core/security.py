@@ -1,9 +1,19 @@
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional
 
 from src.app.core.config import settings  # asegúrate de tener una SECRET_KEY en .env
+from src.app.core.cache import TTLCache
+from src.app.core.metrics import register_cache
 
 
 # 🔑 Contexto de hashing
@@ -12,7 +22,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # 🔐 Clave y configuración JWT
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 1 día
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
+
+# 🏷️ Tipos de token ("typ" claim)
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
 
 
 # 🔐 Hash de la contraseña
@@ -25,6 +40,62 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# 🧵 bcrypt fuera del event loop
+# bcrypt is CPU bound (~250 ms) and releases the GIL, so a small thread pool keeps
+# one login from stalling every other request on the worker.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+# submitted calls that have not finished, including timed-out ones still running on a thread
+_hash_pending = 0
+_hash_pending_lock = threading.Lock()
+
+
+def _release_hash_slot(_future) -> None:
+    global _hash_pending
+    with _hash_pending_lock:
+        _hash_pending -= 1
+
+
+async def _run_hashing(fn, *args):
+    global _hash_pending
+
+    with _hash_pending_lock:
+        if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise _hashing_busy()
+        _hash_pending += 1
+
+    # the slot is held until the call itself ends, not when the request stops waiting for it:
+    # a timed-out bcrypt keeps its thread busy, and a cancelled one that never started frees it
+    future = _hash_executor.submit(fn, *args)
+    future.add_done_callback(_release_hash_slot)
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise _hashing_busy()
+
+
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "message": "Too many authentication requests, try again shortly",
+            "code": "503__AUTH__BUSY"
+        },
+        headers={"Retry-After": "1"},
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
 # 🎟️ Crear token JWT
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -34,15 +105,48 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
+    # every token gets its own id so it can be revoked individually
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+    to_encode.setdefault("typ", ACCESS_TOKEN_TYPE)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+# 🔄 Crear refresh token
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
+    return create_access_token(
+        {**data, "typ": REFRESH_TOKEN_TYPE},
+        expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+
+
+# 🗃️ Cache de tokens ya verificados
+# sha256(token) -> payload, each entry expiring with the token's own "exp".
+# Repeat requests with the same token skip the HMAC check and claim parsing.
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_ENTRIES, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+register_cache("jwt_payloads", token_cache)
+
+
 # 🔐 Verificar y decodificar token JWT
 def decode_access_token(token: str):
+    """
+    Returns the verified payload, or None if the token is invalid or expired.
+    The returned dict is shared with the cache and must not be modified.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+
+    payload = token_cache.get(digest)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    ttl = payload.get("exp", 0) - time.time()
+    if ttl > 0:
+        token_cache.set(digest, payload, ttl=ttl)
+
+    return payload
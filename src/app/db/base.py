@@ -5,4 +5,6 @@ Base = declarative_base()
 
 from src.app.modules.users.users_model import User
 from src.app.modules.events.events_model import Event
-from src.app.modules.events.event_attendees_model import EventAttendee
\ No newline at end of file
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_waitlist_model import EventWaitlistEntry
+from src.app.modules.auth.revoked_token_model import RevokedToken
@@ -1,41 +1,181 @@
 import os
 import ssl
+import time
+from itertools import cycle
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 from .base import Base
 
 from src.app.core.config import settings
+from src.app.core.security import decode_access_token
+from .recent_writers import create_recent_writers
+from .instrumentation import instrument_engine, instrument_pool, TimedAsyncAdaptedQueuePool
 
 
 DATABASE_URL = settings.DATABASE_URL
 
 
-ssl_context = ssl.create_default_context(cafile=settings.CA_CERT_PATH)
+connect_args = {
+    "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+}
+if settings.DB_SSL:
+    ssl_context = ssl.create_default_context(cafile=settings.CA_CERT_PATH)
+    connect_args["ssl"] = ssl_context
+
+
+def create_engine(url: str, name: str):
+    new_engine = create_async_engine(
+        url,
+        connect_args=connect_args,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        poolclass=TimedAsyncAdaptedQueuePool,
+    )
+    instrument_engine(new_engine.sync_engine)
+    pool_stats[name] = instrument_pool(new_engine.sync_engine, name)
+    return new_engine
+
+
+# connection pool counters per engine: "primary", "replica-0", ...
+pool_stats = {}
 
 # Create async engine
-engine = create_async_engine(
-    DATABASE_URL, 
-    connect_args={"ssl": ssl_context},
-    echo=True
-)
+engine = create_engine(DATABASE_URL, "primary")
+
+
+class PrimarySession(Session):
+    """
+    Session bound to the primary. Commits made on behalf of a request make that
+    user's reads stick to the primary for a while (see read_sessionmaker).
+    """
+
 
 # Create async session maker
 AsyncSessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=PrimarySession,
     expire_on_commit=False,
     autoflush=False,
     autocommit=False
 )
 
+# Read replicas, used round-robin by get_read_db
+replica_engines = [create_engine(url, f"replica-{i}") for i, url in enumerate(settings.DB_REPLICA_URLS)]
+ReplicaSessionLocals = [
+    sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False
+    )
+    for replica_engine in replica_engines
+]
+_next_replica = cycle(ReplicaSessionLocals)
+
+# users that committed on the primary lately, shared by the workers (only needed with replicas)
+recent_writers = create_recent_writers() if ReplicaSessionLocals else None
+
 # Base class for models
 
 
+def request_user_id(request: Request) -> Optional[str]:
+    """
+    User id (`sub`) of the request's bearer token, or None for anonymous requests and bad tokens.
+    Verified payloads are cached, so this is a dict lookup on repeat requests.
+    """
+    authorization = request.headers.get("authorization", "")
+    if not authorization.lower().startswith("bearer "):
+        return None
+
+    payload = decode_access_token(authorization[7:])
+    return payload.get("sub") if payload else None
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _stick_to_primary(session: Session):
+    request = session.info.get("request")
+    if request is None or recent_writers is None:
+        return
+
+    user_id = request_user_id(request)
+    if user_id is not None:
+        recent_writers.mark(user_id, time.time() + settings.READ_YOUR_WRITES_SECONDS)
+
+
+def read_sessionmaker(request: Optional[Request] = None):
+    """
+    Picks where a read-only request should go: the next replica, or the primary when
+    there are no replicas or the requesting user wrote something within READ_YOUR_WRITES_SECONDS.
+    """
+    if not ReplicaSessionLocals:
+        return AsyncSessionLocal
+
+    user_id = request_user_id(request) if request is not None else None
+    if user_id is not None and recent_writers.wrote_recently(user_id):
+        return AsyncSessionLocal
+
+    return next(_next_replica)
+
+
+class LazySession:
+    """
+    Stands in for the AsyncSession of a request and only creates it on first use, so requests
+    rejected by a guard or answered from a cache never build a session nor touch the pool.
+    """
+
+    def __init__(self, factory, info: Optional[dict] = None, replica: bool = False):
+        self._factory = factory
+        self._info = info or {}
+        self._session: Optional[AsyncSession] = None
+        self.replica = replica  # reads may lag behind the primary
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+            self._session.info.update(self._info)
+        return self._session
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    async def release(self) -> None:
+        """
+        Ends a read-only transaction, returning its connection to the pool before the request is over.
+        """
+        if self._session is not None and self._session.in_transaction():
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
 # Dependency for getting DB session
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        try: 
-            yield session
-        finally: 
-            await session.close()
+async def get_db(request: Request = None):
+    session = LazySession(AsyncSessionLocal, info={"request": request})
+    try: 
+        yield session
+    finally: 
+        await session.close()
+
+
+# Dependency for read-only routes, may be served by a replica
+async def get_read_db(request: Request = None):
+    factory = read_sessionmaker(request)
+    session = LazySession(factory, replica=factory is not AsyncSessionLocal)
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -1,7 +1,12 @@
 # src/app/db/init_db.py
 
+import argparse
 import asyncio
-from src.app.db.db import AsyncSessionLocal 
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from src.app.db.db import AsyncSessionLocal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -10,6 +15,21 @@ from src.app.core.security import hash_password  # si usas hashing
 
 from src.app.modules.users.users_model import User
 from src.app.modules.users.user_role_enum import RoleEnum
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.event_status_enum import EventStatusEnum
+
+# synthetic data vocabulary, so searches and filters have realistic selectivity
+WORDS = [
+    "python", "javascript", "data", "science", "startup", "meetup", "cloud", "design",
+    "marketing", "blockchain", "rust", "comunidad", "emprendedores", "taller", "conferencia",
+    "hackathon", "inteligencia", "artificial", "seguridad", "producto",
+]
+PLACES = [
+    ("Perú", "Lima"), ("Colombia", "Bogotá"), ("Ecuador", "Quito"), ("Chile", "Santiago"),
+    ("México", "Ciudad de México"), ("Argentina", "Buenos Aires"), ("España", "Madrid"), ("Venezuela", "Caracas"),
+]
+SEED_PASSWORD = "secret"
+
 
 async def init_db(session: AsyncSession):
     # Verificar si ya existe un admin
@@ -29,9 +49,145 @@ async def init_db(session: AsyncSession):
     session.add(user)
     await session.commit()
 
+
+def seed_email(prefix: str, i: int) -> str:
+    return f"{prefix}-{i}@example.com"
+
+
+async def seed_data(
+    session: AsyncSession,
+    users: int,
+    events: int,
+    attendees_per_event: int,
+    speakers_per_event: int = 0,
+    prefix: str = "seed",
+    password: str = SEED_PASSWORD,
+    rng_seed: int = 0,
+) -> dict:
+    """
+    Bulk-loads synthetic users, events and registrations with COPY, in one transaction.
+
+    Users get the emails `{prefix}-{i}@example.com` and all share `password`. Every event gets an
+    organizer plus `attendees_per_event` attendees and `speakers_per_event` speakers drawn from the
+    seeded users, with attendees_count/speakers_count filled in to match.
+    """
+    rng = random.Random(rng_seed)
+    now = datetime.now(timezone.utc)
+    per_event = 1 + attendees_per_event + speakers_per_event
+
+    if events and per_event > users:
+        raise ValueError(f"need at least {per_event} users to fill each event")
+
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    event_ids = [uuid.uuid4() for _ in range(events)]
+    password_hash = hash_password(password)  # bcrypt once, not per user
+
+    def user_records():
+        for i, user_id in enumerate(user_ids):
+            yield (
+                user_id, f"Seed{i}", rng.choice(WORDS).title(), seed_email(prefix, i), password_hash,
+                "https://picsum.photos/id/237/200", RoleEnum.USER.value, now - timedelta(minutes=i),
+            )
+
+    def event_records():
+        for i, event_id in enumerate(event_ids):
+            country, city = rng.choice(PLACES)
+            start = now + timedelta(days=rng.randint(-180, 365), hours=rng.randint(8, 20))
+            words = rng.sample(WORDS, 6)
+            yield (
+                event_id,
+                f"{words[0].title()} {words[1]} {i}",
+                f"{words[2]} {words[3]}",
+                " ".join(rng.choices(WORDS, k=60)),
+                "",
+                country,
+                city,
+                f"Av. Siempre Viva {i}",
+                start,
+                start + timedelta(hours=3),
+                attendees_per_event * 2,
+                attendees_per_event,
+                speakers_per_event,
+                (EventStatusEnum.COMPLETED if start < now else EventStatusEnum.INCOMING).value,
+                now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+            )
+
+    def attendee_records():
+        roles = (
+            [EventRoleEnum.ORGANIZER.value]
+            + [EventRoleEnum.ATTENDEE.value] * attendees_per_event
+            + [EventRoleEnum.SPEAKER.value] * speakers_per_event
+        )
+        for event_id in event_ids:
+            for role, index in zip(roles, rng.sample(range(users), per_event)):
+                yield uuid.uuid4(), user_ids[index], event_id, role
+
+    connection = await session.connection()
+    raw = (await connection.get_raw_connection()).driver_connection  # asyncpg connection
+
+    timings = {}
+    for table, columns, records in (
+        ("users", ["id", "first_name", "last_name", "email", "password", "pfp", "role", "created_at"], user_records()),
+        ("events", [
+            "id", "title", "subtitle", "description", "image", "country", "city", "address",
+            "start_date", "end_date", "attendees_capacity", "attendees_count", "speakers_count",
+            "status", "created_at",
+        ], event_records()),
+        ("event_attendees", ["id", "user_id", "event_id", "event_role"], attendee_records()),
+    ):
+        start = time.perf_counter()
+        await raw.copy_records_to_table(table, records=records, columns=columns)
+        timings[table] = time.perf_counter() - start
+
+    await session.commit()
+
+    return {
+        "users": users,
+        "events": events,
+        "event_attendees": events * per_event,
+        "seconds": timings,
+    }
+
+
 async def main():
     async with AsyncSessionLocal() as session:
         await init_db(session)
 
+
+async def seed_main(args):
+    await main()
+
+    async with AsyncSessionLocal() as session:
+        summary = await seed_data(
+            session,
+            users=args.users,
+            events=args.events,
+            attendees_per_event=args.attendees_per_event,
+            speakers_per_event=args.speakers_per_event,
+            prefix=args.prefix,
+            password=args.password,
+            rng_seed=args.rng_seed,
+        )
+
+    for table, seconds in summary["seconds"].items():
+        print(f"{table:<16} {summary[table]:>10} rows in {seconds:6.2f}s ({summary[table] / seconds:,.0f} rows/s)")
+    print(f"users log in as {seed_email(args.prefix, 0)} ... {seed_email(args.prefix, args.users - 1)} / {args.password!r}")
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(
+        description="Creates the admin user; with --users/--events, also bulk-loads synthetic data (COPY)."
+    )
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument("--events", type=int, default=0)
+    parser.add_argument("--attendees-per-event", type=int, default=20)
+    parser.add_argument("--speakers-per-event", type=int, default=2)
+    parser.add_argument("--prefix", default="seed", help="seeded emails are <prefix>-<n>@example.com")
+    parser.add_argument("--password", default=SEED_PASSWORD)
+    parser.add_argument("--rng-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.users:
+        asyncio.run(seed_main(args))
+    else:
+        asyncio.run(main())
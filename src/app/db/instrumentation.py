@@ -0,0 +1,225 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.app.core import metrics
+from src.app.core.config import settings
+
+
+slow_query_logger = logging.getLogger("src.app.db.slow_queries")
+n_plus_one_logger = logging.getLogger("src.app.db.n_plus_one")
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements run within one request (or one assert_max_queries block).
+    """
+    count: int = 0
+    duration: float = 0.0  # seconds
+    statements: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = None  # an enclosing block also sees these statements
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.statements[statement] += 1
+
+        if self.parent is not None:
+            self.parent.record(statement, elapsed)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements run at least `threshold` times, the usual sign of an N+1 loop.
+        """
+        return [(statement, n) for statement, n in self.statements.items() if n >= threshold]
+
+
+# set per request by QueryStatsMiddleware; SQLAlchemy's greenlet runs the cursor hooks in the
+# context of the awaiting task, so the hooks below see the stats of the request that issued the query
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # a connection runs one statement at a time, and after_cursor_execute does not fire when
+    # the statement fails, so a single start time (overwritten by the next statement) is enough
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_start")
+    elapsed_ms = elapsed * 1000
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if settings.DB_SLOW_QUERY_MS and elapsed_ms >= settings.DB_SLOW_QUERY_MS:
+        # parameters are left out on purpose, they may carry emails or password hashes
+        slow_query_logger.warning("Slow query (%.1f ms): %s", elapsed_ms, " ".join(statement.split()))
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Installs the cursor execution hooks on a (sync) engine; pass `async_engine.sync_engine`.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that counts the statements of each request, reports them in a
+    Server-Timing header (`db;dur=<ms>;desc="<n> queries"`) and logs likely N+1 patterns.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats(parent=current_query_stats.get())
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and settings.DB_SERVER_TIMING:
+                timing = f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+
+            for statement, n in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+                n_plus_one_logger.warning(
+                    "Possible N+1 on %s %s, statement ran %d times: %s",
+                    scope["method"], scope["path"], n, " ".join(statement.split()),
+                )
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """
+    Test helper: fails if the block runs more than `limit` statements.
+
+    Call the app in the same task (httpx ASGITransport; Starlette's TestClient runs
+    it on another thread, out of this context):
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            with assert_max_queries(1):
+                await client.get(f"/events/retrieve/{event_id}", headers=auth_headers)
+    """
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+    if stats.count > limit:
+        statements = "\n".join(
+            f"  {n}x {' '.join(statement.split())}" for statement, n in stats.statements.most_common()
+        )
+        raise AssertionError(f"Expected at most {limit} queries, ran {stats.count}:\n{statements}")
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    checked_out: int = 0
+    held_seconds: float = 0.0  # total time connections spent checked out
+    wait_seconds: float = 0.0  # total time spent obtaining a connection (queueing when exhausted, connecting)
+    timeouts: int = 0  # checkouts that gave up after pool_timeout
+
+    def as_dict(self, pool=None) -> dict:
+        stats = {
+            "checkouts": self.checkouts,
+            "checked_out": self.checked_out,
+            "held_seconds": round(self.held_seconds, 6),
+            "wait_seconds": round(self.wait_seconds, 6),
+            "timeouts": self.timeouts,
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(pool_size=pool.size(), overflow=pool.overflow())
+        return stats
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    The default pool of async engines, timing how long each checkout waits for a connection.
+    """
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            if self.stats is not None:
+                self.stats.timeouts += 1
+            raise
+        finally:
+            if self.stats is not None:
+                self.stats.wait_seconds += time.perf_counter() - start
+
+
+# engine name -> (engine, stats), exported at /metrics
+instrumented_pools: Dict[str, Tuple[Engine, PoolStats]] = {}
+
+
+def instrument_pool(engine: Engine, name: str) -> PoolStats:
+    """
+    Counts connection checkouts of the engine's pool and how long they are held.
+    """
+    stats = PoolStats()
+    if isinstance(engine.pool, TimedAsyncAdaptedQueuePool):
+        engine.pool.stats = stats
+
+    @event.listens_for(engine.pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+        stats.checked_out += 1
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine.pool, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            stats.checked_out -= 1
+            stats.held_seconds += time.perf_counter() - checked_out_at
+
+    instrumented_pools[name] = (engine, stats)
+    return stats
+
+
+def _pool_metric(field_name: str):
+    def collect():
+        return {
+            (name, ): stats.as_dict(engine.pool).get(field_name, 0)
+            for name, (engine, stats) in instrumented_pools.items()
+        }
+    return collect
+
+
+for _name, _kind, _field, _doc in (
+    ("db_pool_checkouts_total", "counter", "checkouts", "Connections checked out of the pool"),
+    ("db_pool_checked_out", "gauge", "checked_out", "Connections currently checked out"),
+    ("db_pool_size", "gauge", "pool_size", "Configured pool size"),
+    ("db_pool_overflow", "gauge", "overflow", "Connections open beyond pool_size (negative while below it)"),
+    ("db_pool_held_seconds_total", "counter", "held_seconds", "Time connections spent checked out"),
+    ("db_pool_checkout_wait_seconds_total", "counter", "wait_seconds", "Time spent obtaining a connection"),
+    ("db_pool_checkout_timeouts_total", "counter", "timeouts", "Checkouts that timed out waiting for a connection"),
+):
+    metrics.registry.register(metrics.CallbackMetric(_name, _doc, ("engine",), _kind, _pool_metric(_field)))
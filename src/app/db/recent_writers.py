@@ -0,0 +1,80 @@
+"""
+Users that wrote recently, by user id (the `sub` of their access token). After a commit on
+the primary, that user's reads go to the primary for READ_YOUR_WRITES_SECONDS, whichever
+worker serves them (see db.read_sessionmaker).
+"""
+import sqlite3
+import threading
+import time
+from typing import Protocol
+
+from src.app.core.cache import TTLCache
+from src.app.core.config import settings
+
+
+class RecentWriters(Protocol):
+    def mark(self, user_id: str, until: float) -> None:
+        """
+        Records that `user_id` reads from the primary until `until` (epoch seconds).
+        """
+        ...
+
+    def wrote_recently(self, user_id: str) -> bool:
+        ...
+
+
+class MemoryRecentWriters:
+    """
+    Writers seen by this worker only, so only right when a single worker serves the API.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=settings.READ_YOUR_WRITES_SECONDS)
+
+    def mark(self, user_id: str, until: float) -> None:
+        self._cache.set(user_id, until, ttl=until - time.time())
+
+    def wrote_recently(self, user_id: str) -> bool:
+        return self._cache.get(user_id, 0) > time.time()
+
+
+class SQLiteRecentWriters:
+    """
+    Writers in a local SQLite file, shared by every worker process on the host.
+    Marks are made from a commit hook, which cannot await, so both calls run inline:
+    a single-row upsert or lookup on a WAL database takes microseconds.
+    Expired rows are deleted every `CLEANUP_EVERY` marks.
+    """
+
+    CLEANUP_EVERY = 1000
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, timeout=1, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")  # marks are disposable, no need to fsync
+        self._conn.execute("CREATE TABLE IF NOT EXISTS recent_writers (user_id TEXT PRIMARY KEY, until REAL NOT NULL)")
+        self._lock = threading.Lock()
+        self._marks = 0
+
+    def mark(self, user_id: str, until: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO recent_writers (user_id, until) VALUES (?, ?) "
+                "ON CONFLICT (user_id) DO UPDATE SET until = excluded.until",
+                (user_id, until),
+            )
+
+            self._marks += 1
+            if self._marks % self.CLEANUP_EVERY == 0:
+                self._conn.execute("DELETE FROM recent_writers WHERE until < ?", (time.time(),))
+
+    def wrote_recently(self, user_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT until FROM recent_writers WHERE user_id = ?", (user_id,)).fetchone()
+        return row is not None and row[0] > time.time()
+
+
+def create_recent_writers() -> RecentWriters:
+    if settings.READ_YOUR_WRITES_BACKEND == "sqlite":
+        return SQLiteRecentWriters(settings.READ_YOUR_WRITES_SQLITE_PATH)
+    return MemoryRecentWriters(settings.READ_YOUR_WRITES_MAX_ENTRIES)
@@ -0,0 +1,15 @@
+# src/app/db/reconcile_counters.py
+# uso: poetry run python -m src.app.db.reconcile_counters
+
+import asyncio
+from src.app.db.db import AsyncSessionLocal
+
+from src.app.modules.events.event_counters import reconcile_counters
+
+async def main():
+    async with AsyncSessionLocal() as session:
+        fixed = await reconcile_counters(session)
+        print(f"Reconciled attendee/speaker counters on {fixed} event(s)")
+
+if __name__ == "__main__":
+    asyncio.run(main())
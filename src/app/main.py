@@ -1,19 +1,36 @@
 from dotenv import load_dotenv
 load_dotenv()
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
 from src.app.db.base import Base
+from src.app.core import metrics
+from src.app.core.responses import FastJSONResponse
+from src.app.core.rate_limit import RateLimitMiddleware
+from src.app.db.instrumentation import QueryStatsMiddleware
 
 from src.app.modules.auth.auth_router import router as auth_router
+from src.app.modules.auth.revocation_svc import load_revocations, run_revocation_sync
 from src.app.modules.users.users_router import router as user_router
 from src.app.modules.events.events_router import router as events_router
 from src.app.modules.event_actions.event_actions_router import router as event_actions_router
 from src.app.modules.event_attendees.event_attendees_router import router as event_attendees_router
 # from modules.files.files_router import router as file_router
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # revoked tokens must be known before the first request is authenticated
+    await load_revocations()
+    sync_task = asyncio.create_task(run_revocation_sync())
+    yield
+    sync_task.cancel()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.include_router(auth_router)
 app.include_router(user_router)
@@ -21,6 +38,11 @@ app.include_router(events_router)
 app.include_router(event_actions_router)
 app.include_router(event_attendees_router)
 
+app.add_middleware(QueryStatsMiddleware)
+
+# added before CORS so 429 responses still carry the CORS headers
+app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # ⚠️ INSEGURO en producción
@@ -29,6 +51,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# outermost, so its latency covers everything above; it also serves /metrics
+app.add_middleware(metrics.MetricsMiddleware)
+
 # create tables
 # async def init_models():
 #     async with engine.begin() as conn:
@@ -39,4 +64,3 @@ app.add_middleware(
 async def read_root():
     return {"Hello": "World"}
 
-
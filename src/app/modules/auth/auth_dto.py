@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, EmailStr
 
 class LoginDto(BaseModel):
@@ -9,3 +11,10 @@ class RegisterDto(BaseModel):
     password: str
     first_name: str
     last_name: str
+
+class RefreshDto(BaseModel):
+    refresh_token: str
+
+class LogoutDto(BaseModel):
+    # also revokes this refresh token, ending the session on this device
+    refresh_token: Optional[str] = None
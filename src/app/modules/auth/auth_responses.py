@@ -12,6 +12,8 @@ class UserResponse(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     expires_at: str  # ISO format datetime string
+    refresh_token: str
+    refresh_expires_at: str  # ISO format datetime string
 
 class RegisterResponse(BaseModel):
     user: UserResponse
@@ -22,6 +24,9 @@ class LoginResponse(BaseModel):
     user: UserResponse
     token: TokenResponse
 
+class RefreshResponse(BaseModel):
+    token: TokenResponse
+
 class SessionResponse(BaseModel):
     user: UserResponse
     
\ No newline at end of file
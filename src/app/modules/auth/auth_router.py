@@ -8,11 +8,12 @@ from fastapi.security import OAuth2PasswordRequestForm
 from src.app.db.db import get_db
 
 from src.app.modules.users.users_model import User
+from src.app.modules.users.user_role_enum import RoleEnum
 
-from .auth_dto import RegisterDto, LoginDto
-from .auth_responses import RegisterResponse, LoginResponse
-from .auth_svc import create_user, login_user, session
-from .guards import get_request_user
+from .auth_dto import RegisterDto, LoginDto, RefreshDto, LogoutDto
+from .auth_responses import RegisterResponse, LoginResponse, RefreshResponse
+from .auth_svc import create_user, login_user, refresh_session, logout, session
+from .guards import get_request_user, require_roles, oauth2_optional_scheme
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -32,6 +33,24 @@ async def login(
     res = await login_user(dto, db)
     return res
 
+@router.post("/refresh", response_model=RefreshResponse)
+async def refresh(
+    dto: Annotated[RefreshDto, Body(title="Refresh DTO")],
+    db: AsyncSession = Depends(get_db)
+):
+    res = await refresh_session(dto, db)
+    return res
+
+@router.post("/logout")
+async def logout_user(
+    dto: Annotated[LogoutDto, Body(title="Logout DTO")] = LogoutDto(),
+    current_user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    token: str = Depends(oauth2_optional_scheme),
+    db: AsyncSession = Depends(get_db)
+):
+    res = await logout(token, dto, db)
+    return res
+
 @router.get("/session")
 async def get_user_session(current_user: User = Depends(get_request_user)):
     res = await session(current_user)
@@ -1,17 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import HTTPException, status
 
-from src.app.core.security import hash_password, create_access_token, verify_password
+from src.app.core.security import (
+    hash_password_async,
+    create_access_token,
+    create_refresh_token,
+    decode_access_token,
+    verify_password_async,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    REFRESH_TOKEN_TYPE,
+)
 
 from src.app.modules.users.users_model import User
 
 
-from .auth_dto import RegisterDto, LoginDto
-from .auth_responses import RegisterResponse, LoginResponse, TokenResponse, UserResponse, SessionResponse
+from .auth_dto import RegisterDto, LoginDto, RefreshDto, LogoutDto
+from .auth_responses import RegisterResponse, LoginResponse, RefreshResponse, TokenResponse, UserResponse, SessionResponse
+from .revocation_svc import revoke_token
 from ..users.users_model import User
 
 
+def issue_tokens(user_id) -> TokenResponse:
+    """
+    Creates a short-lived access token and the refresh token used to renew it.
+    """
+    now = datetime.now(timezone.utc)
+    access_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    refresh_delta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+
+    return TokenResponse(
+        access_token=create_access_token({"sub": str(user_id)}, access_delta),
+        expires_at=(now + access_delta).isoformat(),
+        refresh_token=create_refresh_token({"sub": str(user_id)}, refresh_delta),
+        refresh_expires_at=(now + refresh_delta).isoformat(),
+    )
+
+
+def _token_expiry(payload: dict) -> datetime:
+    return datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+
+
 async def create_user(dto: RegisterDto, db: AsyncSession):
 
     # check if user already exis
@@ -32,7 +64,7 @@ async def create_user(dto: RegisterDto, db: AsyncSession):
     # await send_verification_email(conf, dto.email, '123456')
  
     #hash password
-    hashed_password = hash_password(dto.password)
+    hashed_password = await hash_password_async(dto.password)
 
     new_user = User(
         email=dto.email,
@@ -45,9 +77,6 @@ async def create_user(dto: RegisterDto, db: AsyncSession):
     await db.commit()
     await db.refresh(new_user)
 
-    # create session
-    token = create_access_token({"sub": str(new_user.id)})
-
     return RegisterResponse(
         user=UserResponse(
             id=new_user.id,
@@ -57,10 +86,8 @@ async def create_user(dto: RegisterDto, db: AsyncSession):
             pfp=new_user.pfp,
             created_at=new_user.created_at.isoformat()
         ),
-        token=TokenResponse(
-            access_token=token,
-            expires_at=""  # Example expiration date, should be dynamic
-        )
+        # create session
+        token=issue_tokens(new_user.id)
     )
 
 async def login_user(dto: LoginDto, db: AsyncSession):
@@ -68,14 +95,12 @@ async def login_user(dto: LoginDto, db: AsyncSession):
     result = await db.execute(query)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(dto.password, user.password):
+    if not user or not await verify_password_async(dto.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={
             "message": "Invalid email or password",
             "code": "401__AUTH__INVALID_CREDENTIALS"
         })
 
-    token = create_access_token({"sub": str(user.id)})
-
     return LoginResponse(
         user=UserResponse(
             id=user.id,
@@ -85,12 +110,58 @@ async def login_user(dto: LoginDto, db: AsyncSession):
             pfp=user.pfp,
             created_at=user.created_at.isoformat()
         ),
-        token=TokenResponse(
-            access_token=token,
-            expires_at=""  # Example expiration date, should be dynamic
-        )
+        token=issue_tokens(user.id)
     )
 
+async def refresh_session(dto: RefreshDto, db: AsyncSession):
+    """
+    Exchanges a refresh token for a new token pair. Refresh tokens are single use:
+    the presented one is revoked, so replaying it (e.g. a stolen copy) is rejected.
+    They are not in the in-process revocation list; revoked_tokens' primary key catches the reuse.
+    """
+    payload = decode_access_token(dto.refresh_token)
+
+    if (
+        not payload
+        or payload.get("typ") != REFRESH_TOKEN_TYPE
+        or "sub" not in payload
+        or "jti" not in payload
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={
+            "message": "Invalid refresh token",
+            "code": "401__AUTH__INVALID_REFRESH_TOKEN"
+        })
+
+    if not await revoke_token(db, payload["jti"], _token_expiry(payload)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={
+            "message": "Refresh token already used",
+            "code": "401__AUTH__REFRESH_TOKEN_REUSED"
+        })
+
+    return RefreshResponse(token=issue_tokens(payload["sub"]))
+
+async def logout(access_token: str, dto: LogoutDto, db: AsyncSession):
+    """
+    Revokes the access token of the request and, if given, the refresh token of the same user.
+    """
+    payload = decode_access_token(access_token)
+
+    if payload and "jti" in payload:
+        await revoke_token(db, payload["jti"], _token_expiry(payload))
+
+    if dto.refresh_token:
+        refresh = decode_access_token(dto.refresh_token)
+        if (
+            refresh
+            and refresh.get("typ") == REFRESH_TOKEN_TYPE
+            and "jti" in refresh
+            and payload
+            and refresh.get("sub") == payload.get("sub")
+        ):
+            await revoke_token(db, refresh["jti"], _token_expiry(refresh))
+
+    return {"message": "Successfully logged out."}
+
 async def session(user: User | None):
     if user is None:
         raise HTTPException(
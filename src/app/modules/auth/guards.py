@@ -6,12 +6,15 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.app.db.db import get_db
-from src.app.core.security import decode_access_token
+from src.app.db.db import get_db, LazySession
+from src.app.core.security import decode_access_token, REFRESH_TOKEN_TYPE
 
 
 from src.app.modules.users.users_model import User
 from src.app.modules.users.user_role_enum import RoleEnum
+from src.app.modules.users.users_cache import RequestUser, REQUEST_USER_COLUMNS, get_cached_user, cache_user
+
+from .revocation_svc import is_revoked
 
 
 class OptionalOAuth2Bearer(OAuth2PasswordBearer):
@@ -25,11 +28,13 @@ oauth2_optional_scheme = OptionalOAuth2Bearer(tokenUrl="/auth/swagger-login")
 
 async def get_request_user(
     token: Optional[str] = Depends(oauth2_optional_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User | None:
+    db: LazySession = Depends(get_db)
+) -> RequestUser | None:
     """
     Retrieves the current user based on the provided access token.
     If the token is invalid or the user does not exist, returns None.
+    Users are served from users_cache, so only a cache miss reaches the database.
+    Revoked tokens are rejected against the in-process revocation list, without a query.
     """
 
     if token is None:
@@ -37,23 +42,35 @@ async def get_request_user(
 
     payload = decode_access_token(token)
 
-    # if token is invalid
-    if not payload or "sub" not in payload:
+    # if token is invalid, revoked (logout) or a refresh token
+    if (
+        not payload
+        or "sub" not in payload
+        or payload.get("typ") == REFRESH_TOKEN_TYPE
+        or is_revoked(payload.get("jti"))
+    ):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
     user_id = payload["sub"]
 
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+
     try:
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        result = await db.execute(select(*REQUEST_USER_COLUMNS).where(User.id == user_id))
+        row = result.one_or_none()
 
-        if not user:
+        # read-only lookup: hand the connection back before the route runs
+        await db.release()
+
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="user not found while validating token"
             )
 
-        return user
+        return cache_user(row)
 
     except Exception as e:
         # 🔥 rollback si algo sale mal con la base de datos
@@ -71,7 +88,7 @@ def require_roles(*allowed_roles: Union[str, RoleEnum]) -> Callable:
     )
 
 
-    def role_checker(user: User = Depends(get_request_user)) -> User:
+    def role_checker(user: RequestUser = Depends(get_request_user)) -> RequestUser:
 
         if user is None:
             raise HTTPException(
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.config import settings
+from src.app.core.revocation import RevocationList
+from src.app.db.db import AsyncSessionLocal
+
+from .revoked_token_model import RevokedToken
+
+
+logger = logging.getLogger(__name__)
+
+# revoked_at is the transaction start time, so a slow transaction can commit a row older than
+# the last one we saw; re-reading a short window behind the watermark catches it (adds are idempotent)
+SYNC_OVERLAP = timedelta(seconds=30)
+PRUNE_INTERVAL_SECONDS = 60 * 60
+# only tokens expiring within this window are kept in process: access tokens, which get_request_user
+# checks on every request. Refresh tokens live for days; their reuse is caught by revoke_token's insert
+LOCAL_HORIZON = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES, seconds=60)
+
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
+_last_revoked_at: Optional[datetime] = None
+
+
+def is_revoked(jti: Optional[str]) -> bool:
+    return revocation_list.is_revoked(jti)
+
+
+async def revoke_token(db: AsyncSession, jti: str, expires_at: datetime) -> bool:
+    """
+    Persists the revocation. An access token is also applied to this worker right away, and other
+    workers pick it up on their next sync. Returns False if the token had already been revoked.
+    """
+    result = await db.execute(
+        insert(RevokedToken)
+        .values(jti=jti, expires_at=expires_at)
+        .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        .returning(RevokedToken.jti)
+    )
+    inserted = result.scalar_one_or_none() is not None
+    await db.commit()
+
+    if expires_at <= datetime.now(timezone.utc) + LOCAL_HORIZON:
+        revocation_list.add(jti, expires_at.timestamp())
+    return inserted
+
+
+async def sync_revocations(db: AsyncSession) -> int:
+    """
+    Loads access token revocations into the in-process list: every unexpired one on the first call,
+    only rows revoked since the previous call afterwards. Returns the number of rows read.
+    """
+    global _last_revoked_at
+
+    query = (
+        select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at)
+        .where(RevokedToken.expires_at > func.now(), RevokedToken.expires_at <= func.now() + LOCAL_HORIZON)
+    )
+    if _last_revoked_at is not None:
+        query = query.where(RevokedToken.revoked_at > _last_revoked_at - SYNC_OVERLAP)
+
+    rows = (await db.execute(query)).all()
+
+    for row in rows:
+        revocation_list.add(row.jti, row.expires_at.timestamp())
+        if _last_revoked_at is None or row.revoked_at > _last_revoked_at:
+            _last_revoked_at = row.revoked_at
+
+    return len(rows)
+
+
+async def delete_expired_revocations(db: AsyncSession) -> int:
+    result = await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= func.now()))
+    await db.commit()
+    return result.rowcount
+
+
+async def load_revocations() -> None:
+    """
+    Startup hook: fills the revocation list before the worker accepts requests.
+    """
+    async with AsyncSessionLocal() as session:
+        loaded = await sync_revocations(session)
+    logger.info("Loaded %d revoked token(s)", loaded)
+
+
+async def run_revocation_sync() -> None:
+    """
+    Background task: keeps the revocation list in step with revoked_tokens and drops expired entries.
+    """
+    last_prune = time.monotonic()
+
+    while True:
+        await asyncio.sleep(settings.REVOCATION_SYNC_SECONDS)
+
+        try:
+            async with AsyncSessionLocal() as session:
+                await sync_revocations(session)
+
+                if time.monotonic() - last_prune >= PRUNE_INTERVAL_SECONDS:
+                    await delete_expired_revocations(session)
+                    revocation_list.prune()
+                    last_prune = time.monotonic()
+
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # keep serving with the current list, the next round retries
+            logger.exception("Revocation list sync failed")
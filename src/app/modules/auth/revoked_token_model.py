@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, String, func, Index
+
+from src.app.db.base import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (
+        # workers poll for rows revoked since their last sync
+        Index("ix_revoked_tokens_revoked_at", "revoked_at"),
+    )
+
+    jti = Column(String(64), primary_key=True)
+    # once the token itself has expired the row is no longer needed
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,7 +1,15 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+PAGE_FIELD_DEPRECATION = "Deprecated: keyset pagination has no page numbers nor total count, always null. Use next_cursor"
+
 class PaginationMetadata(BaseModel):
-    items_per_page: int
-    total_items: int
-    current_page: int
-    total_pages: int
\ No newline at end of file
+    items_per_page: Optional[int] = Field(default=None, deprecated=True, description=PAGE_FIELD_DEPRECATION)
+    total_items: Optional[int] = Field(default=None, deprecated=True, description=PAGE_FIELD_DEPRECATION)
+    current_page: Optional[int] = Field(default=None, deprecated=True, description=PAGE_FIELD_DEPRECATION)
+    total_pages: Optional[int] = Field(default=None, deprecated=True, description=PAGE_FIELD_DEPRECATION)
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page, null when there are no more items"
+    )
@@ -0,0 +1,96 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+from .metadata_schema import PaginationMetadata
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(*values: Any, order: Optional[str] = None) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor.
+    A listing with several orderings passes the name of the one in use as `order`,
+    so its cursors are not accepted under another ordering.
+    """
+    raw = [v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v for v in values]
+    if order is not None:
+        raw.insert(0, order)
+    payload = json.dumps(raw, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type, order: Optional[str] = None) -> Tuple[Any, ...]:
+    """
+    Decodes a cursor produced by `encode_cursor` back into typed values.
+    Raises a 400 if the cursor was tampered with or belongs to another listing or ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+        if order is not None:
+            if not isinstance(raw, list) or not raw or raw[0] != order:
+                raise ValueError("cursor ordering mismatch")
+            raw = raw[1:]
+
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor arity mismatch")
+
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else UUID(v) if t is UUID else t(v)
+            for t, v in zip(types, raw)
+        )
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "Invalid pagination cursor",
+                "code": "400__INVALID_CURSOR"
+            }
+        )
+
+
+def apply_keyset(
+    query, columns: Sequence, cursor: Optional[str], limit: int, descending: bool = True, order: Optional[str] = None
+):
+    """
+    Orders `query` by `columns` and seeks past `cursor` using a row comparison,
+    so the database walks the matching index instead of skipping rows.
+    One extra row is fetched to know whether there is a next page.
+    """
+    if cursor is not None:
+        values = decode_cursor(cursor, *[c.type.python_type for c in columns], order=order)
+        keys, bounds = tuple_(*columns), tuple_(*values)
+        query = query.where(keys < bounds if descending else keys > bounds)
+
+    order = [c.desc() for c in columns] if descending else [c.asc() for c in columns]
+    return query.order_by(*order).limit(limit + 1)
+
+
+def split_page(rows: Sequence, limit: int, key, order: Optional[str] = None) -> Tuple[Sequence, Optional[str]]:
+    """
+    Trims the look-ahead row added by `apply_keyset` and builds the next cursor
+    from the sort key (`key(row)`) of the last row returned.
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    return page, encode_cursor(*key(page[-1]), order=order)
+
+
+def page_metadata(next_cursor: Optional[str]) -> PaginationMetadata:
+    """
+    Metadata of a keyset page. The page-number fields are left null: a keyset
+    listing has no page numbers nor total count, only the cursor of the next page.
+    """
+    return PaginationMetadata(next_cursor=next_cursor)
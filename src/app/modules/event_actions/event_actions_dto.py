@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class BulkRegisterItemDto(BaseModel):
+    email: str
+    role: str = "ATTENDEE"  # ATTENDEE | SPEAKER, validated per row
@@ -0,0 +1,20 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class WaitlistPositionResponse(BaseModel):
+    event_id: UUID
+    position: int  # 1 = next in line
+
+
+class BulkRegisterRowResult(BaseModel):
+    row: int
+    email: str
+    role: str
+    status: str  # registered | already_registered | user_not_found | event_full | invalid_role | duplicate
+
+
+class BulkRegisterResponse(BaseModel):
+    registered: int
+    results: List[BulkRegisterRowResult]
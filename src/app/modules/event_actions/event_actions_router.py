@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, List
+
+from fastapi import APIRouter, Body, Depends, File, HTTPException, UploadFile, status
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.app.db.db import get_db
+from src.app.db.db import get_db, get_read_db
 
 from src.app.modules.auth.guards import require_roles
 
@@ -14,6 +16,11 @@ from src.app.modules.events.event_attendees_model import EventAttendee
 from src.app.modules.users.user_role_enum import RoleEnum
 from src.app.modules.events.event_role_enum import EventRoleEnum
 from src.app.modules.events.event_status_enum import EventStatusEnum 
+from src.app.modules.events.events_cache import invalidate_events
+
+from . import event_actions_service as event_actions_svc
+from .event_actions_dto import BulkRegisterItemDto
+from .event_actions_responses import WaitlistPositionResponse, BulkRegisterResponse
 
 
 router = APIRouter(prefix="/event-actions", tags=["Events Actions"])
@@ -24,35 +31,7 @@ async def register_to_event(
     user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
     db: AsyncSession = Depends(get_db),
 ):
-    # Verifica si ya está registrado
-    result = await db.execute(
-        select(EventAttendee).where(EventAttendee.event_id == event_id, EventAttendee.user_id == user.id)
-    )
-
-    # obtiene el evento para verificar capacidad
-    event_result = await db.execute(select(Event).where(Event.id == event_id))
-    event = event_result.scalar_one_or_none()
-
-    existing = result.scalar_one_or_none()
-    
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "message": "You are already registered for this event.",
-                "code": "400__ALREADY_REGISTERED"
-            }
-        )
-
-    attendee = EventAttendee(
-        event_id=event_id,
-        user_id=user.id,
-        event_role=EventRoleEnum.ATTENDEE  # o lo que aplique
-    )
-
-    db.add(attendee)
-    await db.commit()
-
+    await event_actions_svc.register_to_event(event_id, user, EventRoleEnum.ATTENDEE, db)
     return {"message": "Successfully registered to event."}
 
 @router.post("/{event_id}/register-as-speaker", status_code=status.HTTP_201_CREATED)
@@ -61,32 +40,29 @@ async def register_to_event(
     user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
     db: AsyncSession = Depends(get_db),
 ):
-    # Verifica si ya está registrado
-    result = await db.execute(
-        select(EventAttendee).where(EventAttendee.event_id == event_id, EventAttendee.user_id == user.id)
-    )
-
-    existing = result.scalar_one_or_none()
-    
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "message": "You are already registered for this event.",
-                "code": "400__ALREADY_REGISTERED"
-            }
-        )
-
-    attendee = EventAttendee(
-        event_id=event_id,
-        user_id=user.id,
-        event_role=EventRoleEnum.SPEAKER  # o lo que aplique
-    )
+    await event_actions_svc.register_to_event(event_id, user, EventRoleEnum.SPEAKER, db)
+    return {"message": "Successfully registered to event."}
 
-    db.add(attendee)
-    await db.commit()
+@router.post("/{event_id}/bulk-register", status_code=status.HTTP_200_OK, response_model=BulkRegisterResponse)
+async def bulk_register(
+    event_id: UUID,
+    dto: Annotated[List[BulkRegisterItemDto], Body(title="Users to register", description="Emails and roles (ATTENDEE or SPEAKER)")],
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    res = await event_actions_svc.bulk_register(event_id, dto, user, db)
+    return res
 
-    return {"message": "Successfully registered to event."}
+@router.post("/{event_id}/bulk-register/csv", status_code=status.HTTP_200_OK, response_model=BulkRegisterResponse)
+async def bulk_register_csv(
+    event_id: UUID,
+    file: Annotated[UploadFile, File(description="CSV with an 'email' column and an optional 'role' column")],
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    items = event_actions_svc.parse_bulk_csv(await file.read())
+    res = await event_actions_svc.bulk_register(event_id, items, user, db)
+    return res
 
 @router.delete("/{event_id}/unregister", status_code=status.HTTP_200_OK)
 async def unregister_from_event(
@@ -94,20 +70,36 @@ async def unregister_from_event(
     user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(EventAttendee).where(EventAttendee.event_id == event_id, EventAttendee.user_id == user.id)
-    )
-    attendee = result.scalar_one_or_none()
-    if not attendee:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
-            "message": "You are not registered for this event.",
-            "code": "404__NOT_REGISTERED"
-        })
-
-    await db.delete(attendee)
-    await db.commit()
+    await event_actions_svc.unregister_from_event(event_id, user, db)
     return {"message": "Successfully unregistered from event."}
 
+@router.post("/{event_id}/waitlist", status_code=status.HTTP_201_CREATED, response_model=WaitlistPositionResponse)
+async def join_waitlist(
+    event_id: UUID,
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    res = await event_actions_svc.join_waitlist(event_id, user, db)
+    return res
+
+@router.delete("/{event_id}/waitlist", status_code=status.HTTP_200_OK)
+async def leave_waitlist(
+    event_id: UUID,
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_db),
+):
+    await event_actions_svc.leave_waitlist(event_id, user, db)
+    return {"message": "Successfully left the waitlist."}
+
+@router.get("/{event_id}/waitlist/position", response_model=WaitlistPositionResponse)
+async def read_waitlist_position(
+    event_id: UUID,
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+):
+    res = await event_actions_svc.waitlist_position(event_id, user, db)
+    return res
+
 @router.post("/{event_id}/complete", status_code=status.HTTP_200_OK)
 async def complete_event(
     event_id: UUID,
@@ -148,4 +140,5 @@ async def complete_event(
 
     event.status = EventStatusEnum.COMPLETED  # si usas Enum, usa el valor adecuado
     await db.commit()
+    invalidate_events(event_id)
     return {"message": "Event marked as completed."}
\ No newline at end of file
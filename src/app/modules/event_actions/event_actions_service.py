@@ -0,0 +1,480 @@
+import csv
+import io
+import uuid
+from typing import List
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from sqlalchemy import select, update, delete, func, exists, literal, any_, bindparam, cast, String
+from sqlalchemy.dialects.postgresql import insert, ARRAY, UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.modules.users.users_model import User
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_waitlist_model import EventWaitlistEntry
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.event_status_enum import EventStatusEnum
+from src.app.modules.events.events_cache import invalidate_events
+from src.app.modules.events.event_counters import counter_column, adjust_counter
+from src.app.modules.events.events_service import ensure_can_manage
+
+from .event_actions_dto import BulkRegisterItemDto
+from .event_actions_responses import WaitlistPositionResponse, BulkRegisterResponse, BulkRegisterRowResult
+
+
+BULK_REGISTER_MAX_ROWS = 50_000
+BULK_REGISTER_ROLES = {
+    EventRoleEnum.ATTENDEE.value: EventRoleEnum.ATTENDEE,
+    EventRoleEnum.SPEAKER.value: EventRoleEnum.SPEAKER,
+}
+
+
+async def register_to_event(event_id: UUID, user: User, role: EventRoleEnum, db: AsyncSession) -> None:
+    """
+    Registers the user to the event with the given role in one round trip.
+
+    The INSERT ... ON CONFLICT DO NOTHING and the counter UPDATE run as CTEs of a single
+    statement. For attendees the UPDATE only matches while attendees_count < attendees_capacity,
+    so a seat is reserved atomically: Postgres re-checks the condition after waiting on the row
+    lock, and once the event is sold out the row no longer matches and nobody waits on it.
+    """
+    column = counter_column(role)
+
+    inserted = (
+        insert(EventAttendee)
+        .values(id=uuid.uuid4(), event_id=event_id, user_id=user.id, event_role=role)
+        .on_conflict_do_nothing(constraint="uq_event_attendees_event_id_user_id")
+        .returning(EventAttendee.event_id)
+        .cte("inserted")
+    )
+
+    seat = update(Event).where(Event.id.in_(select(inserted.c.event_id)))
+    if role == EventRoleEnum.ATTENDEE:
+        seat = seat.where(Event.attendees_count < Event.attendees_capacity)
+
+    seat = (
+        seat
+        .values({column: column + 1})
+        .returning(Event.id)
+        .cte("seat")
+    )
+
+    stmt = select(
+        select(func.count()).select_from(inserted).scalar_subquery(),
+        select(func.count()).select_from(seat).scalar_subquery(),
+    )
+
+    try:
+        result = await db.execute(stmt)
+        inserted_count, seated_count = result.one()
+    except IntegrityError:
+        # foreign key violation: the event does not exist
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "Event not found.",
+            "code": "404__EVENT__NOT_FOUND"
+        })
+
+    if inserted_count == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "You are already registered for this event.",
+                "code": "400__ALREADY_REGISTERED"
+            }
+        )
+
+    if seated_count == 0:
+        # the row was inserted but no seat was left: undo the insert
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "This event is full. You can join the waitlist.",
+                "code": "409__EVENT__FULL"
+            }
+        )
+
+    await db.commit()
+    invalidate_events(event_id)
+
+
+async def unregister_from_event(event_id: UUID, user: User, db: AsyncSession) -> None:
+    """
+    Removes the user's registration. A freed attendee seat goes to the head of the
+    waitlist in the same transaction, so the counter only drops when nobody is waiting.
+    Completed or cancelled events do not promote anyone.
+    """
+    result = await db.execute(
+        delete(EventAttendee)
+        .where(EventAttendee.event_id == event_id, EventAttendee.user_id == user.id)
+        .returning(EventAttendee.event_role)
+    )
+    role = result.scalar_one_or_none()
+
+    if role is None:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "You are not registered for this event.",
+            "code": "404__NOT_REGISTERED"
+        })
+
+    promoted = None
+    if role == EventRoleEnum.ATTENDEE:
+        # serializes with join_waitlist, which takes the same lock: a join that committed first
+        # is in the queue read below, a later one sees the freed seat and is turned away
+        event_status = await db.scalar(
+            select(Event.status).where(Event.id == event_id).with_for_update(key_share=True)
+        )
+        if event_status == EventStatusEnum.INCOMING:
+            promoted = await _promote_from_waitlist(event_id, db)
+
+    if promoted is None:
+        await adjust_counter(db, event_id, role, -1)
+
+    await db.commit()
+    invalidate_events(event_id)
+
+
+async def _promote_from_waitlist(event_id: UUID, db: AsyncSession) -> UUID | None:
+    """
+    Pops the head of the event's waitlist and registers it as attendee; the caller holds the event row lock.
+    Each pop is an index lookup on (event_id, position); SKIP LOCKED passes over an entry that
+    leave_waitlist is deleting instead of waiting on it.
+    Returns the promoted user id, or None when the waitlist is empty.
+    """
+    head = (
+        select(EventWaitlistEntry.id)
+        .where(EventWaitlistEntry.event_id == event_id)
+        .order_by(EventWaitlistEntry.position)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    while True:
+        result = await db.execute(
+            delete(EventWaitlistEntry)
+            .where(EventWaitlistEntry.id == head)
+            .returning(EventWaitlistEntry.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+
+        if user_id is None:
+            return None
+
+        result = await db.execute(
+            insert(EventAttendee)
+            .values(id=uuid.uuid4(), event_id=event_id, user_id=user_id, event_role=EventRoleEnum.ATTENDEE)
+            .on_conflict_do_nothing(constraint="uq_event_attendees_event_id_user_id")
+            .returning(EventAttendee.user_id)
+        )
+
+        # users that registered some other way meanwhile just leave the queue
+        if result.scalar_one_or_none() is not None:
+            return user_id
+
+
+async def join_waitlist(event_id: UUID, user: User, db: AsyncSession) -> WaitlistPositionResponse:
+    """
+    Appends the user to the event's waitlist. Only allowed while the event is full
+    and the user is not registered to it.
+
+    The event row is locked first, as unregister_from_event does before promoting, so the
+    insert's check reads the counter after any unregister that got there first.
+    """
+    await db.execute(select(Event.id).where(Event.id == event_id).with_for_update(key_share=True))
+
+    already_registered = exists().where(
+        EventAttendee.event_id == event_id,
+        EventAttendee.user_id == user.id,
+    )
+
+    result = await db.execute(
+        insert(EventWaitlistEntry)
+        .from_select(
+            ["id", "event_id", "user_id"],
+            select(literal(uuid.uuid4()), Event.id, literal(user.id))
+            .where(
+                Event.id == event_id,
+                Event.attendees_count >= Event.attendees_capacity,
+                ~already_registered,
+            )
+        )
+        .on_conflict_do_nothing(constraint="uq_event_waitlist_event_id_user_id")
+        .returning(EventWaitlistEntry.id)
+    )
+
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
+        await _raise_waitlist_rejection(event_id, user, db)
+
+    await db.commit()
+
+    return await waitlist_position(event_id, user, db)
+
+
+async def _raise_waitlist_rejection(event_id: UUID, user: User, db: AsyncSession):
+    # only runs when the insert was rejected, to tell the client why
+    event = (await db.execute(select(Event).where(Event.id == event_id))).scalar_one_or_none()
+
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "Event not found.",
+            "code": "404__EVENT__NOT_FOUND"
+        })
+
+    registered = await db.scalar(
+        select(EventAttendee.id).where(EventAttendee.event_id == event_id, EventAttendee.user_id == user.id)
+    )
+    if registered:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+            "message": "You are already registered for this event.",
+            "code": "400__ALREADY_REGISTERED"
+        })
+
+    if event.attendees_count < event.attendees_capacity:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+            "message": "This event still has seats available.",
+            "code": "400__EVENT__NOT_FULL"
+        })
+
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+        "message": "You are already on the waitlist for this event.",
+        "code": "400__ALREADY_WAITLISTED"
+    })
+
+
+async def leave_waitlist(event_id: UUID, user: User, db: AsyncSession) -> None:
+    result = await db.execute(
+        delete(EventWaitlistEntry)
+        .where(EventWaitlistEntry.event_id == event_id, EventWaitlistEntry.user_id == user.id)
+        .returning(EventWaitlistEntry.id)
+    )
+
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "You are not on the waitlist for this event.",
+            "code": "404__NOT_WAITLISTED"
+        })
+
+    await db.commit()
+
+
+async def waitlist_position(event_id: UUID, user: User, db: AsyncSession) -> WaitlistPositionResponse:
+    """
+    Position of the user in the event's waitlist, counted over the (event_id, position) index.
+    """
+    own_position = (
+        select(EventWaitlistEntry.position)
+        .where(EventWaitlistEntry.event_id == event_id, EventWaitlistEntry.user_id == user.id)
+        .scalar_subquery()
+    )
+
+    position = await db.scalar(
+        select(func.count())
+        .select_from(EventWaitlistEntry)
+        .where(EventWaitlistEntry.event_id == event_id, EventWaitlistEntry.position <= own_position)
+    )
+
+    if not position:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "You are not on the waitlist for this event.",
+            "code": "404__NOT_WAITLISTED"
+        })
+
+    return WaitlistPositionResponse(event_id=event_id, position=position)
+
+
+def parse_bulk_csv(content: bytes) -> List[BulkRegisterItemDto]:
+    """
+    Reads `email[,role]` rows from an uploaded spreadsheet export.
+    """
+    try:
+        reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
+        fields = [f.strip().lower() for f in reader.fieldnames or []]
+    except UnicodeDecodeError:
+        fields = []
+
+    if "email" not in fields:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+            "message": "The CSV must be UTF-8 and have an 'email' column (and optionally 'role').",
+            "code": "400__BULK__INVALID_CSV"
+        })
+
+    reader.fieldnames = fields
+    return [
+        BulkRegisterItemDto(email=(r.get("email") or "").strip(), role=(r.get("role") or "ATTENDEE").strip())
+        for r in reader
+    ]
+
+
+async def bulk_register(
+    event_id: UUID,
+    items: List[BulkRegisterItemDto],
+    user: User,
+    db: AsyncSession
+) -> BulkRegisterResponse:
+    """
+    Registers a list of users (by email) as attendees or speakers of an event.
+
+    Users are resolved in one query and rows are loaded with one INSERT ... SELECT FROM unnest(...)
+    ON CONFLICT DO NOTHING, whatever the number of rows. Attendees beyond capacity are
+    reported as event_full, speakers are not limited.
+
+    Locks are taken in the order register_to_event takes them, so the two can't deadlock:
+    the registrations first, then the event row (FOR NO KEY UPDATE, like the seat UPDATE).
+    Holding it, the remaining seats are counted and the attendees that did not fit are removed.
+    """
+    if len(items) > BULK_REGISTER_MAX_ROWS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={
+            "message": f"At most {BULK_REGISTER_MAX_ROWS} rows per request.",
+            "code": "400__BULK__TOO_MANY_ROWS"
+        })
+
+    await ensure_can_manage(event_id, user, db)
+
+    statuses = [None] * len(items)
+    roles = [BULK_REGISTER_ROLES.get(item.role.strip().upper()) for item in items]
+
+    seen = set()
+    for i, item in enumerate(items):
+        if roles[i] is None:
+            statuses[i] = "invalid_role"
+        elif item.email in seen:
+            statuses[i] = "duplicate"
+        else:
+            seen.add(item.email)
+
+    result = await db.execute(
+        select(User.email, User.id)
+        .where(User.email == any_(bindparam("emails", list(seen), type_=ARRAY(String))))
+    )
+    user_ids = dict(result.all())
+
+    pending = []
+    for i, item in enumerate(items):
+        if statuses[i] is not None:
+            continue
+
+        if item.email in user_ids:
+            pending.append(i)
+        else:
+            statuses[i] = "user_not_found"
+
+    inserted = {}
+    try:
+        if pending:
+            inserted = await _insert_registrations(
+                event_id,
+                [user_ids[items[i].email] for i in pending],
+                [roles[i] for i in pending],
+                db
+            )
+
+        # the event may have been deleted since ensure_can_manage
+        event = (await db.execute(
+            select(Event.attendees_count, Event.attendees_capacity)
+            .where(Event.id == event_id)
+            .with_for_update(key_share=True)
+        )).one_or_none()
+    except IntegrityError:
+        # foreign key violation on insert: same as the event row being gone
+        event = None
+
+    if event is None:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={
+            "message": "Event not found.",
+            "code": "404__EVENT__NOT_FOUND"
+        })
+
+    seats = max(event.attendees_capacity - event.attendees_count, 0)
+    over_capacity = []
+
+    # seats go to the rows in file order
+    for i in pending:
+        uid = user_ids[items[i].email]
+
+        if uid not in inserted:
+            # registered before, or by a concurrent registration that won the unique constraint
+            statuses[i] = "already_registered"
+        elif roles[i] == EventRoleEnum.ATTENDEE and seats == 0:
+            statuses[i] = "event_full"
+            over_capacity.append(uid)
+            del inserted[uid]
+        else:
+            seats -= roles[i] == EventRoleEnum.ATTENDEE
+            statuses[i] = "registered"
+
+    if over_capacity:
+        await db.execute(
+            delete(EventAttendee)
+            .where(
+                EventAttendee.event_id == event_id,
+                EventAttendee.user_id == any_(bindparam("over_capacity", over_capacity, type_=ARRAY(PG_UUID(as_uuid=True))))
+            )
+        )
+
+    attendees = sum(1 for role in inserted.values() if role == EventRoleEnum.ATTENDEE)
+    speakers = len(inserted) - attendees
+
+    if inserted:
+        await db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(
+                attendees_count=Event.attendees_count + attendees,
+                speakers_count=Event.speakers_count + speakers,
+            )
+        )
+
+    await db.commit()
+    invalidate_events(event_id)
+
+    return BulkRegisterResponse(
+        registered=len(inserted),
+        results=[
+            BulkRegisterRowResult(row=i + 1, email=item.email, role=item.role, status=statuses[i])
+            for i, item in enumerate(items)
+        ]
+    )
+
+
+async def _insert_registrations(event_id: UUID, user_ids: List[UUID], roles: List[EventRoleEnum], db: AsyncSession) -> dict:
+    """
+    Multi-row INSERT fed by unnest() over three array parameters, so the statement
+    size and parameter count stay constant however many rows are loaded.
+    Rows go in user id order, so concurrent loads into one event wait on each other's
+    unique index entries in the same order instead of deadlocking.
+    Returns {user_id: role} for the rows actually inserted.
+    """
+    ordered = sorted(zip(user_ids, roles), key=lambda row: row[0])
+
+    rows = func.unnest(
+        bindparam("ids", [uuid.uuid4() for _ in ordered], type_=ARRAY(PG_UUID(as_uuid=True))),
+        bindparam("user_ids", [uid for uid, _ in ordered], type_=ARRAY(PG_UUID(as_uuid=True))),
+        bindparam("roles", [role.value for _, role in ordered], type_=ARRAY(String)),
+    ).table_valued("id", "user_id", "event_role").render_derived()
+
+    result = await db.execute(
+        insert(EventAttendee)
+        .from_select(
+            ["id", "event_id", "user_id", "event_role"],
+            select(
+                rows.c.id,
+                literal(event_id, PG_UUID(as_uuid=True)),
+                rows.c.user_id,
+                cast(rows.c.event_role, EventAttendee.__table__.c.event_role.type),
+            )
+        )
+        .on_conflict_do_nothing(constraint="uq_event_attendees_event_id_user_id")
+        .returning(EventAttendee.user_id, EventAttendee.event_role)
+    )
+
+    return dict(result.all())
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Annotated
+from typing import List, Annotated, Optional
 
-from src.app.db.db import get_db
+from src.app.core.responses import FastJSONResponse
+from src.app.db.db import get_read_db
 from src.app.modules.auth.guards import require_roles
+from src.app.modules.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.app.modules.users.user_role_enum import RoleEnum
 
 from src.app.modules.users.users_model import User
@@ -17,16 +19,18 @@ router = APIRouter(prefix="/user-events", tags=["user-events"])
 
 @router.get("/attending", response_model=ListAttendingEventsResponse)
 async def list_attending_events(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_id: Annotated[str, Query(description="User ID to filter by")] = None,
-    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN))
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    cursor: Annotated[Optional[str], Query(description="Cursor returned as metadata.next_cursor by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of events to return")] = DEFAULT_PAGE_SIZE,
 ):
-    res = await event_attendees_svc.list_attending_events(db, user_id)
-    return res
+    res = await event_attendees_svc.list_attending_events(db, user_id, cursor, limit)
+    return FastJSONResponse(res)
 
 @router.get("/attending/ids", response_model=List[str])
 async def list_attending_event_ids(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     event_ids: Annotated[List[str], Query(description="List of event IDs to filter by")] = [],
     user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN))
 ):
@@ -35,9 +39,11 @@ async def list_attending_event_ids(
 
 @router.get("/created", response_model=ListCreatedEventsResponse)
 async def list_created_events(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_id: Annotated[str, Query(description="User ID to filter by")] = None,
-    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN))
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    cursor: Annotated[Optional[str], Query(description="Cursor returned as metadata.next_cursor by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of events to return")] = DEFAULT_PAGE_SIZE,
 ):
-    res = await event_attendees_svc.list_created_events(db, user_id)
-    return res
+    res = await event_attendees_svc.list_created_events(db, user_id, cursor, limit)
+    return FastJSONResponse(res)
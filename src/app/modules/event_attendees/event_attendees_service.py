@@ -1,8 +1,7 @@
-from typing import List
+from typing import List, Optional
 
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select
 
 from src.app.db.db import  AsyncSession
 
@@ -13,92 +12,46 @@ from src.app.modules.events.event_attendees_model import EventAttendee, EventRol
 from src.app.modules.events.event_role_enum import EventRoleEnum
 
 from src.app.modules.events.events_model import Event
+from src.app.modules.events.events_projection import event_list_query, row_key, event_base_dict
 from src.app.modules.users.users_model import User
 
 
-from src.app.modules.common.metadata_schema import PaginationMetadata
-from .event_attendees_responses import (ListAttendingEventsResponse, ListCreatedEventsResponse, EventBaseResponse)
+from src.app.modules.common.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page, page_metadata
 
-from .event_attendees_responses import ListAttendingEventsResponse
+# Ordering names written into the cursors: attending goes oldest first and created newest first,
+# so a cursor of one listing gets a 400 in the other instead of seeking the wrong way.
+ATTENDING_ORDER = "created_at_asc"
+CREATED_ORDER = "created_at_desc"
 
 async def list_attending_events(
     db: AsyncSession,
     user_id: str,
-) -> ListAttendingEventsResponse:
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> dict:
     
     result = await db.execute(
-        select(Event)
-        .join(EventAttendee)
-        .options(joinedload(Event.attendees))  # optional, preload attendees if needed
-        .where(
-            EventAttendee.user_id == user_id,
-            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
+        apply_keyset(
+            event_list_query()
+            .join(EventAttendee, EventAttendee.event_id == Event.id)
+            .where(
+                EventAttendee.user_id == user_id,
+                EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
+            ),
+            (Event.created_at, Event.id),
+            cursor,
+            limit,
+            descending=False,
+            order=ATTENDING_ORDER,
         )
-        .order_by(Event.created_at)
     )
 
+    rows, next_cursor = split_page(result.all(), limit, row_key, order=ATTENDING_ORDER)
 
-    events = result.unique().scalars().all()
-
-    if len(events) == 0:
-        return ListAttendingEventsResponse(
-            events=[],
-            metadata=PaginationMetadata(
-                items_per_page=0,
-                total_items=0,
-                current_page=1,
-                total_pages=1
-            )
-        )
-
-    event_ids = [e.id for e in events]
-
-    # Count attendees/speakers grouped by (event_id, role)
-    counts_result = await db.execute(
-        select(
-            EventAttendee.event_id,
-            EventAttendee.event_role,
-            func.count().label("count")
-        ).where(
-            EventAttendee.event_id.in_(event_ids),
-            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
-        ).group_by(EventAttendee.event_id, EventAttendee.event_role)
-    )
-
-    counts_map = {}
-    for event_id, role, count in counts_result.all():
-        if event_id not in counts_map:
-            counts_map[event_id] = {EventRoleEnum.ATTENDEE: 0, EventRoleEnum.SPEAKER: 0}
-        counts_map[event_id][role] = count
-
-    return ListAttendingEventsResponse(
-        events=[
-            EventBaseResponse(
-                id=e.id,
-                title=e.title,
-                subtitle=e.subtitle,
-                image=e.image,
-                country=e.country,
-                city=e.city,
-                address=e.address,
-                start_date=e.start_date,
-                end_date=e.end_date,
-                website=e.website,
-                attendees_capacity=e.attendees_capacity,
-                attendees=counts_map.get(e.id, {}).get(EventRoleEnum.ATTENDEE, 0),
-                speakers=counts_map.get(e.id, {}).get(EventRoleEnum.SPEAKER, 0),
-                created_at=e.created_at,
-                status=e.status
-            )
-            for e in events
-        ],
-        metadata=PaginationMetadata(
-            items_per_page=len(events),
-            total_items=len(events),
-            current_page=1,
-            total_pages=1
-        )
-    )
+    return {
+        "events": [event_base_dict(r) for r in rows],
+        "metadata": page_metadata(next_cursor).model_dump(),
+    }
 
 async def list_attending_ids(
     db: AsyncSession,
@@ -132,80 +85,29 @@ async def list_attending_ids(
 
 async def list_created_events(
     db: AsyncSession,
-    user_id: str
-) -> ListCreatedEventsResponse:
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> dict:
     
     result = await db.execute(
-        select(Event)
-        .join(EventAttendee)
-        .options(joinedload(Event.attendees))  # si quieres traer los asistentes
-        .where(
-            EventAttendee.user_id == user_id,
-            EventAttendee.event_role == EventRoleEnum.ORGANIZER
+        apply_keyset(
+            event_list_query()
+            .join(EventAttendee, EventAttendee.event_id == Event.id)
+            .where(
+                EventAttendee.user_id == user_id,
+                EventAttendee.event_role == EventRoleEnum.ORGANIZER
+            ),
+            (Event.created_at, Event.id),
+            cursor,
+            limit,
+            order=CREATED_ORDER,
         )
-        .order_by(Event.created_at.desc())
     )
 
-    events = result.unique().scalars().all()
-
-    print(f"------------------Found {len(events)} created events for user {user_id}")
-
-    if len(events) == 0:
-        return ListCreatedEventsResponse(
-            events=[],
-            metadata=PaginationMetadata(
-                items_per_page=0,
-                total_items=0,
-                current_page=1,
-                total_pages=1
-            )
-        )
-
-    event_ids = [e.id for e in events]
-
-    # Count attendees/speakers grouped by (event_id, role)
-    counts_result = await db.execute(
-        select(
-            EventAttendee.event_id,
-            EventAttendee.event_role,
-            func.count().label("count")
-        ).where(
-            EventAttendee.event_id.in_(event_ids),
-            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
-        ).group_by(EventAttendee.event_id, EventAttendee.event_role)
-    )
+    rows, next_cursor = split_page(result.all(), limit, row_key, order=CREATED_ORDER)
 
-    counts_map = {}
-    for event_id, role, count in counts_result.all():
-        if event_id not in counts_map:
-            counts_map[event_id] = {EventRoleEnum.ATTENDEE: 0, EventRoleEnum.SPEAKER: 0}
-        counts_map[event_id][role] = count
-
-    return ListCreatedEventsResponse(
-        events=[
-            EventBaseResponse(
-                id=e.id,
-                title=e.title,
-                subtitle=e.subtitle,
-                image=e.image,
-                country=e.country,
-                city=e.city,
-                address=e.address,
-                start_date=e.start_date,
-                end_date=e.end_date,
-                website=e.website,
-                attendees_capacity=e.attendees_capacity,
-                attendees=counts_map.get(e.id, {}).get(EventRoleEnum.ATTENDEE, 0),
-                speakers=counts_map.get(e.id, {}).get(EventRoleEnum.SPEAKER, 0),
-                created_at=e.created_at,
-                status=e.status
-            )
-            for e in events
-        ],
-        metadata=PaginationMetadata(
-            items_per_page=len(events),
-            total_items=len(events),
-            current_page=1,
-            total_pages=1
-        )
-    )
\ No newline at end of file
+    return {
+        "events": [event_base_dict(r) for r in rows],
+        "metadata": page_metadata(next_cursor).model_dump(),
+    }
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import Enum
 from sqlalchemy.orm import relationship
@@ -13,6 +13,11 @@ from .event_status_enum import EventStatusEnum
 
 class EventAttendee(Base):
     __tablename__ = "event_attendees"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_event_attendees_event_id_user_id"),
+        Index("ix_event_attendees_event_id_event_role", "event_id", "event_role"),
+        Index("ix_event_attendees_user_id_event_role", "user_id", "event_role"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(
@@ -0,0 +1,88 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, update, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .events_model import Event
+from .event_attendees_model import EventAttendee
+from .event_role_enum import EventRoleEnum
+
+# events locked and recounted per transaction by reconcile_counters
+RECONCILE_BATCH_SIZE = 1000
+
+
+def counter_column(role: EventRoleEnum):
+    """
+    Returns the Event counter that tracks `role`, or None for roles that are not counted.
+    """
+    if role == EventRoleEnum.ATTENDEE:
+        return Event.attendees_count
+    if role == EventRoleEnum.SPEAKER:
+        return Event.speakers_count
+    return None
+
+
+async def adjust_counter(db: AsyncSession, event_id: UUID, role: EventRoleEnum, delta: int) -> None:
+    """
+    Adds `delta` to the counter of `role` on the event row.
+    Runs inside the caller's transaction, so it commits or rolls back with the registration itself.
+    """
+    column = counter_column(role)
+    if column is None:
+        return
+
+    await db.execute(
+        update(Event)
+        .where(Event.id == event_id)
+        .values({column: column + delta})
+    )
+
+
+def _count(role: EventRoleEnum):
+    return (
+        select(func.count())
+        .where(EventAttendee.event_id == Event.id, EventAttendee.event_role == role)
+        .scalar_subquery()
+    )
+
+
+async def reconcile_counters(db: AsyncSession, event_id: Optional[UUID] = None,
+                             batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """
+    Recomputes attendees_count/speakers_count from event_attendees and fixes any row that drifted.
+    Returns the number of events that were corrected.
+
+    Events are locked (FOR NO KEY UPDATE, as the counter updates themselves) in batches before
+    they are counted, each batch in its own transaction. The counts run in a later statement, so
+    under READ COMMITTED they see every registration committed before the lock was granted, and
+    a registration still in flight waits and applies its own +1/-1 on top of the fixed value.
+    """
+    attendees, speakers = _count(EventRoleEnum.ATTENDEE), _count(EventRoleEnum.SPEAKER)
+    fixed = 0
+    last_id = None
+
+    while True:
+        batch = select(Event.id).order_by(Event.id).limit(batch_size).with_for_update(key_share=True)
+        if event_id is not None:
+            batch = batch.where(Event.id == event_id)
+        if last_id is not None:
+            batch = batch.where(Event.id > last_id)
+
+        ids = (await db.execute(batch)).scalars().all()
+        if not ids:
+            return fixed
+
+        result = await db.execute(
+            update(Event)
+            .where(
+                Event.id.in_(ids),
+                or_(Event.attendees_count != attendees, Event.speakers_count != speakers),
+            )
+            .values(attendees_count=attendees, speakers_count=speakers)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        fixed += result.rowcount
+        last_id = ids[-1]
@@ -0,0 +1,30 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, func, ForeignKey, BigInteger, Identity, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.app.db.base import Base
+
+
+class EventWaitlistEntry(Base):
+    __tablename__ = "event_waitlist"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_event_waitlist_event_id_user_id"),
+        # head of the queue is the lowest position of an event
+        Index("ix_event_waitlist_event_id_position", "event_id", "position"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+    )
+    event_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('events.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    # monotonically increasing, never renumbered: dequeues do not shift the rest of the queue
+    position = Column(BigInteger, Identity(always=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,92 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Optional, Union
+from uuid import UUID
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from src.app.core.cache import TTLCache
+from src.app.core.responses import render_json
+from src.app.core.metrics import register_cache
+from src.app.core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    content: bytes  # rendered JSON, so hits skip serialization entirely
+    etag: str
+
+
+# keyed by the full set of query parameters of each read
+list_cache = TTLCache(maxsize=settings.EVENTS_CACHE_MAX_ENTRIES, ttl=settings.EVENTS_CACHE_TTL_SECONDS)
+detail_cache = TTLCache(maxsize=settings.EVENTS_CACHE_MAX_ENTRIES, ttl=settings.EVENTS_CACHE_TTL_SECONDS)
+register_cache("events_list", list_cache)
+register_cache("events_detail", detail_cache)
+
+# bumped by invalidate_events; a load that started before a bump may hold pre-write data
+_generation = 0
+# time.monotonic() of the last invalidate_events, replicas may lag behind it
+_invalidated_at = float("-inf")
+
+
+async def cached(
+    cache: TTLCache,
+    key: Hashable,
+    loader: Callable[[], Awaitable[Union[BaseModel, dict]]],
+    replica: bool = False,
+) -> CachedResponse:
+    """
+    Returns the cached response for `key`, calling `loader` (and hitting the DB) only on a miss.
+    A result that may predate a write is returned but not stored, since it would otherwise be
+    served until the TTL runs out: the events were invalidated while it loaded, or it was read
+    from a replica (`replica`) within READ_YOUR_WRITES_SECONDS of an invalidation.
+    """
+    entry = cache.get(key)
+
+    if entry is None:
+        generation = _generation
+        content = render_json(await loader())
+        digest = hashlib.sha1(content).hexdigest()
+        entry = CachedResponse(content=content, etag=f'"{digest}"')
+        replica_may_lag = replica and time.monotonic() - _invalidated_at < settings.READ_YOUR_WRITES_SECONDS
+        if generation == _generation and not replica_may_lag:
+            cache.set(key, entry)
+
+    return entry
+
+
+def conditional_response(request: Request, entry: CachedResponse, private: bool = False) -> Response:
+    """
+    The cached body with ETag/Cache-Control, or a 304 when the client already has this version.
+    """
+    cache_control = (
+        f"{'private' if private else 'public'}, "
+        f"max-age={int(settings.EVENTS_CACHE_TTL_SECONDS)}, "
+        f"stale-while-revalidate={settings.EVENTS_CACHE_STALE_WHILE_REVALIDATE_SECONDS}"
+    )
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if entry.etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=entry.content, media_type="application/json", headers=headers)
+
+
+def invalidate_events(event_id: Optional[UUID] = None) -> None:
+    """
+    Drops cached reads after a write. Any list page may contain the event, so all of them go.
+    Only this worker's caches are cleared: the others serve their copies until they expire.
+    """
+    global _generation, _invalidated_at
+    _generation += 1
+    _invalidated_at = time.monotonic()
+
+    list_cache.clear()
+
+    if event_id is not None:
+        detail_cache.pop(event_id)
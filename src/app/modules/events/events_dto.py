@@ -4,6 +4,8 @@ from pydantic import BaseModel, field_validator
 
 from datetime import datetime
 
+from .event_status_enum import EventStatusEnum
+
 class CreateEventDto(BaseModel):
     title: str
     subtitle: str
@@ -24,4 +26,17 @@ class CreateEventDto(BaseModel):
         try:
             return datetime.strptime(value, "%m/%d/%Y")
         except ValueError:
-            raise ValueError("La fecha debe tener el formato MM/DD/AAAA")
\ No newline at end of file
+            raise ValueError("La fecha debe tener el formato MM/DD/AAAA")
+
+
+class EventFiltersDto(BaseModel):
+    country: Optional[str] = None
+    city: Optional[str] = None
+    status: Optional[EventStatusEnum] = None
+    start_after: Optional[datetime] = None
+    start_before: Optional[datetime] = None
+    upcoming: bool = False  # only INCOMING events that have not started, soonest first
+
+    @property
+    def by_start_date(self) -> bool:
+        return self.upcoming or self.start_after is not None or self.start_before is not None
@@ -1,15 +1,38 @@
 import uuid
 
-from sqlalchemy import Column, String, DateTime, func,  Integer, Enum
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, func,  Integer, Enum, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 
 from src.app.db.base import Base
 
 from .event_status_enum import EventStatusEnum
 
+SEARCH_CONFIG = "spanish"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, title), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, subtitle), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, city), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, description), 'C')"
+)
+
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # keyset pagination walks events by (created_at, id)
+        Index("ix_events_created_at_id", "created_at", "id"),
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        # /events/list filters, each ending in the keyset sort key
+        Index("ix_events_country_created_at_id", "country", "created_at", "id"),
+        Index("ix_events_city_created_at_id", "city", "created_at", "id"),
+        Index("ix_events_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_events_start_date_id", "start_date", "id"),
+        Index(
+            "ix_events_incoming_start_date_id", "start_date", "id",
+            postgresql_where=text("status = 'INCOMING'")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String, index=True, nullable=False)
@@ -26,10 +49,18 @@ class Event(Base):
     website = Column(String, nullable=True)
 
     attendees_capacity = Column(Integer, nullable=False)
+
+    # denormalized counters, kept in sync by event_counters
+    attendees_count = Column(Integer, nullable=False, default=0, server_default="0")
+    speakers_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     status = Column(Enum(EventStatusEnum), nullable=False, default=EventStatusEnum.INCOMING)
 
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
+    # full-text document maintained by Postgres, only read by the search query
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
+
     attendees = relationship(
         "EventAttendee",
         back_populates="event",
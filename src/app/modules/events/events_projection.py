@@ -0,0 +1,62 @@
+from sqlalchemy import select
+
+from .events_model import Event
+
+
+# only the columns EventBaseResponse needs: no description, no attendee rows
+EVENT_LIST_COLUMNS = (
+    Event.id,
+    Event.title,
+    Event.subtitle,
+    Event.image,
+    Event.country,
+    Event.city,
+    Event.address,
+    Event.start_date,
+    Event.end_date,
+    Event.website,
+    Event.attendees_capacity,
+    Event.attendees_count,
+    Event.speakers_count,
+    Event.status,
+    Event.created_at,
+)
+
+
+def event_list_query():
+    """
+    Base statement for every event listing. Rows come back as plain tuples
+    instead of hydrated ORM objects.
+    """
+    return select(*EVENT_LIST_COLUMNS)
+
+
+def row_key(row):
+    """
+    Keyset sort key of a listing row.
+    """
+    return row.created_at, row.id
+
+
+def event_base_dict(row) -> dict:
+    """
+    A listing row shaped as EventBaseResponse. The row already has the right types,
+    so listings render these dicts straight to JSON instead of validating a model per row.
+    """
+    return {
+        "id": row.id,
+        "title": row.title,
+        "subtitle": row.subtitle,
+        "image": row.image,
+        "country": row.country,
+        "city": row.city,
+        "address": row.address,
+        "start_date": row.start_date,
+        "end_date": row.end_date,
+        "website": row.website,
+        "attendees_capacity": row.attendees_capacity,
+        "attendees": row.attendees_count,
+        "speakers": row.speakers_count,
+        "status": row.status,
+        "created_at": row.created_at,
+    }
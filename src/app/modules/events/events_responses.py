@@ -64,7 +64,6 @@ class EventDetailResponse(EventBaseResponse):
 
     attendees_capacity: int
 
-    attendees_list: List[AttendeeDetail]
     host: AttendeeHost
 
     status: EventStatusEnum
@@ -76,6 +75,11 @@ class ListEvenstResponse(BaseModel):
     metadata: PaginationMetadata
 
 
+class ListEventAttendeesResponse(BaseModel):
+    attendees: List[AttendeeDetail]
+    metadata: PaginationMetadata
+
+
 class CreateEventResponse(BaseModel):
     id: UUID
 
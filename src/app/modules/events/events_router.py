@@ -1,22 +1,28 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import APIRouter, Depends, Path, Form, File, UploadFile, HTTPException, status
-from typing import Annotated, List
+from fastapi import APIRouter, Depends, Path, Query, Form, File, UploadFile, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Annotated, List, Literal
 from uuid import UUID
+from datetime import datetime
 
-from src.app.db.db import get_db 
+from src.app.core.responses import FastJSONResponse
+from src.app.db.db import get_db, get_read_db, read_sessionmaker
 from src.app.modules.auth.guards import require_roles
+from src.app.modules.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 from src.app.modules.users.users_model import User
 
 from src.app.modules.users.user_role_enum import RoleEnum
 
-from .events_dto import CreateEventDto
+from .events_dto import CreateEventDto, EventFiltersDto
+from .event_status_enum import EventStatusEnum
 
 from . import events_service as events_svc
+from . import events_cache
 from .events_model import Event
 
-from .events_responses import ListEvenstResponse, EventDetailResponse, CreateEventResponse, DeleteEventResponse
+from .events_responses import ListEvenstResponse, EventDetailResponse, ListEventAttendeesResponse, CreateEventResponse, DeleteEventResponse
 
 
 
@@ -28,22 +34,89 @@ router = APIRouter(prefix="/events", tags=["events"])
 
 @router.get("/list", response_model=ListEvenstResponse)
 async def read_root(
+    request: Request,
     # user: User = Depends(require_roles(RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    cursor: Annotated[Optional[str], Query(description="Cursor returned as metadata.next_cursor by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of events to return")] = DEFAULT_PAGE_SIZE,
+    country: Annotated[Optional[str], Query(description="Only events in this country")] = None,
+    city: Annotated[Optional[str], Query(description="Only events in this city")] = None,
+    event_status: Annotated[Optional[EventStatusEnum], Query(alias="status", description="Only events with this status")] = None,
+    start_after: Annotated[Optional[datetime], Query(description="Only events starting at or after this date (ISO 8601)")] = None,
+    start_before: Annotated[Optional[datetime], Query(description="Only events starting before this date (ISO 8601)")] = None,
+    upcoming: Annotated[bool, Query(description="Only incoming events that have not started yet, soonest first")] = False,
 ):
-    res = await events_svc.list_events(db)
-    return res
+    filters = EventFiltersDto(
+        country=country,
+        city=city,
+        status=event_status,
+        start_after=start_after,
+        start_before=start_before,
+        upcoming=upcoming,
+    )
+    entry = await events_cache.cached(
+        events_cache.list_cache,
+        (cursor, limit, filters.model_dump_json()),
+        lambda: events_svc.list_events(db, cursor, limit, filters),
+        replica=db.replica,
+    )
+    return events_cache.conditional_response(request, entry)
+
+
+@router.get("/search", response_model=ListEvenstResponse)
+async def search_events(
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Search terms, web search syntax (\"quoted phrase\", -excluded, or)")],
+    db: AsyncSession = Depends(get_read_db),
+    cursor: Annotated[Optional[str], Query(description="Cursor returned as metadata.next_cursor by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of events to return")] = DEFAULT_PAGE_SIZE,
+):
+    res = await events_svc.search_events(db, q, cursor, limit)
+    return FastJSONResponse(res)
 
 
 @router.get("/retrieve/{event_id}", response_model=EventDetailResponse)
 async def read_user(
+    request: Request,
     # user_id: Annotated[UUID, Path(title="User ID", description="UUID of the user")],
     event_id: Annotated[UUID, Path(title="Event ID", description="UUID of the event")],
     user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    res = await events_svc.retrieve_by_id(event_id, db)
-    return res
+    entry = await events_cache.cached(
+        events_cache.detail_cache,
+        event_id,
+        lambda: events_svc.retrieve_by_id(event_id, db),
+        replica=db.replica,
+    )
+    return events_cache.conditional_response(request, entry, private=True)
+
+@router.get("/{event_id}/attendees", response_model=ListEventAttendeesResponse)
+async def read_event_attendees(
+    event_id: Annotated[UUID, Path(title="Event ID", description="UUID of the event")],
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+    cursor: Annotated[Optional[str], Query(description="Cursor returned as metadata.next_cursor by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of attendees to return")] = DEFAULT_PAGE_SIZE,
+):
+    res = await events_svc.list_event_attendees(event_id, db, cursor, limit)
+    return FastJSONResponse(res)
+
+@router.get("/{event_id}/attendees/export")
+async def export_event_attendees(
+    event_id: Annotated[UUID, Path(title="Event ID", description="UUID of the event")],
+    request: Request,
+    export_format: Annotated[Literal["csv", "ndjson"], Query(alias="format", description="Export format")] = "csv",
+    user: User = Depends(require_roles(RoleEnum.USER, RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
+    db: AsyncSession = Depends(get_read_db),
+):
+    await events_svc.ensure_can_manage(event_id, user, db)
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        events_svc.export_attendees(event_id, export_format, read_sessionmaker(request)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="event-{event_id}-attendees.{export_format}"'},
+    )
 
 @router.post("/create", response_model=CreateEventResponse)
 async def create_event(
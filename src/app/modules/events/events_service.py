@@ -1,4 +1,8 @@
+import csv
+import io
+import json
 import random
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status, UploadFile
@@ -6,109 +10,154 @@ from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError  
-from sqlalchemy.orm import joinedload
-from sqlalchemy import func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, Float, and_
 
-from .events_model import Event
+from src.app.db.db import AsyncSessionLocal
+
+from .events_model import Event, SEARCH_CONFIG
 from .event_attendees_model import EventAttendee
 from src.app.modules.users.users_model import User
 
-from .events_dto import CreateEventDto
+from .events_dto import CreateEventDto, EventFiltersDto
+from .events_cache import invalidate_events
+from .events_projection import event_list_query, row_key, event_base_dict
 from .event_role_enum import EventRoleEnum
+from .event_status_enum import EventStatusEnum
 
 
 
-from src.app.modules.common.metadata_schema import PaginationMetadata
+from src.app.modules.common.pagination import DEFAULT_PAGE_SIZE, apply_keyset, split_page, page_metadata
 from .events_responses import (
-    ListEvenstResponse,
     EventDetailResponse,
-    EventBaseResponse,
     CreateEventResponse,
     DeleteEventResponse,
     AttendeeHost,
-    AttendeeDetail
 )
 
-async def list_events(db: AsyncSession) -> ListEvenstResponse:
+EXPORT_BATCH_SIZE = 1000
+
+# spreadsheets evaluate a cell starting with one of these as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def csv_cell(value: str) -> str:
     """
-    List all events.
+    Escapes a user-provided value for the CSV export (formula injection): a leading
+    formula character gets a "'" in front, so the cell is shown as text.
     """
+    return f"'{value}" if value and value.startswith(CSV_FORMULA_PREFIXES) else value
 
-    result = await db.execute(select(Event).order_by(Event.created_at.desc()))
 
-    events = result.scalars().all()
+def list_events_order(filters: EventFiltersDto) -> str:
+    """
+    Name of the /events/list ordering used for `filters`; it is written into the cursors,
+    so a cursor from one ordering gets a 400 under the other instead of seeking on the wrong column.
+    """
+    return "start_date" if filters.by_start_date else "created_at"
 
-    if not events:
-        return ListEvenstResponse(
-            events=[], 
-            metadata=PaginationMetadata(
-                items_per_page=0,
-                total_items=0,
-                current_page=1,
-                total_pages=1
-            )
-        )        
-    
-    event_ids = [e.id for e in events]
 
-    # Count attendees/speakers grouped by (event_id, role)
-    counts_result = await db.execute(
-        select(
-            EventAttendee.event_id,
-            EventAttendee.event_role,
-            func.count().label("count")
-        ).where(
-            EventAttendee.event_id.in_(event_ids),
-            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
-        ).group_by(EventAttendee.event_id, EventAttendee.event_role)
-    )
+def list_events_query(filters: EventFiltersDto, cursor: Optional[str], limit: int):
+    """
+    Builds the /events/list statement. Each filter combination is served by an index
+    that ends in the sort key, so the keyset seek never needs a sequential scan:
+    date filters and upcoming mode page by (start_date, id) ascending,
+    everything else by (created_at, id) descending.
+    """
+    query = event_list_query()
+
+    if filters.country is not None:
+        query = query.where(Event.country == filters.country)
+    if filters.city is not None:
+        query = query.where(Event.city == filters.city)
+    if filters.status is not None:
+        query = query.where(Event.status == filters.status)
+    if filters.upcoming:
+        query = query.where(Event.status == EventStatusEnum.INCOMING, Event.start_date >= func.now())
+    if filters.start_after is not None:
+        query = query.where(Event.start_date >= filters.start_after)
+    if filters.start_before is not None:
+        query = query.where(Event.start_date < filters.start_before)
+
+    order = list_events_order(filters)
+    if filters.by_start_date:
+        return apply_keyset(query, (Event.start_date, Event.id), cursor, limit, descending=False, order=order)
+
+    return apply_keyset(query, (Event.created_at, Event.id), cursor, limit, order=order)
+
+
+async def list_events(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    filters: Optional[EventFiltersDto] = None,
+) -> dict:
+    """
+    List events one keyset page at a time, newest first unless filtering by date.
+    Returns a ListEvenstResponse-shaped dict, rendered to JSON without validation.
+    """
+    filters = filters or EventFiltersDto()
+
+    result = await db.execute(list_events_query(filters, cursor, limit))
 
-    counts_map = {}
-    for event_id, role, count in counts_result.all():
-        if event_id not in counts_map:
-            counts_map[event_id] = {EventRoleEnum.ATTENDEE: 0, EventRoleEnum.SPEAKER: 0}
-        counts_map[event_id][role] = count
-
-    return ListEvenstResponse(
-        events=[EventBaseResponse(
-            id=e.id,
-            title=e.title,
-            subtitle=e.subtitle,
-            image=e.image,
-            country=e.country,
-            city=e.city,
-            address=e.address,
-            start_date=e.start_date,
-            end_date=e.end_date,
-            website=e.website,
-            attendees_capacity=e.attendees_capacity,
-            attendees=counts_map.get(e.id, {}).get(EventRoleEnum.ATTENDEE, 0),
-            speakers=counts_map.get(e.id, {}).get(EventRoleEnum.SPEAKER, 0),
-            created_at=e.created_at,
-            status=e.status
-        ) for e in events],
-        metadata=PaginationMetadata(
-            items_per_page=len(events),
-            total_items=len(events),
-            current_page=1,
-            total_pages=1
+    key = (lambda r: (r.start_date, r.id)) if filters.by_start_date else row_key
+    rows, next_cursor = split_page(result.all(), limit, key, order=list_events_order(filters))
+
+    return {
+        "events": [event_base_dict(r) for r in rows],
+        "metadata": page_metadata(next_cursor).model_dump(),
+    }
+
+async def search_events(db: AsyncSession, q: str, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> dict:
+    """
+    Full-text search over title, subtitle, city and description, best matches first.
+    Matches come from the GIN index on search_vector; pages are keyset on (rank, id).
+    Returns a ListEvenstResponse-shaped dict.
+    """
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Event.search_vector, ts_query, type_=Float)
+
+    result = await db.execute(
+        apply_keyset(
+            event_list_query()
+            .add_columns(rank.label("rank"))
+            .where(Event.search_vector.bool_op("@@")(ts_query)),
+            (rank, Event.id),
+            cursor,
+            limit,
         )
     )
 
+    rows, next_cursor = split_page(result.all(), limit, lambda r: (r.rank, r.id))
+
+    return {
+        "events": [event_base_dict(r) for r in rows],
+        "metadata": page_metadata(next_cursor).model_dump(),
+    }
+
 async def retrieve_by_id(event_id: UUID, db: AsyncSession) -> EventDetailResponse:
     """
-    Retrieve an event by its ID.
+    Retrieve an event by its ID, together with its host, in a single round trip.
+    Attendees are served separately by list_event_attendees.
     """
     result = await db.execute(
-        select(Event)
-        .options(
-            selectinload(Event.attendees)
-            .selectinload(EventAttendee.user),
+        event_list_query()
+        .add_columns(
+            Event.description,
+            User.id.label("host_id"),
+            User.first_name.label("host_first_name"),
+            User.last_name.label("host_last_name"),
+            User.email.label("host_email"),
+            User.pfp.label("host_pfp"),
+        )
+        .outerjoin(
+            EventAttendee,
+            and_(EventAttendee.event_id == Event.id, EventAttendee.event_role == EventRoleEnum.ORGANIZER)
         )
+        .outerjoin(User, User.id == EventAttendee.user_id)
         .where(Event.id == event_id)
+        .limit(1)
     )
-    event = result.scalar_one_or_none()
+    event = result.one_or_none()
 
     if not event:
         raise HTTPException(
@@ -118,18 +167,8 @@ async def retrieve_by_id(event_id: UUID, db: AsyncSession) -> EventDetailRespons
                 "code": '404__EVENT__NOT_FOUND',
             }
         )
-    
-    result2 = await db.execute(
-        select(EventAttendee)
-        .options(joinedload(EventAttendee.user))
-        .where(
-            EventAttendee.event_id == event.id,
-            EventAttendee.event_role == EventRoleEnum.ORGANIZER
-        )
-    )
-    host = result2.scalar_one_or_none()
 
-    if not host:
+    if event.host_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -137,56 +176,148 @@ async def retrieve_by_id(event_id: UUID, db: AsyncSession) -> EventDetailRespons
                 "code": '404__EVENT__HOST__NOT_FOUND',
             }
         )
-    
 
-    counts_result = await db.execute(
-        select(
-            EventAttendee.event_role,
-            func.count().label("count")
-        ).where(
-            EventAttendee.event_id == event.id,
-            EventAttendee.event_role.in_([EventRoleEnum.ATTENDEE, EventRoleEnum.SPEAKER])
-        ).group_by(EventAttendee.event_role)
+    return EventDetailResponse(
+        **event_base_dict(event),
+        description=event.description,
+        host=AttendeeHost(
+            id=event.host_id,
+            name=f"{event.host_first_name} {event.host_last_name}",
+            email=event.host_email,
+            pfp=event.host_pfp,
+        ),
     )
 
-    counts = dict(counts_result.all())
-    attendees_count = counts.get(EventRoleEnum.ATTENDEE, 0)
-    speakers_count = counts.get(EventRoleEnum.SPEAKER, 0)
+async def list_event_attendees(
+    event_id: UUID,
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> dict:
+    """
+    One page of an event's attendees, speakers and hosts, walked by user id
+    over the unique (event_id, user_id) index. Returns a ListEventAttendeesResponse-shaped dict.
+    """
+    result = await db.execute(
+        apply_keyset(
+            select(
+                User.id,
+                User.first_name,
+                User.last_name,
+                User.email,
+                User.pfp,
+                EventAttendee.event_role,
+            )
+            .join(User, User.id == EventAttendee.user_id)
+            .where(EventAttendee.event_id == event_id),
+            (EventAttendee.user_id,),
+            cursor,
+            limit,
+            descending=False,
+        )
+    )
 
-    return EventDetailResponse(
-        id=event.id,
-        title=event.title,
-        subtitle=event.subtitle,
-        description=event.description,
-        image=event.image,
-        country=event.country,
-        city=event.city,
-        address=event.address,
-        start_date=event.start_date,
-        end_date=event.end_date,
-        website=event.website,
-        attendees_capacity=event.attendees_capacity,
-        attendees_list=[
-            AttendeeDetail(
-                id=a.user.id,
-                email= a.user.email,
-                name=f"{a.user.first_name} {a.user.last_name}",
-                pfp=a.user.pfp,
-                attendee_role= a.event_role
-            ) for a in event.attendees
+    rows, next_cursor = split_page(result.all(), limit, lambda r: (r.id,))
+
+    return {
+        "attendees": [
+            {
+                "id": r.id,
+                "name": f"{r.first_name} {r.last_name}",
+                "email": r.email,
+                "pfp": r.pfp,
+                "attendee_role": r.event_role,
+            } for r in rows
         ],
-        attendees=attendees_count,
-        speakers= speakers_count,
-        host= AttendeeHost(
-            id=host.user.id,
-            name=f"{host.user.first_name} {host.user.last_name}",
-            email=host.user.email,
-            pfp=host.user.pfp,
-        ),
-        status=event.status,
-        created_at=event.created_at
+        "metadata": page_metadata(next_cursor).model_dump(),
+    }
+
+async def ensure_can_manage(event_id: UUID, user: User, db: AsyncSession) -> None:
+    """
+    Raises unless the event exists and the user is its organizer or an admin.
+    """
+    result = await db.execute(
+        select(Event.id, EventAttendee.id.label("host_entry_id"))
+        .outerjoin(
+            EventAttendee,
+            and_(
+                EventAttendee.event_id == Event.id,
+                EventAttendee.event_role == EventRoleEnum.ORGANIZER,
+                EventAttendee.user_id == user.id,
+            )
+        )
+        .where(Event.id == event_id)
+    )
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "Event not found",
+                "code": '404__EVENT__NOT_FOUND',
+            }
+        )
+
+    if row.host_entry_id is None and user.role.value not in {"ADMIN", "SUPER_ADMIN"}:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "message": "You do not have permission to manage this event.",
+                "code": '403__EVENT__MANAGE__FORBIDDEN',
+            }
+        )
+
+async def export_attendees(event_id: UUID, fmt: str, session_factory=AsyncSessionLocal) -> AsyncIterator[bytes]:
+    """
+    Streams an event's attendees as CSV or NDJSON from a server-side cursor,
+    EXPORT_BATCH_SIZE rows at a time, so memory does not grow with the event.
+
+    Runs on its own session from `session_factory` (a replica when available):
+    the request's session is closed before the body is streamed.
+    """
+    stmt = (
+        select(
+            User.id,
+            User.first_name,
+            User.last_name,
+            User.email,
+            EventAttendee.event_role,
+        )
+        .join(User, User.id == EventAttendee.user_id)
+        .where(EventAttendee.event_id == event_id)
+        .order_by(EventAttendee.user_id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
 
+    if fmt == "csv":
+        yield "id,first_name,last_name,email,role\r\n".encode()
+
+    async with session_factory() as session:
+        result = await session.stream(stmt)
+
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+
+            if fmt == "csv":
+                writer = csv.writer(buffer)
+                writer.writerows(
+                    (r.id, csv_cell(r.first_name), csv_cell(r.last_name), csv_cell(r.email), r.event_role.value)
+                    for r in rows
+                )
+            else:
+                for r in rows:
+                    buffer.write(json.dumps({
+                        "id": str(r.id),
+                        "first_name": r.first_name,
+                        "last_name": r.last_name,
+                        "email": r.email,
+                        "role": r.event_role.value,
+                    }, ensure_ascii=False))
+                    buffer.write("\n")
+
+            yield buffer.getvalue().encode()
+
 async def create_event(dto: CreateEventDto, image: UploadFile, user: User, db: AsyncSession) -> CreateEventResponse:
     """
     Create a new event.
@@ -223,6 +354,7 @@ async def create_event(dto: CreateEventDto, image: UploadFile, user: User, db: A
 
         # commit 
         await db.commit()
+        invalidate_events()
 
         return CreateEventResponse(id=new_event.id)
 
@@ -274,6 +406,7 @@ async def delete(event_id: UUID, user: User, db: AsyncSession) -> DeleteEventRes
     try:
         await db.delete(event)
         await db.commit()
+        invalidate_events(event_id)
         return DeleteEventResponse(message="Event deleted successfully.", id=event_id)
     except SQLAlchemyError as e:
         await db.rollback()
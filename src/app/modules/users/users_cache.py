@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.app.core.cache import TTLCache
+from src.app.core.metrics import register_cache
+from src.app.core.config import settings
+
+from .user_role_enum import RoleEnum
+from .users_model import User
+
+
+@dataclass(frozen=True)
+class RequestUser:
+    """
+    Detached snapshot of the user fields that guards and handlers read.
+    Safe to share between requests, unlike an ORM instance bound to a session.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    pfp: str
+    role: RoleEnum
+    created_at: datetime
+
+
+REQUEST_USER_COLUMNS = (
+    User.id,
+    User.first_name,
+    User.last_name,
+    User.email,
+    User.pfp,
+    User.role,
+    User.created_at,
+)
+
+# keyed by str(user id), the JWT "sub"
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL_SECONDS)
+register_cache("users", user_cache)
+
+
+def get_cached_user(user_id: str) -> Optional[RequestUser]:
+    return user_cache.get(user_id)
+
+
+def cache_user(row) -> RequestUser:
+    user = RequestUser(
+        id=row.id,
+        first_name=row.first_name,
+        last_name=row.last_name,
+        email=row.email,
+        pfp=row.pfp,
+        role=row.role,
+        created_at=row.created_at,
+    )
+    user_cache.set(str(user.id), user)
+    return user
+
+
+def invalidate_user(user_id) -> None:
+    """
+    Call after any change to a user's role or profile.
+
+    Only this worker's copy is dropped: the other workers keep serving the previous role and
+    profile for up to USER_CACHE_TTL_SECONDS. No endpoint changes either today (update_user's
+    route is disabled), so in practice that bound is what applies to edits made in the database.
+    """
+    user_cache.pop(str(user_id))
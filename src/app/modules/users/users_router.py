@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, Path, Body
 from typing import Annotated, List
 from uuid import UUID
 
-from src.app.db.db import get_db 
+from src.app.db.db import get_db, get_read_db
 from src.app.modules.auth.guards import require_roles
 
 from src.app.modules.users.user_role_enum import RoleEnum
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/users", tags=["user"])
 @router.get("/list", response_model=List[UserResponse])
 async def read_root(
     user: User = Depends(require_roles(RoleEnum.ADMIN, RoleEnum.SUPER_ADMIN)),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     users = await user_svc.list_users(db)
     return users
@@ -41,7 +41,7 @@ async def read_root(
 @router.get("/retrieve/{user_id}", response_model=UserResponse)
 async def read_user(
     user_id: Annotated[UUID, Path(title="User ID", description="UUID of the user")],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     user = await user_svc.retrieve_by_id(db, user_id)
     return user
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.app.modules.users.users_model import User
+from src.app.modules.users.users_cache import invalidate_user
 
 from .user_reponses import UsernameAvailableResponse, UserResponse
 from .user_dto import UpdateUserDto
@@ -64,6 +65,7 @@ async def update_user(user_id: UUID, dto: UpdateUserDto, db: AsyncSession):
     user.username = dto.username
 
     await db.commit()
+    invalidate_user(user_id)
     await db.refresh(user)
     return user
 
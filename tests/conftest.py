@@ -0,0 +1,125 @@
+"""
+Tests run against a real Postgres, configured like the app (DB_* in the environment or
+.env) but on the database `<DB_NAME>_test` (or TEST_DB_NAME). It is recreated, migrated
+and seeded once per session; when the server can't be reached the tests are skipped.
+"""
+import os
+import uuid
+from pathlib import Path
+
+from src.app.core.config import settings
+
+# before the engine is created (on import of db.py): never touch the configured database
+settings.DB_NAME = os.environ.get("TEST_DB_NAME", f"{settings.DB_NAME}_test")
+settings.RATE_LIMIT_ENABLED = False
+
+import asyncpg
+import httpx
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import delete, insert, select, text
+
+import src.app.db.base  # noqa: F401, models must be registered before db.py is imported
+from src.app.db.db import AsyncSessionLocal, connect_args, engine
+from src.app.db.init_db import seed_data, seed_email
+from src.app.core.security import create_access_token
+from src.app.main import app
+from src.app.modules.events import events_cache
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.users.users_model import User
+
+ALEMBIC_INI = Path(__file__).parent.parent / "alembic.ini"
+
+# enough rows for the planner to prefer the indexes, as it would in production
+SEED = dict(users=2_000, events=20_000, attendees_per_event=5, speakers_per_event=1, prefix="test")
+
+
+async def recreate_database() -> None:
+    try:
+        conn = await asyncpg.connect(
+            host=settings.DB_HOST, port=int(settings.DB_PORT), user=settings.DB_USER,
+            password=settings.DB_PASSWORD, database="postgres", ssl=connect_args.get("ssl"), timeout=5,
+        )
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Postgres not reachable at {settings.DB_HOST}:{settings.DB_PORT}: {e}")
+
+    try:
+        await conn.execute(f'DROP DATABASE IF EXISTS "{settings.DB_NAME}" WITH (FORCE)')
+        await conn.execute(f'CREATE DATABASE "{settings.DB_NAME}"')
+    finally:
+        await conn.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def database():
+    await recreate_database()
+    command.upgrade(Config(str(ALEMBIC_INI)), "head")
+
+    async with AsyncSessionLocal() as session:
+        await seed_data(session, **SEED)
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(database):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def user_id(database) -> uuid.UUID:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(User.id).where(User.email == seed_email(SEED["prefix"], 0)))
+
+
+def bearer(user_id) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+@pytest.fixture
+def auth_headers(user_id) -> dict:
+    return bearer(user_id)
+
+
+@pytest_asyncio.fixture
+async def organizer_headers(database) -> dict:
+    """
+    Headers of the seeded user that organizes `new_event`.
+    """
+    async with AsyncSessionLocal() as db:
+        return bearer(await db.scalar(select(User.id).where(User.email == seed_email(SEED["prefix"], 1))))
+
+
+@pytest_asyncio.fixture
+async def new_event(database):
+    """
+    A fresh upcoming event with 10 seats, organized by a seeded user other than `user_id`
+    and without registrations, deleted after the test.
+    """
+    event_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        organizer_id = await db.scalar(select(User.id).where(User.email == seed_email(SEED["prefix"], 1)))
+        await db.execute(insert(Event).values(
+            id=event_id, title="Test event", subtitle="test", description="test", image="",
+            country="Perú", city="Lima", address="-", attendees_capacity=10,
+            start_date=text("now() + interval '7 days'"), end_date=text("now() + interval '8 days'"),
+        ))
+        await db.execute(insert(EventAttendee).values(
+            event_id=event_id, user_id=organizer_id, event_role=EventRoleEnum.ORGANIZER
+        ))
+        await db.commit()
+
+    yield event_id
+
+    events_cache.invalidate_events(event_id)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Event).where(Event.id == event_id))
+        await db.commit()
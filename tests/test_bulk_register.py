@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.db.init_db import seed_email
+from src.app.modules.event_actions import event_actions_service
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.events_model import Event
+from src.app.modules.events.events_service import ensure_can_manage
+from src.app.modules.users.users_model import User
+
+from .conftest import SEED, bearer
+
+
+def emails(start: int, n: int):
+    return [seed_email(SEED["prefix"], i) for i in range(start, start + n)]
+
+
+async def registrations(event_id):
+    async with AsyncSessionLocal() as db:
+        counts = (await db.execute(
+            select(Event.attendees_count, Event.speakers_count).where(Event.id == event_id)
+        )).one()
+        rows = dict((await db.execute(
+            select(EventAttendee.event_role, func.count())
+            .where(EventAttendee.event_id == event_id)
+            .group_by(EventAttendee.event_role)
+        )).all())
+    return counts, rows
+
+
+async def test_bulk_register_fills_remaining_seats(client, organizer_headers, new_event):
+    attendees = emails(10, 12)  # new_event has 10 seats
+    body = [
+        *({"email": email} for email in attendees),
+        {"email": seed_email(SEED["prefix"], 30), "role": "SPEAKER"},
+        {"email": "nobody@example.com"},
+        {"email": attendees[0]},
+        {"email": seed_email(SEED["prefix"], 31), "role": "ORGANIZER"},
+    ]
+
+    response = await client.post(f"/event-actions/{new_event}/bulk-register", json=body, headers=organizer_headers)
+
+    assert response.status_code == 200
+    assert response.json()["registered"] == 11
+    assert [r["status"] for r in response.json()["results"]] == [
+        *["registered"] * 10, "event_full", "event_full", "registered", "user_not_found", "duplicate", "invalid_role",
+    ]
+
+    (attendees_count, speakers_count), rows = await registrations(new_event)
+    assert (attendees_count, speakers_count) == (10, 1)
+    assert rows[EventRoleEnum.ATTENDEE] == 10 and rows[EventRoleEnum.SPEAKER] == 1
+
+
+@pytest.mark.parametrize("items", [[{"email": "nobody@example.com"}], [{"email": seed_email(SEED["prefix"], 10)}]])
+async def test_bulk_register_event_deleted_meanwhile(client, organizer_headers, new_event, monkeypatch, items):
+    async def ensure_then_delete(event_id, user, db):
+        await ensure_can_manage(event_id, user, db)
+        async with AsyncSessionLocal() as other:
+            await other.execute(delete(Event).where(Event.id == event_id))
+            await other.commit()
+
+    monkeypatch.setattr(event_actions_service, "ensure_can_manage", ensure_then_delete)
+
+    response = await client.post(f"/event-actions/{new_event}/bulk-register", json=items, headers=organizer_headers)
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["code"] == "404__EVENT__NOT_FOUND"
+
+
+@pytest.mark.parametrize("round", range(5))
+async def test_bulk_and_single_registrations_race(client, organizer_headers, new_event, round):
+    users = emails(40 + round * 8, 8)
+    async with AsyncSessionLocal() as db:
+        user_ids = (await db.execute(select(User.id).where(User.email.in_(users)))).scalars().all()
+
+    bulk = client.post(
+        f"/event-actions/{new_event}/bulk-register", json=[{"email": e} for e in users], headers=organizer_headers
+    )
+    singles = [client.post(f"/event-actions/{new_event}/register", headers=bearer(uid)) for uid in user_ids]
+
+    bulk_response, *single_responses = await asyncio.gather(bulk, *singles)
+
+    assert bulk_response.status_code == 200
+    assert {r.status_code for r in single_responses} <= {201, 400}
+    assert {r["status"] for r in bulk_response.json()["results"]} <= {"registered", "already_registered"}
+
+    (attendees_count, _), rows = await registrations(new_event)
+    assert attendees_count == rows[EventRoleEnum.ATTENDEE] == 8
@@ -0,0 +1,54 @@
+import asyncio
+import uuid
+
+from sqlalchemy import insert, select, update
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_counters import adjust_counter, reconcile_counters
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.events_model import Event
+
+
+async def counters(event_id) -> tuple:
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(Event.attendees_count, Event.speakers_count).where(Event.id == event_id)
+        )).one()
+    return tuple(row)
+
+
+async def test_reconcile_repairs_drift(client, auth_headers, new_event):
+    assert (await client.post(f"/event-actions/{new_event}/register", headers=auth_headers)).status_code == 201
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Event).where(Event.id == new_event).values(attendees_count=7, speakers_count=3))
+        await db.commit()
+
+        # the seeded events are consistent, only this one is fixed
+        assert await reconcile_counters(db) == 1
+
+    assert await counters(new_event) == (1, 0)
+
+
+async def test_reconcile_keeps_registration_in_flight(user_id, new_event):
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Event).where(Event.id == new_event).values(attendees_count=5))
+        await db.commit()
+
+    async with AsyncSessionLocal() as registration:
+        # a registration that has taken the event row lock and not committed yet
+        await registration.execute(insert(EventAttendee).values(
+            id=uuid.uuid4(), event_id=new_event, user_id=user_id, event_role=EventRoleEnum.ATTENDEE
+        ))
+        await adjust_counter(registration, new_event, EventRoleEnum.ATTENDEE, 1)
+
+        async def reconcile():
+            async with AsyncSessionLocal() as db:
+                return await reconcile_counters(db, new_event)
+
+        reconciling = asyncio.create_task(reconcile())
+        await asyncio.sleep(0.2)
+        await registration.commit()
+
+    assert await reconciling == 1
+    assert await counters(new_event) == (1, 0)
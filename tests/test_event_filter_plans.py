@@ -0,0 +1,61 @@
+"""
+Every /events/list filter combination is served by its index, on the seeded
+database and with the planner's default settings: the plan of the statement built
+by list_events_query (first page and a page after a cursor) must use the expected
+index and never scan `events` sequentially.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from benchmarks.common import walk
+from src.app.modules.common.pagination import encode_cursor
+from src.app.modules.events.events_dto import EventFiltersDto
+from src.app.modules.events.event_status_enum import EventStatusEnum
+from src.app.modules.events.events_service import list_events_order, list_events_query
+
+NOW = datetime.now(timezone.utc)
+NEXT_MONTH = NOW + timedelta(days=30)
+
+# filters (on values the seed generates) -> index the plan must use; the seed puts every city
+# in one country, so for country + city both indexes are as selective and either may be picked
+CASES = {
+    "no filters": (EventFiltersDto(), "ix_events_created_at_id"),
+    "country": (EventFiltersDto(country="Perú"), "ix_events_country_created_at_id"),
+    "city": (EventFiltersDto(city="Lima"), "ix_events_city_created_at_id"),
+    "country + city": (
+        EventFiltersDto(country="Perú", city="Lima"), ("ix_events_city_created_at_id", "ix_events_country_created_at_id")
+    ),
+    "status": (EventFiltersDto(status=EventStatusEnum.COMPLETED), "ix_events_status_created_at_id"),
+    "upcoming": (EventFiltersDto(upcoming=True), "ix_events_incoming_start_date_id"),
+    "upcoming + city": (EventFiltersDto(upcoming=True, city="Lima"), "ix_events_incoming_start_date_id"),
+    "start range": (EventFiltersDto(start_after=NOW, start_before=NEXT_MONTH), "ix_events_start_date_id"),
+    "start range + country": (
+        EventFiltersDto(country="Perú", start_after=NOW, start_before=NEXT_MONTH), "ix_events_start_date_id"
+    ),
+}
+
+
+async def explain(conn, stmt) -> list:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    return list(walk(result.scalar()[0]["Plan"]))
+
+
+@pytest.mark.parametrize("page", ["first page", "next page"])
+@pytest.mark.parametrize("name", list(CASES))
+async def test_list_filter_uses_index(database, name, page):
+    filters, expected = CASES[name]
+    expected = {expected} if isinstance(expected, str) else set(expected)
+    cursor = encode_cursor(NOW, uuid.uuid4(), order=list_events_order(filters)) if page == "next page" else None
+
+    async with database.connect() as conn:
+        nodes = await explain(conn, list_events_query(filters, cursor, 20))
+
+    seq_scans = [n for n in nodes if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "events"]
+    indexes = {n["Index Name"] for n in nodes if "Index Name" in n}
+
+    assert not seq_scans
+    assert indexes & expected, f"expected {' or '.join(sorted(expected))}, plan uses {sorted(indexes)}"
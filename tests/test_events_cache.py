@@ -0,0 +1,64 @@
+import asyncio
+
+from src.app.core.cache import TTLCache
+from src.app.core.config import settings
+from src.app.modules.events import events_cache
+
+
+async def test_cached_loads_once():
+    cache, calls = TTLCache(maxsize=10, ttl=60), []
+
+    async def loader():
+        calls.append(1)
+        return {"title": "Meetup"}
+
+    first = await events_cache.cached(cache, "key", loader)
+    second = await events_cache.cached(cache, "key", loader)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+async def test_load_racing_an_invalidation_is_not_cached():
+    cache = TTLCache(maxsize=10, ttl=60)
+    loading, write_committed = asyncio.Event(), asyncio.Event()
+
+    async def stale_loader():
+        loading.set()
+        await write_committed.wait()
+        return {"title": "before the write"}
+
+    read = asyncio.create_task(events_cache.cached(cache, "key", stale_loader))
+    await loading.wait()
+    events_cache.invalidate_events()
+    write_committed.set()
+
+    # the racing request still gets its result, but it is not kept for the next ones
+    assert b"before the write" in (await read).content
+    assert cache.get("key") is None
+
+    async def fresh_loader():
+        return {"title": "after the write"}
+
+    assert b"after the write" in (await events_cache.cached(cache, "key", fresh_loader)).content
+    assert cache.get("key") is not None
+
+
+async def test_replica_read_right_after_invalidation_is_not_cached(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    async def loader():
+        return {"title": "maybe before the write"}
+
+    events_cache.invalidate_events()
+    await events_cache.cached(cache, "replica", loader, replica=True)
+    await events_cache.cached(cache, "primary", loader)
+
+    assert cache.get("replica") is None
+    assert cache.get("primary") is not None
+
+    # once the replicas had READ_YOUR_WRITES_SECONDS to catch up
+    monkeypatch.setattr(events_cache, "_invalidated_at", events_cache._invalidated_at - settings.READ_YOUR_WRITES_SECONDS)
+    await events_cache.cached(cache, "replica", loader, replica=True)
+
+    assert cache.get("replica") is not None
@@ -0,0 +1,47 @@
+import csv
+import io
+import uuid
+
+import pytest
+from sqlalchemy import delete, insert
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.events_service import csv_cell, export_attendees
+from src.app.modules.users.users_model import User
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("=HYPERLINK(\"http://evil\")", "'=HYPERLINK(\"http://evil\")"),
+    ("+51 999", "'+51 999"),
+    ("-1", "'-1"),
+    ("@SUM(A1)", "'@SUM(A1)"),
+    ("\t=1", "'\t=1"),
+    ("Ana", "Ana"),
+    ("ana@example.com", "ana@example.com"),
+    ("", ""),
+])
+def test_csv_cell(value, expected):
+    assert csv_cell(value) == expected
+
+
+async def test_csv_export_escapes_formulas(new_event):
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(User).values(
+            id=user_id, email=f"{user_id}@example.com", password="-", first_name="=cmd|' /C calc'!A0", last_name="@Ruiz",
+        ))
+        await db.execute(insert(EventAttendee).values(event_id=new_event, user_id=user_id, event_role=EventRoleEnum.ATTENDEE))
+        await db.commit()
+
+    try:
+        body = b"".join([chunk async for chunk in export_attendees(new_event, "csv")]).decode()
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.id == user_id))
+            await db.commit()
+
+    rows = {row["id"]: row for row in csv.DictReader(io.StringIO(body))}
+    assert rows[str(user_id)]["first_name"] == "'=cmd|' /C calc'!A0"
+    assert rows[str(user_id)]["last_name"] == "'@Ruiz"
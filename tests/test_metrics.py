@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from src.app.core.config import settings
+
+
+@pytest.fixture
+def metrics_settings(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scraper-token")
+
+
+async def test_metrics_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+    assert (await client.get("/metrics")).status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong"}])
+async def test_metrics_require_token(client, metrics_settings, headers):
+    response = await client.get("/metrics", headers=headers)
+
+    assert response.status_code == 401
+    assert response.json()["detail"]["code"] == "401__METRICS__UNAUTHORIZED"
+
+
+async def test_metrics_labelled_by_worker(client, metrics_settings):
+    assert (await client.get("/")).status_code == 200
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scraper-token"})
+
+    assert response.status_code == 200
+    worker = f'worker="{os.getpid()}"'
+    assert f'http_requests_total{{method="GET",route="/",status="200",{worker}}}' in response.text
+    # scrapes are not counted as requests
+    assert 'route="/metrics"' not in response.text
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from src.app.modules.common.pagination import decode_cursor, encode_cursor
+from src.app.modules.event_attendees.event_attendees_service import CREATED_ORDER
+from src.app.modules.events.events_dto import EventFiltersDto
+from src.app.modules.events.events_service import list_events_order, list_events_query
+
+NOW = datetime.now(timezone.utc)
+
+
+def test_cursor_round_trip():
+    event_id = uuid.uuid4()
+    cursor = encode_cursor(NOW, event_id, order="created_at")
+
+    assert decode_cursor(cursor, datetime, uuid.UUID, order="created_at") == (NOW, event_id)
+
+
+@pytest.mark.parametrize("cursor_order, expected_order", [
+    ("created_at", "start_date"),
+    ("start_date", "created_at"),
+    (None, "created_at"),
+])
+def test_cursor_of_another_ordering_is_rejected(cursor_order, expected_order):
+    cursor = encode_cursor(NOW, uuid.uuid4(), order=cursor_order)
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, datetime, uuid.UUID, order=expected_order)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["code"] == "400__INVALID_CURSOR"
+
+
+def test_list_events_cursor_is_bound_to_its_ordering():
+    newest_first, upcoming = EventFiltersDto(), EventFiltersDto(upcoming=True)
+    cursor = encode_cursor(NOW, uuid.uuid4(), order=list_events_order(newest_first))
+
+    list_events_query(newest_first, cursor, 20)
+    with pytest.raises(HTTPException) as exc_info:
+        list_events_query(upcoming, cursor, 20)
+
+    assert exc_info.value.status_code == 400
+
+
+async def test_list_rejects_cursor_from_another_ordering(client):
+    response = await client.get("/events/list", params={"limit": 1})
+    cursor = response.json()["metadata"]["next_cursor"]
+    assert cursor
+
+    assert (await client.get("/events/list", params={"limit": 1, "cursor": cursor})).status_code == 200
+    response = await client.get("/events/list", params={"limit": 1, "cursor": cursor, "upcoming": True})
+    assert response.status_code == 400
+
+
+async def test_user_events_cursor_is_bound_to_its_listing(client, auth_headers, user_id):
+    cursor = encode_cursor(NOW, uuid.uuid4(), order=CREATED_ORDER)
+    params = {"user_id": user_id, "limit": 1, "cursor": cursor}
+
+    assert (await client.get("/user-events/created", params=params, headers=auth_headers)).status_code == 200
+    response = await client.get("/user-events/attending", params=params, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "400__INVALID_CURSOR"
+
+
+async def test_page_number_fields_are_null(client):
+    metadata = (await client.get("/events/list", params={"limit": 1})).json()["metadata"]
+
+    assert metadata["next_cursor"]
+    assert all(metadata[k] is None for k in ("items_per_page", "total_items", "current_page", "total_pages"))
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.app.core import security
+from src.app.core.config import settings
+
+
+@pytest.fixture
+def one_slot(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 1)
+    release = threading.Event()
+    yield release
+    release.set()
+
+
+async def wait_for_free_slot():
+    while security._hash_pending:
+        await asyncio.sleep(0.01)
+
+
+async def test_busy_when_queue_full(one_slot):
+    running = asyncio.create_task(security._run_hashing(one_slot.wait))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(HTTPException) as error:
+        await security._run_hashing(lambda: "hashed")
+
+    assert error.value.status_code == 503
+    assert error.value.detail["code"] == "503__AUTH__BUSY"
+    one_slot.set()
+    await running
+    assert await security._run_hashing(lambda: "hashed") == "hashed"
+
+
+async def test_timed_out_call_keeps_its_slot(one_slot, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TIMEOUT_SECONDS", 0.05)
+
+    with pytest.raises(HTTPException) as error:
+        await security._run_hashing(one_slot.wait)
+    assert error.value.status_code == 503
+
+    # still running on its thread
+    with pytest.raises(HTTPException):
+        await security._run_hashing(lambda: "hashed")
+
+    one_slot.set()
+    await wait_for_free_slot()
+    assert await security._run_hashing(lambda: "hashed") == "hashed"
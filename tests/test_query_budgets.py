@@ -0,0 +1,39 @@
+"""
+Statements a hot path may run, once the requesting user is in users_cache
+(the first request of each test puts it there).
+"""
+from src.app.db.instrumentation import assert_max_queries
+from src.app.modules.events import events_cache
+
+
+async def test_retrieve_event(client, auth_headers, new_event):
+    url = f"/events/retrieve/{new_event}"
+    assert (await client.get(url, headers=auth_headers)).status_code == 200
+    events_cache.invalidate_events(new_event)
+
+    with assert_max_queries(1):
+        response = await client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(new_event)
+
+
+async def test_retrieve_cached_event(client, auth_headers, new_event):
+    url = f"/events/retrieve/{new_event}"
+    assert (await client.get(url, headers=auth_headers)).status_code == 200
+
+    with assert_max_queries(0):
+        response = await client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+
+
+async def test_register(client, auth_headers, new_event):
+    assert (await client.get(f"/events/retrieve/{new_event}", headers=auth_headers)).status_code == 200
+
+    with assert_max_queries(1):
+        response = await client.post(f"/event-actions/{new_event}/register", headers=auth_headers)
+
+    assert response.status_code == 201
+    retrieved = await client.get(f"/events/retrieve/{new_event}", headers=auth_headers)
+    assert retrieved.json()["attendees"] == 1
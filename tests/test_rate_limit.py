@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from src.app.core.config import RateLimitRule, settings
+from src.app.core.rate_limit import MemoryBackend, RateLimitMiddleware, SQLiteBackend
+
+
+async def echo(scope, receive, send):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def limited(*rules: RateLimitRule) -> httpx.AsyncClient:
+    app = RateLimitMiddleware(echo, rules=list(rules), backend=MemoryBackend(maxsize=100))
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+
+
+def login_rule(key: str, burst: int) -> RateLimitRule:
+    return RateLimitRule(method="POST", path="/auth/login", key=key, per_minute=1, burst=burst)
+
+
+async def test_too_many_requests():
+    async with limited(login_rule("ip", 2)) as client:
+        statuses = [(await client.post("/auth/login")).status_code for _ in range(2)]
+        response = await client.post("/auth/login")
+
+    assert statuses == [200, 200]
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "60"
+    assert response.json()["detail"]["code"] == "429__RATE_LIMITED"
+
+
+async def test_denied_requests_spend_nothing():
+    async with limited(login_rule("ip", 3), login_rule("email", 1)) as client:
+        assert (await client.post("/auth/login", json={"email": "a@example.com"})).status_code == 200
+        for _ in range(5):
+            assert (await client.post("/auth/login", json={"email": "a@example.com"})).status_code == 429
+
+        # the ip bucket only paid for the allowed request
+        assert (await client.post("/auth/login", json={"email": "b@example.com"})).status_code == 200
+        assert (await client.post("/auth/login", json={"email": "c@example.com"})).status_code == 200
+        assert (await client.post("/auth/login", json={"email": "d@example.com"})).status_code == 429
+
+
+async def test_email_key_from_replayed_body():
+    async with limited(login_rule("email", 1)) as client:
+        body = b'{"email": " A@Example.com ", "password": "x"}'
+        response = await client.post("/auth/login", content=body)
+        assert response.content == body
+
+        same = await client.post("/auth/login", json={"email": "a@example.com"})
+        other = await client.post("/auth/login", json={"email": "b@example.com"})
+
+    assert same.status_code == 429
+    assert other.status_code == 200
+
+
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(maxsize=2)
+    for key in ("a", "b", "c"):
+        assert await backend.hit([(key, 1 / 60, 1)]) == 0
+
+    assert await backend.hit([("b", 1 / 60, 1)]) > 0
+    # evicted, starts over full
+    assert await backend.hit([("a", 1 / 60, 1)]) == 0
+
+
+async def test_sqlite_backend_shared_between_instances(tmp_path):
+    path = str(tmp_path / "rate-limit.sqlite3")
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+
+    assert await first.hit([("ip:1.2.3.4", 1 / 60, 1)]) == 0
+    assert await second.hit([("ip:1.2.3.4", 1 / 60, 1)]) > 0
+    assert await second.hit([("ip:5.6.7.8", 1 / 60, 1)]) == 0
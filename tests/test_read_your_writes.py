@@ -0,0 +1,70 @@
+import itertools
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from src.app.db import db
+from src.app.db.recent_writers import MemoryRecentWriters, SQLiteRecentWriters
+
+
+@pytest.fixture
+def replica(monkeypatch, tmp_path):
+    """
+    A replica sessionmaker (on the test database itself), so routing can be observed,
+    and recent writers in a fresh SQLite file.
+    """
+    factory = sessionmaker(bind=db.engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(db, "ReplicaSessionLocals", [factory])
+    monkeypatch.setattr(db, "_next_replica", itertools.cycle([factory]))
+    monkeypatch.setattr(db, "recent_writers", SQLiteRecentWriters(str(tmp_path / "recent-writers.sqlite3")))
+    return factory
+
+
+def request_with(headers: dict) -> Request:
+    return Request({"type": "http", "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()]})
+
+
+def reads_primary(headers: dict) -> bool:
+    return db.read_sessionmaker(request_with(headers)) is db.AsyncSessionLocal
+
+
+async def test_bearer_write_then_read_without_cookie(replica, client, auth_headers, organizer_headers, new_event):
+    assert not reads_primary(auth_headers)
+
+    response = await client.post(f"/event-actions/{new_event}/register", headers=auth_headers)
+
+    assert response.status_code == 201
+    assert "set-cookie" not in response.headers
+    assert reads_primary(auth_headers)
+    # other users and anonymous clients keep reading from the replicas
+    assert not reads_primary(organizer_headers)
+    assert not reads_primary({})
+
+
+async def test_read_does_not_stick(replica, client, auth_headers):
+    assert (await client.get("/events/list", params={"limit": 1}, headers=auth_headers)).status_code == 200
+
+    assert not reads_primary(auth_headers)
+
+
+@pytest.mark.parametrize("until, wrote", [(lambda now: now + 5, True), (lambda now: now - 1, False)])
+def test_recent_writers_shared_between_workers(tmp_path, until, wrote):
+    path = str(tmp_path / "recent-writers.sqlite3")
+    writer, reader = SQLiteRecentWriters(path), SQLiteRecentWriters(path)
+
+    writer.mark("user-1", until(time.time()))
+
+    assert reader.wrote_recently("user-1") == wrote
+    assert not reader.wrote_recently("user-2")
+
+
+def test_memory_recent_writers_expire():
+    writers = MemoryRecentWriters(maxsize=10)
+    writers.mark("user-1", time.time() + 5)
+    writers.mark("user-2", time.time() - 1)
+
+    assert writers.wrote_recently("user-1")
+    assert not writers.wrote_recently("user-2")
@@ -0,0 +1,39 @@
+from sqlalchemy import select, update
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.modules.events.events_model import Event
+
+
+async def fill(event_id) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Event).where(Event.id == event_id).values(attendees_count=Event.attendees_capacity))
+        await db.commit()
+
+
+async def counters(event_id) -> tuple:
+    async with AsyncSessionLocal() as db:
+        return tuple((await db.execute(
+            select(Event.attendees_count, Event.speakers_count).where(Event.id == event_id)
+        )).one())
+
+
+async def test_register_when_full(client, auth_headers, new_event):
+    await fill(new_event)
+
+    response = await client.post(f"/event-actions/{new_event}/register", headers=auth_headers)
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["code"] == "409__EVENT__FULL"
+    assert await counters(new_event) == (10, 0)
+    # the registration row was rolled back with the seat
+    response = await client.delete(f"/event-actions/{new_event}/unregister", headers=auth_headers)
+    assert response.status_code == 404
+
+
+async def test_speaker_ignores_capacity(client, auth_headers, new_event):
+    await fill(new_event)
+
+    response = await client.post(f"/event-actions/{new_event}/register-as-speaker", headers=auth_headers)
+
+    assert response.status_code == 201
+    assert await counters(new_event) == (10, 1)
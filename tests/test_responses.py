@@ -0,0 +1,23 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+import asyncpg
+from pydantic_core import to_json
+
+from src.app.core.responses import render_json
+from src.app.modules.events.event_status_enum import EventStatusEnum
+
+
+def test_render_json_matches_pydantic_core():
+    content = {
+        "id": uuid.uuid4(),
+        # what asyncpg returns for uuid columns: a uuid.UUID subclass that orjson rejects natively
+        "host_id": asyncpg.pgproto.pgproto.UUID(str(uuid.uuid4())),
+        "start_date": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "status": EventStatusEnum.INCOMING,
+        "website": None,
+    }
+
+    assert json.loads(render_json(content)) == json.loads(to_json(content))
+    assert json.loads(render_json(content))["start_date"] == "2026-01-02T03:04:05Z"
@@ -0,0 +1,100 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert
+
+from src.app.core.revocation import RevocationList
+from src.app.core.security import create_access_token, create_refresh_token
+from src.app.db.db import AsyncSessionLocal
+from src.app.modules.auth import revocation_svc
+from src.app.modules.auth.revoked_token_model import RevokedToken
+
+
+@pytest.fixture
+def revocations(monkeypatch) -> RevocationList:
+    """
+    An empty in-process revocation list, as a worker has before its startup load.
+    """
+    revocations = RevocationList(capacity=100, error_rate=0.001)
+    monkeypatch.setattr(revocation_svc, "revocation_list", revocations)
+    monkeypatch.setattr(revocation_svc, "_last_revoked_at", None)
+    return revocations
+
+
+def test_revocation_list_is_bounded():
+    revocations = RevocationList(capacity=2, error_rate=0.001)
+    for jti in ("a", "b", "c"):
+        revocations.add(jti, time.time() + 60)
+
+    assert len(revocations) == 2
+    # kept in the filter only, still revoked
+    assert all(revocations.is_revoked(jti) for jti in ("a", "b", "c"))
+    assert not revocations.is_revoked("never revoked")
+
+
+async def test_refresh_rotates_tokens(client, user_id, revocations):
+    refresh = create_refresh_token({"sub": str(user_id)})
+
+    response = await client.post("/auth/refresh", json={"refresh_token": refresh})
+
+    assert response.status_code == 200
+    token = response.json()["token"]
+    assert token["refresh_token"] != refresh
+    session = await client.get("/auth/session", headers={"Authorization": f"Bearer {token['access_token']}"})
+    assert session.status_code == 200
+    assert (await client.post("/auth/refresh", json={"refresh_token": token["refresh_token"]})).status_code == 200
+
+
+async def test_refresh_token_reuse(client, user_id, revocations):
+    refresh = create_refresh_token({"sub": str(user_id)})
+    assert (await client.post("/auth/refresh", json={"refresh_token": refresh})).status_code == 200
+
+    response = await client.post("/auth/refresh", json={"refresh_token": refresh})
+
+    assert response.status_code == 401
+    assert response.json()["detail"]["code"] == "401__AUTH__REFRESH_TOKEN_REUSED"
+    # caught by revoked_tokens, refresh ids are not kept in process
+    assert len(revocations) == 0
+
+
+async def test_logout_revokes_tokens(client, user_id, revocations):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+    refresh = create_refresh_token({"sub": str(user_id)})
+
+    assert (await client.post("/auth/logout", json={"refresh_token": refresh}, headers=headers)).status_code == 200
+
+    assert (await client.get("/auth/session", headers=headers)).status_code == 401
+    response = await client.post("/auth/refresh", json={"refresh_token": refresh})
+    assert response.json()["detail"]["code"] == "401__AUTH__REFRESH_TOKEN_REUSED"
+    assert len(revocations) == 1
+
+
+async def revoke(jti: str, expires_in: timedelta, revoked_ago: timedelta = timedelta(0)) -> None:
+    now = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(RevokedToken).values(jti=jti, expires_at=now + expires_in, revoked_at=now - revoked_ago))
+        await db.commit()
+
+
+async def test_startup_load_and_incremental_sync(database, revocations, monkeypatch):
+    access, refresh, expired, later = (uuid.uuid4().hex for _ in range(4))
+    await revoke(access, timedelta(minutes=10), revoked_ago=timedelta(hours=1))
+    await revoke(refresh, timedelta(days=20), revoked_ago=timedelta(hours=1))
+    await revoke(expired, timedelta(minutes=-1), revoked_ago=timedelta(hours=1))
+
+    await revocation_svc.load_revocations()
+
+    assert revocation_svc.is_revoked(access)
+    assert not revocation_svc.is_revoked(refresh)
+    assert not revocation_svc.is_revoked(expired)
+
+    # a sync only reads what was revoked since the previous one
+    monkeypatch.setattr(revocation_svc, "revocation_list", RevocationList(capacity=100, error_rate=0.001))
+    await revoke(later, timedelta(minutes=10))
+    async with AsyncSessionLocal() as db:
+        await revocation_svc.sync_revocations(db)
+
+    assert revocation_svc.is_revoked(later)
+    assert not revocation_svc.is_revoked(access)
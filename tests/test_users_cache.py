@@ -0,0 +1,31 @@
+from sqlalchemy import select, update
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.modules.users.users_cache import get_cached_user, invalidate_user
+from src.app.modules.users.users_model import User
+
+
+async def set_first_name(user_id, first_name: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(User).where(User.id == user_id).values(first_name=first_name))
+        await db.commit()
+
+
+async def test_cached_user_reread_after_invalidation(client, auth_headers, user_id):
+    async with AsyncSessionLocal() as db:
+        first_name = await db.scalar(select(User.first_name).where(User.id == user_id))
+
+    assert (await client.get("/auth/session", headers=auth_headers)).status_code == 200
+    assert get_cached_user(str(user_id)) is not None
+
+    await set_first_name(user_id, "Renamed")
+    try:
+        # served from the cache until invalidated
+        assert (await client.get("/auth/session", headers=auth_headers)).json()["user"]["name"].startswith(first_name)
+
+        invalidate_user(user_id)
+
+        assert (await client.get("/auth/session", headers=auth_headers)).json()["user"]["name"].startswith("Renamed ")
+    finally:
+        await set_first_name(user_id, first_name)
+        invalidate_user(user_id)
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+
+from src.app.db.db import AsyncSessionLocal
+from src.app.db.init_db import seed_email
+from src.app.modules.events.event_attendees_model import EventAttendee
+from src.app.modules.events.event_role_enum import EventRoleEnum
+from src.app.modules.events.event_status_enum import EventStatusEnum
+from src.app.modules.events.events_model import Event
+from src.app.modules.users.users_model import User
+
+from .conftest import SEED, bearer
+
+
+async def seeded_headers(n: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        return bearer(await db.scalar(select(User.id).where(User.email == seed_email(SEED["prefix"], n))))
+
+
+async def set_event(event_id, **values) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Event).where(Event.id == event_id).values(**values))
+        await db.commit()
+
+
+@pytest_asyncio.fixture
+async def full_event(client, auth_headers, new_event):
+    """
+    `new_event` with its only seat taken by `user_id`.
+    """
+    assert (await client.post(f"/event-actions/{new_event}/register", headers=auth_headers)).status_code == 201
+    await set_event(new_event, attendees_capacity=1)
+    return new_event
+
+
+async def test_join_when_full(client, full_event):
+    first, second = await seeded_headers(20), await seeded_headers(21)
+
+    response = await client.post(f"/event-actions/{full_event}/waitlist", headers=first)
+    assert response.status_code == 201
+    assert response.json()["position"] == 1
+    assert (await client.post(f"/event-actions/{full_event}/waitlist", headers=second)).json()["position"] == 2
+
+    assert (await client.delete(f"/event-actions/{full_event}/waitlist", headers=first)).status_code == 200
+    response = await client.get(f"/event-actions/{full_event}/waitlist/position", headers=second)
+    assert response.json()["position"] == 1
+
+
+async def test_join_rejected_when_not_full(client, auth_headers, new_event):
+    response = await client.post(f"/event-actions/{new_event}/waitlist", headers=await seeded_headers(20))
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "400__EVENT__NOT_FULL"
+
+
+async def test_unregister_promotes_head(client, auth_headers, user_id, full_event):
+    waiting = await seeded_headers(20)
+    assert (await client.post(f"/event-actions/{full_event}/waitlist", headers=waiting)).status_code == 201
+
+    assert (await client.delete(f"/event-actions/{full_event}/unregister", headers=auth_headers)).status_code == 200
+
+    async with AsyncSessionLocal() as db:
+        attendees = (await db.scalars(select(EventAttendee.user_id).where(
+            EventAttendee.event_id == full_event, EventAttendee.event_role == EventRoleEnum.ATTENDEE
+        ))).all()
+        attendees_count = await db.scalar(select(Event.attendees_count).where(Event.id == full_event))
+    assert len(attendees) == 1 and attendees[0] != user_id
+    assert attendees_count == 1
+    response = await client.get(f"/event-actions/{full_event}/waitlist/position", headers=waiting)
+    assert response.status_code == 404
+
+
+async def test_completed_event_does_not_promote(client, auth_headers, full_event):
+    waiting = await seeded_headers(20)
+    assert (await client.post(f"/event-actions/{full_event}/waitlist", headers=waiting)).status_code == 201
+    await set_event(full_event, status=EventStatusEnum.COMPLETED)
+
+    assert (await client.delete(f"/event-actions/{full_event}/unregister", headers=auth_headers)).status_code == 200
+
+    response = await client.get(f"/event-actions/{full_event}/waitlist/position", headers=waiting)
+    assert response.json()["position"] == 1
+
+
+async def test_join_waits_for_unregister_in_flight(client, full_event):
+    async with AsyncSessionLocal() as unregister:
+        # an unregister holding the event row lock, with the seat freed but not committed yet
+        await unregister.execute(
+            select(Event.id).where(Event.id == full_event).with_for_update(key_share=True)
+        )
+        await unregister.execute(
+            update(Event).where(Event.id == full_event).values(attendees_count=Event.attendees_count - 1)
+        )
+
+        join = asyncio.create_task(
+            client.post(f"/event-actions/{full_event}/waitlist", headers=await seeded_headers(20))
+        )
+        await asyncio.sleep(0.2)
+        await unregister.commit()
+
+    response = await join
+    # nobody is queued behind the free seat
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "400__EVENT__NOT_FULL"